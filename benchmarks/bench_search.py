@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Compare ILIKE substring search with the indexed full-text search on `games`.
+
+Seeds synthetic games until the table holds ``--rows`` rows, then times both
+query paths against the database configured through the usual POSTGRES_*
+environment variables. Run against a disposable database:
+
+    POSTGRES_USER=... POSTGRES_PASSWORD=... POSTGRES_DB=... \\
+        python benchmarks/bench_search.py --rows 500000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from games_rule_core.postgres.models.models import Game
+from games_rule_core.postgres.reader.reader import PostgresReader
+from games_rule_core.postgres.reader.search import game_search
+from games_rule_core.postgres.session import (
+    dispose_engines,
+    get_engine,
+    get_session_maker,
+)
+from sqlalchemy import text
+
+# Common theme words plus a long tail of synthetic tokens ("tok123") so term
+# selectivity resembles a real catalogue rather than every row matching
+WORDS: List[str] = [
+    "dragon",
+    "castle",
+    "trade",
+    "robber",
+    "harbor",
+    "empire",
+    "farm",
+    "train",
+    "space",
+    "pirate",
+    "wizard",
+    "forest",
+    "market",
+    "island",
+    "dungeon",
+    "city",
+]
+VOCABULARY: int = 20_000
+
+# Builds random names and descriptions server-side so seeding 500k rows is fast
+SEED_SQL: str = """
+INSERT INTO games (name, description, designer, publisher, min_players, max_players)
+SELECT
+  initcap(w[1 + (i * 7) % n]) || ' ' || 'tok' || ((i * 7919) % :vocab) || ' ' || i,
+  'A game of ' || w[1 + (i * 3) % n] || ' and tok' || ((i * 104729) % :vocab) ||
+    ' where players tok' || ((i * 1299709) % :vocab) || ' the tok' || ((i * 15485863) % :vocab),
+  'Designer ' || (i % 997),
+  'Publisher ' || (i % 211),
+  1 + i % 3,
+  4 + i % 3
+FROM generate_series(CAST(:start AS BIGINT), CAST(:stop AS BIGINT)) AS i,
+     LATERAL (SELECT CAST(:words AS TEXT[]) AS w, CAST(:n AS INTEGER) AS n) AS vocab
+"""
+
+
+async def seed(rows: int) -> None:
+    async with get_engine().begin() as conn:
+        existing: int = (
+            await conn.execute(text("SELECT count(*) FROM games"))
+        ).scalar_one()
+        if existing < rows:
+            print(f"seeding {rows - existing} games")
+            await conn.execute(
+                text(SEED_SQL),
+                {
+                    "start": existing,
+                    "stop": rows - 1,
+                    "words": WORDS,
+                    "n": len(WORDS),
+                    "vocab": VOCABULARY,
+                },
+            )
+            await conn.execute(text("ANALYZE games"))
+
+
+async def time_query(
+    run: Callable[[str], Awaitable[Any]], terms: List[str], repeat: int
+) -> Dict[str, float]:
+    timings: List[float] = []
+    for _ in range(repeat):
+        for term in terms:
+            start: float = time.perf_counter()
+            await run(term)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+        "max_ms": round(timings[-1], 3),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--fuzzy", action="store_true", help="needs pg_trgm")
+    args = parser.parse_args()
+
+    # Statement echo would dominate the timings
+    get_engine().echo = False
+    await seed(args.rows)
+    terms: List[str] = ["tok4242", "castle tok17", "tok999 or tok1234", "tok31337"]
+
+    async with get_session_maker()() as session:
+        reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+        search = game_search(session)
+
+        async def ilike(term: str) -> Any:
+            return await reader.search_by_text("description", term, limit=args.limit)
+
+        async def fulltext(term: str) -> Any:
+            return await search.search(term, limit=args.limit, fuzzy=args.fuzzy)
+
+        # Warm the buffer cache so both paths are measured hot
+        await time_query(ilike, terms, 1)
+        await time_query(fulltext, terms, 1)
+        results: Dict[str, Any] = {
+            "rows": args.rows,
+            "ilike": await time_query(ilike, terms, args.repeat),
+            "fulltext": await time_query(fulltext, terms, args.repeat),
+        }
+    print(json.dumps(results, indent=2))
+    await dispose_engines()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Compare the ORM + response_model read path with the plain-row fast path.
+
+Runs the games router in-process next to copies of the previous handlers
+(ORM instances validated and serialized again through ``response_model``)
+and reports requests/sec for list pages and single-game lookups, plus the
+serialization cost of one page on its own. Uses the database configured
+through the usual POSTGRES_* environment variables:
+
+    POSTGRES_USER=... POSTGRES_PASSWORD=... POSTGRES_DB=... \\
+        python benchmarks/bench_serialization.py --requests 2000 --limit 100
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Dict, List
+
+import httpx
+from fastapi import Depends, FastAPI
+from fastapi.encoders import jsonable_encoder
+from games_rule_api.dependencies.cache import get_cache
+from games_rule_api.routers import games
+from games_rule_core.cache.cache import ReadThroughCache
+from games_rule_core.cache.reader import CachedReader
+from games_rule_core.postgres.models.models import Game
+from games_rule_core.postgres.reader.pagination import Page
+from games_rule_core.postgres.reader.reader import PostgresReader
+from games_rule_core.postgres.reader.rows import dump_page
+from games_rule_core.postgres.session import (
+    dispose_engines,
+    get_async_session,
+    get_engine,
+    get_session_maker,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+app: FastAPI = FastAPI()
+app.include_router(games.router)
+
+
+# The handlers as they were before the fast path, for comparison
+@app.get("/orm/games/", response_model=Page[Game])
+async def orm_games(
+    limit: int = 100, session: AsyncSession = Depends(get_async_session)
+) -> Page[Game]:
+    return await PostgresReader[Game](session, Game).get_page(limit=limit)
+
+
+@app.get("/orm/games/{game_id}", response_model=Game)
+async def orm_game(
+    game_id: int,
+    session: AsyncSession = Depends(get_async_session),
+    cache: ReadThroughCache = Depends(get_cache),
+) -> Game | None:
+    return await CachedReader[Game](session, Game, cache).get_by_id(game_id)
+
+
+async def requests_per_second(
+    client: httpx.AsyncClient, paths: List[str], concurrency: int
+) -> float:
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for path in paths:
+        queue.put_nowait(path)
+
+    async def worker() -> None:
+        while not queue.empty():
+            response: httpx.Response = await client.get(queue.get_nowait())
+            response.raise_for_status()
+
+    start: float = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return round(len(paths) / (time.perf_counter() - start), 1)
+
+
+async def serialization_ms(limit: int, repeat: int) -> Dict[str, float]:
+    # Same page both ways, timed without the database or HTTP in the loop
+    async with get_session_maker()() as session:
+        reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+        models: Page[Game] = await reader.get_page(limit=limit)
+        rows: Page[Dict[str, Any]] = await reader.get_rows_page(limit=limit)
+
+    start: float = time.perf_counter()
+    for _ in range(repeat):
+        # What FastAPI does with response_model: validate, dump, then json.dumps
+        validated: Page[Game] = Page[Game].model_validate(models.model_dump())
+        json.dumps(jsonable_encoder(validated)).encode()
+    orm: float = (time.perf_counter() - start) * 1000 / repeat
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        dump_page(rows)
+    fast: float = (time.perf_counter() - start) * 1000 / repeat
+    return {"orm_ms": round(orm, 3), "rows_ms": round(fast, 3)}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--limit", type=int, default=100)
+    args = parser.parse_args()
+
+    # Statement echo would dominate the timings
+    get_engine().echo = False
+    async with get_session_maker()() as session:
+        ids: List[int] = [
+            game.id
+            for game in (
+                await PostgresReader[Game](session, Game).get_page(limit=200)
+            ).items
+            if game.id is not None
+        ]
+    if not ids:
+        raise SystemExit("games table is empty; seed it first (bench_search.py)")
+    detail: List[str] = [f"/games/{ids[i % len(ids)]}" for i in range(args.requests)]
+    listing: List[str] = [f"/games/?limit={args.limit}"] * args.requests
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        # Warm pools, caches and pydantic schemas before measuring
+        await requests_per_second(client, listing[:50] + detail[:50], args.concurrency)
+        await requests_per_second(
+            client, ["/orm" + path for path in listing[:50] + detail[:50]], 4
+        )
+        results: Dict[str, Any] = {
+            "limit": args.limit,
+            "list_rps": {
+                "orm": await requests_per_second(
+                    client, ["/orm" + path for path in listing], args.concurrency
+                ),
+                "rows": await requests_per_second(client, listing, args.concurrency),
+            },
+            "detail_rps": {
+                "orm": await requests_per_second(
+                    client, ["/orm" + path for path in detail], args.concurrency
+                ),
+                "rows": await requests_per_second(client, detail, args.concurrency),
+            },
+            "serialize_page": await serialization_ms(args.limit, 200),
+        }
+    print(json.dumps(results, indent=2))
+    await dispose_engines()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Compare catalogue filtering in Postgres with the in-memory snapshot.
+
+Tops the synthetic catalogue (``dataset.py``) up to ``--games`` rows, loads a
+``CatalogueSnapshot`` and times the same filters four ways: full ``Game``
+models through ``PostgresReader.get_by_filter``, ids only from Postgres,
+and ids or slim rows from the snapshot. Counts are timed on both sides too,
+and so is a refresh after ``--touch`` games are updated.
+Run against a disposable database:
+
+    POSTGRES_USER=... POSTGRES_PASSWORD=... POSTGRES_DB=... \\
+        python benchmarks/bench_snapshot.py --games 1000000
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from dataset import ensure_games
+from games_rule_core.postgres.models.models import Game
+from games_rule_core.postgres.reader.filters import Condition, GameFilter
+from games_rule_core.postgres.reader.reader import PostgresReader
+from games_rule_core.postgres.reader.snapshot import CatalogueSnapshot
+from games_rule_core.postgres.session import (
+    dispose_engines,
+    get_engine,
+    get_session_maker,
+)
+from sqlalchemy import select, update
+from sqlmodel import col
+
+# From broad to narrow, as the catalogue filters are used
+FILTERS: List[GameFilter] = [
+    GameFilter(players=4),
+    GameFilter(players=3, max_playtime=60, types_any=["Strategy", "Family"]),
+    GameFilter(types_all=["Strategy", "Economic"], mechanics_any=["Trading"]),
+    GameFilter(age=10, min_complexity=3.5, min_year=2015),
+    GameFilter(
+        players=2,
+        mechanics_all=["Worker Placement", "Engine Building"],
+        publisher=["Publisher 7", "Publisher 42"],
+    ),
+]
+
+
+async def time_calls(
+    run: Callable[[Optional[Condition]], Awaitable[Any]], repeat: int
+) -> Dict[str, float]:
+    timings: List[float] = []
+    for _ in range(repeat):
+        for game_filter in FILTERS:
+            start: float = time.perf_counter()
+            await run(game_filter.to_condition())
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "p50_ms": round(statistics.median(timings), 3),
+        "p95_ms": round(timings[int(len(timings) * 0.95) - 1], 3),
+        "max_ms": round(timings[-1], 3),
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--touch", type=int, default=100, help="games to update")
+    args = parser.parse_args()
+
+    # Statement echo would dominate the timings
+    get_engine().echo = False
+    await ensure_games(args.games, args.seed)
+    limit: int = args.limit
+
+    async with get_session_maker()() as session:
+        reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+
+        start: float = time.perf_counter()
+        snapshot: CatalogueSnapshot = await CatalogueSnapshot.load(session)
+        load_s: float = time.perf_counter() - start
+        # Touch a few games twice, refreshing after each, so the timed
+        # refresh starts past the seeding's timestamps as it would in
+        # steady state; the transaction is rolled back at the end
+        touch = (
+            update(Game)
+            .where(col(Game.id).in_(snapshot.ids[: args.touch].tolist()))
+            .values(designer=Game.designer)
+            .execution_options(synchronize_session=False)
+        )
+        await session.execute(touch)
+        await snapshot.refresh(session)
+        await session.execute(touch)
+        start = time.perf_counter()
+        refreshed: int = await snapshot.refresh(session)
+        refresh_ms: float = (time.perf_counter() - start) * 1000
+
+        async def db_models(where: Optional[Condition]) -> Any:
+            # Skip the identity map, which would answer repeats from memory
+            session.expunge_all()
+            conditions: List[Condition] = [] if where is None else [where]
+            return await reader.get_by_filter(*conditions, limit=limit)
+
+        async def db_ids(where: Optional[Condition]) -> Any:
+            statement = select(col(Game.id)).limit(limit)
+            if where is not None:
+                statement = statement.where(where.compile(Game))
+            return (await session.execute(statement)).scalars().all()
+
+        async def db_count(where: Optional[Condition]) -> Any:
+            return await reader.count(*([] if where is None else [where]))
+
+        async def snapshot_ids(where: Optional[Condition]) -> Any:
+            return snapshot.get_ids_by_filter(
+                *([] if where is None else [where]), limit=limit
+            )
+
+        async def snapshot_rows(where: Optional[Condition]) -> Any:
+            return snapshot.get_rows_by_filter(
+                *([] if where is None else [where]), limit=limit
+            )
+
+        async def snapshot_count(where: Optional[Condition]) -> Any:
+            return snapshot.count(*([] if where is None else [where]))
+
+        paths: Dict[str, Callable[[Optional[Condition]], Awaitable[Any]]] = {
+            "db_models": db_models,
+            "db_ids": db_ids,
+            "snapshot_ids": snapshot_ids,
+            "snapshot_rows": snapshot_rows,
+            "db_count": db_count,
+            "snapshot_count": snapshot_count,
+        }
+        # Warm the buffer cache and statement caches so every path runs hot
+        for run in paths.values():
+            await time_calls(run, 1)
+        results: Dict[str, Any] = {
+            "games": len(snapshot),
+            "limit": limit,
+            "snapshot_mib": round(snapshot.nbytes / 2**20, 1),
+            "load_s": round(load_s, 2),
+            "refresh_ms": round(refresh_ms, 1),
+            "refresh_games": refreshed,
+            **{name: await time_calls(run, args.repeat) for name, run in paths.items()},
+        }
+        await session.rollback()
+    print(json.dumps(results, indent=2))
+    await dispose_engines()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
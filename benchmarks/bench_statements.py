@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Measure per-query CPU overhead of the hot PostgresReader paths.
+
+Runs the statement shapes behind ``GET /games/``, ``GET /games/search`` and
+``GET /games/{id}`` against the database configured through the usual
+POSTGRES_* environment variables, once building every statement afresh
+(``StatementCache(0)`` on SQLAlchemy's default 100-statement asyncpg cache)
+and once reusing cached statements on a connection configured like
+``session.py``. Reports process CPU time per call, which is the service's
+own overhead; the server-side execution time is not included.
+
+    POSTGRES_USER=... POSTGRES_PASSWORD=... POSTGRES_DB=... \\
+        python benchmarks/bench_statements.py --calls 5000
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict
+
+from games_rule_core.postgres.config import Settings, get_settings
+from games_rule_core.postgres.models.models import Game
+from games_rule_core.postgres.reader.filters import GameFilter
+from games_rule_core.postgres.reader.reader import PostgresReader
+from games_rule_core.postgres.reader.statements import StatementCache
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+# Filter values vary per call, as they do across requests; the shape does not
+FILTERS = [
+    GameFilter(players=players, max_playtime=playtime, types_any=["Strategy"])
+    for players in (2, 3, 4)
+    for playtime in (30, 60, 90)
+]
+
+
+async def cpu_per_call(
+    run: Callable[[int], Awaitable[Any]], calls: int
+) -> Dict[str, float]:
+    for i in range(min(calls, 200)):
+        await run(i)
+    cpu: float = time.process_time()
+    wall: float = time.perf_counter()
+    for i in range(calls):
+        await run(i)
+    return {
+        "cpu_us": round((time.process_time() - cpu) / calls * 1e6, 1),
+        "wall_us": round((time.perf_counter() - wall) / calls * 1e6, 1),
+    }
+
+
+async def measure(
+    engine: AsyncEngine, statements: StatementCache, calls: int, max_id: int
+) -> Dict[str, Dict[str, float]]:
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        reader: PostgresReader[Game] = PostgresReader[Game](
+            session, Game, statements=statements
+        )
+
+        async def row(i: int) -> Any:
+            return await reader.get_row(1 + i % max_id)
+
+        async def rows_page(i: int) -> Any:
+            return await reader.get_rows_page(limit=20)
+
+        async def filtered_page(i: int) -> Any:
+            condition = FILTERS[i % len(FILTERS)].to_condition()
+            return await reader.get_rows_page(limit=20, where=condition)
+
+        async def exists(i: int) -> Any:
+            return await reader.exists(1 + i % max_id)
+
+        async def many(i: int) -> Any:
+            return await reader.get_many(range(1 + i % max_id, 21 + i % max_id))
+
+        return {
+            "get_row": await cpu_per_call(row, calls),
+            "get_rows_page": await cpu_per_call(rows_page, calls),
+            "get_rows_page_filtered": await cpu_per_call(filtered_page, calls),
+            "exists": await cpu_per_call(exists, calls),
+            "get_many_20": await cpu_per_call(many, calls),
+        }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=5000)
+    parser.add_argument("--max-id", type=int, default=10_000)
+    args = parser.parse_args()
+
+    settings: Settings = get_settings()
+    baseline: AsyncEngine = create_async_engine(settings.database_url)
+    tuned: AsyncEngine = create_async_engine(
+        settings.database_url,
+        connect_args={
+            "prepared_statement_cache_size": (
+                settings.postgres_prepared_statement_cache_size
+            )
+        },
+    )
+    before: Dict[str, Dict[str, float]] = await measure(
+        baseline, StatementCache(0), args.calls, args.max_id
+    )
+    after: Dict[str, Dict[str, float]] = await measure(
+        tuned,
+        StatementCache(settings.postgres_statement_cache_size),
+        args.calls,
+        args.max_id,
+    )
+    print(
+        json.dumps(
+            {
+                name: {
+                    "before": before[name],
+                    "after": after[name],
+                    "cpu_saved": f"{1 - after[name]['cpu_us'] / before[name]['cpu_us']:.0%}",
+                }
+                for name in before
+            },
+            indent=2,
+        )
+    )
+    await baseline.dispose()
+    await tuned.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
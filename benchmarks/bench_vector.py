@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Measure recall and latency of the IVF vector index on CPU.
+
+Builds a throwaway index of synthetic clustered embeddings (shaped like
+rulebook chunks: a few hundred chunks per rulebook, one rulebook per game),
+trains it, then compares IVF search at several ``nprobe`` values with exact
+brute force. Recall@k is the overlap with the exact top k. Needs no
+database:
+
+    python benchmarks/bench_vector.py --rows 1000000 --queries 200
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterable, List, Sequence, Tuple
+
+import numpy as np
+from games_rule_vector.config import VectorSettings
+from games_rule_vector.embed import normalize
+from games_rule_vector.index import SearchHit, VectorIndex
+from numpy.typing import NDArray
+
+BLOCK_ROWS: int = 65_536
+CHUNKS_PER_RULEBOOK: int = 200
+
+
+def synthetic_block(
+    rng: np.random.Generator, topics: NDArray[np.float32], rows: int, noise: float
+) -> NDArray[np.float32]:
+    picked: NDArray[np.intp] = rng.integers(0, len(topics), rows)
+    block: NDArray[np.float32] = topics[picked] + rng.standard_normal(
+        (rows, topics.shape[1]), dtype=np.float32
+    ) * np.float32(noise)
+    return normalize(block)
+
+
+def build(
+    index: VectorIndex, rows: int, topics: NDArray[np.float32], noise: float
+) -> None:
+    rng: np.random.Generator = np.random.default_rng(1)
+    for start in range(0, rows, BLOCK_ROWS):
+        count: int = min(BLOCK_ROWS, rows - start)
+        chunk_ids: NDArray[np.int64] = np.arange(start, start + count, dtype=np.int64)
+        rulebooks: NDArray[np.int64] = chunk_ids // CHUNKS_PER_RULEBOOK
+        index.add(
+            synthetic_block(rng, topics, count, noise), chunk_ids, rulebooks, rulebooks
+        )
+    index.flush()
+
+
+def timed(
+    search: Callable[[Any], List[SearchHit]], inputs: Iterable[Any]
+) -> Tuple[List[List[SearchHit]], Dict[str, float]]:
+    results: List[List[SearchHit]] = []
+    timings: List[float] = []
+    for value in inputs:
+        start: float = time.perf_counter()
+        results.append(search(value))
+        timings.append((time.perf_counter() - start) * 1000)
+    quantiles: List[float] = statistics.quantiles(timings, n=20)
+    return results, {
+        "p50": round(statistics.median(timings), 2),
+        "p95": round(quantiles[18], 2),
+    }
+
+
+def recall(found: Sequence[List[SearchHit]], truth: Sequence[List[SearchHit]]) -> float:
+    overlaps: List[float] = [
+        len({hit.chunk_id for hit in got} & {hit.chunk_id for hit in want})
+        / max(len(want), 1)
+        for got, want in zip(found, truth)
+    ]
+    return round(statistics.mean(overlaps), 3)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--dtype", choices=["float16", "float32"], default="float32")
+    parser.add_argument("--nlist", type=int, help="default: about 1 per 1000 rows")
+    parser.add_argument("--topics", type=int, default=5000)
+    parser.add_argument("--noise", type=float, default=0.03)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[4, 8, 16, 32, 64])
+    args = parser.parse_args()
+
+    rng: np.random.Generator = np.random.default_rng(0)
+    topics: NDArray[np.float32] = normalize(
+        rng.standard_normal((args.topics, args.dim), dtype=np.float32)
+    )
+    queries: NDArray[np.float32] = synthetic_block(
+        rng, topics, args.queries, args.noise
+    )
+    nlist: int = args.nlist or max(16, args.rows // 1000)
+
+    with tempfile.TemporaryDirectory() as directory:
+        settings: VectorSettings = VectorSettings(
+            path=directory,
+            dim=args.dim,
+            dtype=args.dtype,
+            nlist=nlist,
+            exact_threshold=0,
+        )
+        index: VectorIndex = VectorIndex(settings)
+        found: List[List[SearchHit]]
+        latency: Dict[str, float]
+        report: Dict[str, Any] = {
+            "rows": args.rows,
+            "nlist": nlist,
+            "dtype": args.dtype,
+        }
+
+        start: float = time.perf_counter()
+        build(index, args.rows, topics, args.noise)
+        report["add_s"] = round(time.perf_counter() - start, 1)
+
+        # Untrained, so these are exact scans over every row
+        truth: List[List[SearchHit]]
+        truth, report["exact"] = timed(lambda q: index.search(q, args.k), queries)
+
+        start = time.perf_counter()
+        index.train()
+        report["train_s"] = round(time.perf_counter() - start, 1)
+
+        for nprobe in args.nprobe:
+            found, latency = timed(
+                lambda q: index.search(q, args.k, nprobe=nprobe), queries
+            )
+            report[f"nprobe={nprobe}"] = {"recall": recall(found, truth), **latency}
+
+        # Filtered to one game: its rows fall under exact_threshold, so this
+        # is the exact scan over the game's rows that answers filtered asks
+        index.settings.exact_threshold = VectorSettings().exact_threshold
+        games: List[int] = rng.integers(
+            0, max(1, args.rows // CHUNKS_PER_RULEBOOK), len(queries)
+        ).tolist()
+        _, report["filtered"] = timed(
+            lambda i: index.search(queries[i], args.k, game_ids=[games[i]]),
+            range(len(queries)),
+        )
+        index.close()
+
+    for name, value in report.items():
+        print(f"{name:>16}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Fixtures for the pytest-benchmark microbenchmarks in this directory.
+
+Reader benchmarks need the database configured through the usual POSTGRES_*
+environment variables and are skipped without one; model benchmarks need
+nothing. Every async call runs on one event loop for the whole session,
+since the engine's pooled connections are bound to the loop that opened
+them.
+"""
+
+import asyncio
+import os
+from typing import Iterator, List
+
+import pytest
+from dataset import ensure_games
+from games_rule_core.postgres.models.models import Game
+from games_rule_core.postgres.session import (
+    dispose_engines,
+    get_engine,
+    get_session_maker,
+)
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlmodel import col
+
+# Rows the reader benchmarks expect; raise it to benchmark a larger table
+GAMES: int = int(os.environ.get("BENCH_GAMES", "10000"))
+SEED: int = int(os.environ.get("BENCH_SEED", "0"))
+
+
+@pytest.fixture(scope="session")
+def runner() -> Iterator[asyncio.Runner]:
+    try:
+        engine: AsyncEngine = get_engine()
+    except ValidationError as e:
+        # Settings are read on first use; without POSTGRES_* they don't validate
+        pytest.skip(f"database not configured: {e.error_count()} setting(s) invalid")
+    # Statement echo would dominate the timings
+    engine.echo = False
+    with asyncio.Runner() as runner:
+        yield runner
+        runner.run(dispose_engines())
+
+
+@pytest.fixture(scope="session")
+def game_ids(runner: asyncio.Runner) -> List[int]:
+    """Ids of up to 1000 games, seeding the synthetic dataset if needed."""
+
+    async def load() -> List[int]:
+        await ensure_games(GAMES, SEED)
+        async with get_session_maker()() as session:
+            result = await session.execute(select(col(Game.id)).limit(1000))
+            return [id_ for id_ in result.scalars() if id_ is not None]
+
+    try:
+        return runner.run(load())
+    except (OSError, DBAPIError) as e:
+        pytest.skip(f"database unavailable: {e}")
+
+
+@pytest.fixture
+def session(runner: asyncio.Runner, game_ids: List[int]) -> Iterator[AsyncSession]:
+    session: AsyncSession = get_session_maker()()
+    yield session
+    runner.run(session.close())
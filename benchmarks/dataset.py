@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Generate a seeded synthetic catalogue of games and rulebooks.
+
+The same ``--seed`` always yields the same rows, so runs on different
+machines or commits read comparable data. Loads through the bulk writers
+into the database configured through the usual POSTGRES_* environment
+variables, topping the table up to ``--games`` rows; ``--dump`` writes the
+games as NDJSON instead (see ``bin/bulk_load.py``):
+
+    python benchmarks/dataset.py --games 100000 --seed 42
+    python benchmarks/dataset.py --games 1000 --dump games.ndjson
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+from typing import Any, Dict, Iterator, List, Sequence
+
+from games_rule_core.postgres.models.models import Game
+from games_rule_core.postgres.session import (
+    dispose_engines,
+    get_engine,
+    get_session_maker,
+)
+from games_rule_core.postgres.writer.writer import (
+    BulkResult,
+    game_writer,
+    rulebook_writer,
+)
+from sqlalchemy import func, select
+
+GAME_TYPES: List[str] = [
+    "Strategy",
+    "Family",
+    "Party",
+    "Abstract",
+    "Thematic",
+    "Wargame",
+    "Cooperative",
+    "Deck Building",
+    "Economic",
+    "Puzzle",
+]
+MECHANICS: List[str] = [
+    "Dice Rolling",
+    "Card Drafting",
+    "Worker Placement",
+    "Area Control",
+    "Tile Placement",
+    "Hand Management",
+    "Set Collection",
+    "Trading",
+    "Auction/Bidding",
+    "Resource Management",
+    "Engine Building",
+    "Push Your Luck",
+    "Hidden Roles",
+    "Route Building",
+]
+WORDS: List[str] = [
+    "dragon",
+    "castle",
+    "harbor",
+    "empire",
+    "farm",
+    "train",
+    "space",
+    "pirate",
+    "wizard",
+    "forest",
+    "market",
+    "island",
+    "dungeon",
+    "city",
+    "river",
+    "temple",
+]
+DOCUMENT_TYPES: List[str] = ["rulebook", "quick_start", "faq"]
+
+
+def generate_games(
+    count: int, seed: int = 0, start: int = 0
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield ``GameBase``-shaped games, identical for the same seed.
+
+    Args:
+        count: Number of games
+        seed: Random seed
+        start: Index of the first game, so top-ups continue a sequence
+
+    Yields:
+        Game fields as plain dicts
+    """
+    for index in range(start, start + count):
+        rng: random.Random = random.Random(seed * 1_000_003 + index)
+        min_players: int = rng.choice([1, 1, 2, 2, 2, 3])
+        min_playtime: int = rng.choice([10, 15, 20, 30, 45, 60, 90])
+        words: List[str] = rng.sample(WORDS, 3)
+        yield {
+            "name": f"{words[0].title()} of the {words[1].title()} {index}",
+            "description": (
+                f"A game of {words[0]}s and {words[2]}s where players "
+                f"{rng.choice(['trade', 'explore', 'build', 'fight'])} "
+                f"around the {words[1]}."
+            ),
+            "game_types": rng.sample(GAME_TYPES, rng.randint(1, 3)),
+            "game_mechanics": rng.sample(MECHANICS, rng.randint(1, 4)),
+            "min_players": min_players,
+            "max_players": min_players + rng.randint(0, 5),
+            "min_playtime_minutes": min_playtime,
+            "max_playtime_minutes": min_playtime * rng.choice([1, 1, 2, 3]),
+            "min_age": rng.choice([6, 8, 10, 12, 14]),
+            "complexity_rating": round(rng.uniform(1.0, 5.0), 2),
+            "year_published": rng.randint(1980, 2025),
+            "publisher": f"Publisher {rng.randint(1, 200)}",
+            "designer": f"Designer {rng.randint(1, 1000)}",
+        }
+
+
+def generate_rulebooks(
+    game_ids: Sequence[int], seed: int = 0, max_per_game: int = 2
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield ``RulebookBase``-shaped documents for existing games.
+
+    Only catalogue rows are produced; no files are uploaded to MinIO.
+
+    Args:
+        game_ids: Games to attach documents to
+        seed: Random seed
+        max_per_game: Most documents per game; every game gets at least one
+
+    Yields:
+        Rulebook fields as plain dicts
+    """
+    for game_id in game_ids:
+        rng: random.Random = random.Random(seed * 1_000_003 + game_id)
+        for document_type in DOCUMENT_TYPES[: rng.randint(1, max_per_game)]:
+            yield {
+                "game_id": game_id,
+                "document_type": document_type,
+                "minio_bucket": "rulebooks",
+                "minio_object_path": f"synthetic/{game_id}/{document_type}.pdf",
+                "file_name": f"{document_type}.pdf",
+                "file_size_bytes": rng.randint(200_000, 20_000_000),
+                "mime_type": "application/pdf",
+            }
+
+
+async def ensure_games(
+    count: int, seed: int = 0, chunk_size: int = 1000
+) -> Dict[str, int]:
+    """
+    Top the games table up to ``count`` rows, with rulebooks for new games.
+
+    Args:
+        count: Games the table should hold at least
+        seed: Random seed
+        chunk_size: Rows per insert statement
+
+    Returns:
+        Counts of existing games and of games and rulebooks written
+    """
+    async with get_session_maker()() as session:
+        existing: int = (
+            await session.execute(select(func.count()).select_from(Game))
+        ).scalar_one()
+        if existing >= count:
+            return {"existing": existing, "games": 0, "rulebooks": 0}
+        games: BulkResult = await game_writer(session, chunk_size).write(
+            generate_games(count - existing, seed, start=existing)
+        )
+        rulebooks: BulkResult = await rulebook_writer(session, chunk_size).write(
+            generate_rulebooks(games.ids, seed)
+        )
+    return {
+        "existing": existing,
+        "games": games.written,
+        "rulebooks": rulebooks.written,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument(
+        "--dump", help="write games as NDJSON to this path ('-' for stdout)"
+    )
+    args = parser.parse_args()
+
+    if args.dump:
+        lines: Iterator[str] = (
+            json.dumps(game) + "\n" for game in generate_games(args.games, args.seed)
+        )
+        if args.dump == "-":
+            sys.stdout.writelines(lines)
+        else:
+            with open(args.dump, "w") as out:
+                out.writelines(lines)
+        return 0
+
+    # Statement logging would print every chunk
+    get_engine().echo = False
+
+    async def run() -> Dict[str, int]:
+        try:
+            return await ensure_games(args.games, args.seed, args.chunk_size)
+        finally:
+            await dispose_engines()
+
+    print(json.dumps(asyncio.run(run())))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
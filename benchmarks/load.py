@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Drive the API in-process with a scripted request mix and report latency.
+
+Runs the app from ``games_rule_api.api.api.create_app`` (lifespan
+included) over ASGI with ``--concurrency`` closed-loop clients, each
+picking endpoints by weight, and reports p50/p95/p99 latency, throughput
+and errors per endpoint. No network is involved, so the numbers are the
+service's own cost plus the database configured through the usual
+POSTGRES_* environment variables.
+Results are written as JSON; pass an earlier file as ``--baseline`` to
+print the change per endpoint:
+
+    python benchmarks/dataset.py --games 10000
+    python benchmarks/load.py --duration 30 --out results/load-main.json
+    python benchmarks/load.py --duration 30 --baseline results/load-main.json
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from dataset import GAME_TYPES, MECHANICS, ensure_games
+from fastapi import FastAPI
+from games_rule_api.api.api import create_app
+from games_rule_core.postgres.models.models import Game
+from games_rule_core.postgres.session import (
+    dispose_engines,
+    get_engine,
+    get_session_maker,
+)
+from sqlalchemy import select
+from sqlmodel import col
+
+SEARCH_TERMS: List[str] = ["castle", "dragon trade", "space pirate", "wizard"]
+QUESTIONS: List[str] = ["How do I win?", "How many cards do I draw each turn?"]
+
+# (method, path, JSON body) for one request
+Request = Tuple[str, str, Optional[Dict[str, Any]]]
+
+
+@dataclass
+class Endpoint:
+    """One entry of the request mix; weight 0 leaves it out unless --mix names it."""
+
+    name: str
+    weight: int
+    build: Callable[[random.Random, List[int]], Request]
+
+
+ENDPOINTS: List[Endpoint] = [
+    Endpoint("list", 3, lambda rng, ids: ("GET", "/games/?limit=20", None)),
+    Endpoint("detail", 5, lambda rng, ids: ("GET", f"/games/{rng.choice(ids)}", None)),
+    Endpoint(
+        "filter",
+        2,
+        lambda rng, ids: (
+            "GET",
+            f"/games/search?limit=20&players={rng.randint(1, 6)}"
+            f"&max_playtime={rng.choice([30, 60, 90, 120])}"
+            f"&types_any={rng.choice(GAME_TYPES)}"
+            f"&mechanics_any={rng.choice(MECHANICS)}",
+            None,
+        ),
+    ),
+    Endpoint(
+        "search",
+        1,
+        lambda rng, ids: (
+            "GET",
+            f"/games/search?limit=20&fuzzy=false&q={rng.choice(SEARCH_TERMS)}",
+            None,
+        ),
+    ),
+    Endpoint(
+        "facets",
+        1,
+        lambda rng, ids: (
+            "GET",
+            f"/games/facets?players={rng.randint(1, 6)}"
+            f"&types_any={rng.choice(GAME_TYPES)}",
+            None,
+        ),
+    ),
+    Endpoint(
+        "rulebooks",
+        1,
+        lambda rng, ids: ("GET", f"/games/{rng.choice(ids)}/rulebooks", None),
+    ),
+    Endpoint(
+        "retrieve",
+        0,
+        lambda rng, ids: (
+            "POST",
+            f"/games/{rng.choice(ids)}/ask/retrieve",
+            {"question": rng.choice(QUESTIONS)},
+        ),
+    ),
+]
+
+
+def percentile(sorted_ms: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    if not sorted_ms:
+        return 0.0
+    rank: int = max(1, round(fraction * len(sorted_ms) + 0.5))
+    return sorted_ms[min(rank, len(sorted_ms)) - 1]
+
+
+def summarize(latencies_ms: List[float], errors: int, elapsed: float) -> Dict[str, Any]:
+    ordered: List[float] = sorted(latencies_ms)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "rps": round(len(ordered) / elapsed, 1),
+        "p50_ms": round(percentile(ordered, 0.50), 3),
+        "p95_ms": round(percentile(ordered, 0.95), 3),
+        "p99_ms": round(percentile(ordered, 0.99), 3),
+        "max_ms": round(ordered[-1], 3) if ordered else 0.0,
+    }
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    endpoints: List[Endpoint],
+    ids: List[int],
+    concurrency: int,
+    duration: float,
+    seed: int,
+) -> Dict[str, Any]:
+    latencies: Dict[str, List[float]] = {endpoint.name: [] for endpoint in endpoints}
+    errors: Dict[str, int] = {endpoint.name: 0 for endpoint in endpoints}
+    weights: List[int] = [endpoint.weight for endpoint in endpoints]
+    deadline: float = time.perf_counter() + duration
+
+    async def client_loop(worker: int) -> None:
+        rng: random.Random = random.Random(seed * 1000 + worker)
+        while time.perf_counter() < deadline:
+            endpoint: Endpoint = rng.choices(endpoints, weights)[0]
+            method, path, body = endpoint.build(rng, ids)
+            start: float = time.perf_counter()
+            response: httpx.Response = await client.request(method, path, json=body)
+            await response.aread()
+            latencies[endpoint.name].append((time.perf_counter() - start) * 1000)
+            if response.status_code >= 400:
+                errors[endpoint.name] += 1
+
+    start: float = time.perf_counter()
+    await asyncio.gather(*(client_loop(worker) for worker in range(concurrency)))
+    elapsed: float = time.perf_counter() - start
+    every: List[float] = [ms for values in latencies.values() for ms in values]
+    return {
+        "endpoints": {
+            name: summarize(values, errors[name], elapsed)
+            for name, values in latencies.items()
+        },
+        "total": summarize(every, sum(errors.values()), elapsed),
+    }
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any]) -> Dict[str, Any]:
+    """Relative change of each endpoint's metrics against a baseline run."""
+    changes: Dict[str, Any] = {}
+    for name, current in {**results["endpoints"], "total": results["total"]}.items():
+        before: Optional[Dict[str, Any]] = (
+            baseline["total"] if name == "total" else baseline["endpoints"].get(name)
+        )
+        if not before:
+            continue
+        changes[name] = {
+            metric: f"{current[metric] / before[metric] - 1:+.1%}"
+            for metric in ("rps", "p50_ms", "p95_ms", "p99_ms")
+            if before[metric]
+        }
+    return changes
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--duration", type=float, default=20.0, help="seconds")
+    parser.add_argument("--warmup", type=float, default=3.0, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--games", type=int, default=10_000, help="seed up to this")
+    parser.add_argument(
+        "--mix",
+        help="endpoint weights, e.g. 'detail=5,list=1,retrieve=1'; "
+        f"endpoints: {', '.join(e.name for e in ENDPOINTS)}",
+    )
+    parser.add_argument("--out", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="earlier results file to compare with")
+    args = parser.parse_args()
+
+    endpoints: List[Endpoint] = ENDPOINTS
+    if args.mix:
+        weights: Dict[str, int] = {
+            name: int(weight)
+            for name, weight in (item.split("=") for item in args.mix.split(","))
+        }
+        endpoints = [
+            Endpoint(e.name, weights[e.name], e.build)
+            for e in ENDPOINTS
+            if weights.get(e.name)
+        ]
+    else:
+        endpoints = [e for e in ENDPOINTS if e.weight]
+
+    # Statement echo would dominate the timings
+    get_engine().echo = False
+    await ensure_games(args.games, args.seed)
+    async with get_session_maker()() as session:
+        result = await session.execute(select(col(Game.id)).limit(args.games))
+        ids: List[int] = [id_ for id_ in result.scalars() if id_ is not None]
+
+    app: FastAPI = create_app()
+    transport: httpx.ASGITransport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://load", timeout=60
+        ) as client:
+            # Warm pools, caches and pydantic schemas before measuring
+            await run_load(client, endpoints, ids, args.concurrency, args.warmup, -1)
+            results: Dict[str, Any] = await run_load(
+                client, endpoints, ids, args.concurrency, args.duration, args.seed
+            )
+
+    report: Dict[str, Any] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "revision": git_revision(),
+        "settings": {
+            "duration": args.duration,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+            "games": len(ids),
+            "mix": {e.name: e.weight for e in endpoints},
+        },
+        **results,
+    }
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            report["change"] = compare(results, json.load(baseline))
+    print(json.dumps(report, indent=2))
+    if args.out:
+        with open(args.out, "w") as out:
+            json.dump(report, out, indent=2)
+    await dispose_engines()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,38 @@
+"""Microbenchmarks for GameBase validation and Game serialization."""
+
+from typing import Any, Dict, List
+
+import pytest
+from dataset import generate_games
+from games_rule_core.postgres.models.models import Game, GameBase
+from pydantic import TypeAdapter, ValidationError
+
+GAMES: List[Dict[str, Any]] = list(generate_games(100, seed=0))
+INVALID: Dict[str, Any] = {**GAMES[0], "min_players": 4, "max_players": 2}
+GAME_LIST: TypeAdapter[List[GameBase]] = TypeAdapter(List[GameBase])
+
+
+def test_validate_game(benchmark: Any) -> None:
+    benchmark(GameBase.model_validate, GAMES[0])
+
+
+def test_validate_game_json(benchmark: Any) -> None:
+    document: bytes = GameBase.model_validate(GAMES[0]).model_dump_json().encode()
+    benchmark(GameBase.model_validate_json, document)
+
+
+def test_reject_invalid_game(benchmark: Any) -> None:
+    def validate() -> None:
+        with pytest.raises(ValidationError):
+            GameBase.model_validate(INVALID)
+
+    benchmark(validate)
+
+
+def test_validate_100_games(benchmark: Any) -> None:
+    benchmark(GAME_LIST.validate_python, GAMES)
+
+
+def test_dump_game_json(benchmark: Any) -> None:
+    game: Game = Game.model_validate({**GAMES[0], "id": 1})
+    benchmark(game.model_dump_json)
@@ -0,0 +1,131 @@
+"""Microbenchmarks for PostgresReader methods against a seeded database."""
+
+import asyncio
+import itertools
+from typing import Any, Iterator, List
+
+from games_rule_core.postgres.models.models import Game
+from games_rule_core.postgres.reader.facets import Facets, game_facets
+from games_rule_core.postgres.reader.filters import GameFilter
+from games_rule_core.postgres.reader.reader import PostgresReader
+from games_rule_core.postgres.reader.snapshot import CatalogueSnapshot
+from sqlalchemy.ext.asyncio import AsyncSession
+
+FILTERS: List[GameFilter] = [
+    GameFilter(players=players, max_playtime=playtime, types_any=["Strategy"])
+    for players in (2, 3, 4)
+    for playtime in (30, 60, 90)
+]
+
+
+def test_get_by_id(
+    benchmark: Any, runner: asyncio.Runner, session: AsyncSession, game_ids: List[int]
+) -> None:
+    reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+    ids: Iterator[int] = itertools.cycle(game_ids)
+
+    def run() -> Any:
+        # Skip the identity map, which would answer repeats without a query
+        session.expunge_all()
+        return runner.run(reader.get_by_id(next(ids)))
+
+    benchmark(run)
+
+
+def test_get_row(
+    benchmark: Any, runner: asyncio.Runner, session: AsyncSession, game_ids: List[int]
+) -> None:
+    reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+    ids: Iterator[int] = itertools.cycle(game_ids)
+    benchmark(lambda: runner.run(reader.get_row(next(ids))))
+
+
+def test_get_many_20(
+    benchmark: Any, runner: asyncio.Runner, session: AsyncSession, game_ids: List[int]
+) -> None:
+    reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+    batches: Iterator[List[int]] = itertools.cycle(
+        [game_ids[i : i + 20] for i in range(0, len(game_ids), 20)]
+    )
+
+    def run() -> Any:
+        session.expunge_all()
+        return runner.run(reader.get_many(next(batches)))
+
+    benchmark(run)
+
+
+def test_exists(
+    benchmark: Any, runner: asyncio.Runner, session: AsyncSession, game_ids: List[int]
+) -> None:
+    reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+    ids: Iterator[int] = itertools.cycle(game_ids)
+    benchmark(lambda: runner.run(reader.exists(next(ids))))
+
+
+def test_get_version(
+    benchmark: Any, runner: asyncio.Runner, session: AsyncSession, game_ids: List[int]
+) -> None:
+    reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+    ids: Iterator[int] = itertools.cycle(game_ids)
+    benchmark(lambda: runner.run(reader.get_version(next(ids))))
+
+
+def test_get_version_with_rulebooks(
+    benchmark: Any, runner: asyncio.Runner, session: AsyncSession, game_ids: List[int]
+) -> None:
+    reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+    ids: Iterator[int] = itertools.cycle(game_ids)
+    benchmark(lambda: runner.run(reader.get_version(next(ids), "rulebooks")))
+
+
+def test_get_rows_page(
+    benchmark: Any, runner: asyncio.Runner, session: AsyncSession
+) -> None:
+    reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+    benchmark(lambda: runner.run(reader.get_rows_page(limit=100)))
+
+
+def test_get_page_filtered(
+    benchmark: Any, runner: asyncio.Runner, session: AsyncSession
+) -> None:
+    reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+    filters: Iterator[GameFilter] = itertools.cycle(FILTERS)
+
+    def run() -> Any:
+        session.expunge_all()
+        where = next(filters).to_condition()
+        return runner.run(reader.get_page(limit=20, where=where))
+
+    benchmark(run)
+
+
+def test_count_filtered(
+    benchmark: Any, runner: asyncio.Runner, session: AsyncSession
+) -> None:
+    reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+    where = GameFilter(players=3, types_any=["Strategy"]).to_condition()
+    assert where is not None
+    benchmark(lambda: runner.run(reader.count(where)))
+
+
+def test_game_facets_filtered(
+    benchmark: Any, runner: asyncio.Runner, session: AsyncSession
+) -> None:
+    facets: Facets[Game] = game_facets(session)
+    filters: Iterator[GameFilter] = itertools.cycle(FILTERS)
+    benchmark(lambda: runner.run(facets.count(next(filters).to_condition())))
+
+
+def test_snapshot_ids_filtered(
+    benchmark: Any, runner: asyncio.Runner, session: AsyncSession
+) -> None:
+    snapshot: CatalogueSnapshot = runner.run(CatalogueSnapshot.load(session))
+    filters: Iterator[GameFilter] = itertools.cycle(FILTERS)
+
+    def run() -> Any:
+        where = next(filters).to_condition()
+        assert where is not None
+        return snapshot.get_ids_by_filter(where, limit=20)
+
+    benchmark(run)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import sys
+from typing import IO, Any, Iterator, Optional
+
+from games_rule_core.cache.cache import ReadThroughCache
+from games_rule_core.cache.config import CacheSettings, get_cache_settings
+from games_rule_core.postgres.session import get_engine, get_session_maker
+from games_rule_core.postgres.writer.writer import (
+    BulkResult,
+    BulkWriter,
+    game_writer,
+    rulebook_writer,
+)
+
+
+def read_lines(stream: IO[bytes]) -> Iterator[bytes]:
+    for line in stream:
+        if line.strip():
+            yield line
+
+
+async def load(stream: IO[bytes], kind: str, chunk_size: int) -> BulkResult:
+    # API processes only share entries through Redis; with the memory backend
+    # they serve cached games and rulebook lists until their TTL runs out
+    settings: CacheSettings = get_cache_settings()
+    cache: Optional[ReadThroughCache] = None
+    if settings.backend == "redis":
+        cache = ReadThroughCache.from_settings(settings)
+    try:
+        async with get_session_maker()() as session:
+            writer: BulkWriter[Any]
+            if kind == "games":
+                writer = game_writer(session, chunk_size, cache)
+            else:
+                writer = rulebook_writer(session, chunk_size, cache)
+            return await writer.write(read_lines(stream))
+    finally:
+        if cache is not None:
+            await cache.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Bulk load games or rulebooks from an NDJSON file into Postgres."
+    )
+    parser.add_argument("path", help="NDJSON file with one item per line, or '-'")
+    parser.add_argument("--kind", choices=["games", "rulebooks"], default="games")
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    # Statement logging would print every chunk
+    get_engine().echo = False
+    if args.path == "-":
+        result = asyncio.run(load(sys.stdin.buffer, args.kind, args.chunk_size))
+    else:
+        with open(args.path, "rb") as stream:
+            result = asyncio.run(load(stream, args.kind, args.chunk_size))
+
+    for error in result.errors:
+        print(f"item {error.index + 1}: {error.error}", file=sys.stderr)
+    print(f"written: {result.written}, failed: {len(result.errors)}")
+    return 1 if result.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
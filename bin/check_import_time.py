@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Check that importing the services stays fast and free of side effects.
+
+Imports each module in a fresh interpreter with ``-X importtime`` and no
+POSTGRES_* variables set. Budgets are multiples of a reference import
+(fastapi and SQLAlchemy's asyncio extension) timed in the same run, so they
+hold on slower and faster machines alike. The check fails when an import
+raises, when the best of ``--runs`` cumulative import times is over its
+budget, or when an import loads a module that should wait until it is first
+used, such as the asyncpg driver. Every ``uvicorn --workers`` process and
+every scaled-out pod pays these times before it serves a request:
+
+    python bin/check_import_time.py
+    python bin/check_import_time.py --scale 1.5  # slower machine, e.g. CI
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Tuple
+
+# Imports every module below builds on; budgets are relative to its time
+REFERENCE: str = "fastapi, sqlalchemy.ext.asyncio"
+# Cumulative import time budgets as multiples of the reference import
+BUDGETS: Dict[str, float] = {
+    "games_rule_api.api.api": 2.0,
+    "games_rule_core.postgres.session": 1.5,
+    "games_rule_core.postgres.reader.reader": 1.5,
+}
+# Loaded on first use, never by importing a module above
+DEFERRED: List[str] = ["asyncpg", "numpy"]
+
+
+def import_times(module: str) -> Tuple[Dict[str, Tuple[int, int]], str]:
+    """
+    Import a module in a clean interpreter.
+
+    Args:
+        module: Dotted module name, or several separated by commas
+
+    Returns:
+        Self and cumulative microseconds per imported module, and stderr
+        when the import failed (empty otherwise)
+    """
+    env: Dict[str, str] = {
+        key: value
+        for key, value in os.environ.items()
+        if not key.startswith("POSTGRES_")
+    }
+    completed: subprocess.CompletedProcess[str] = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    times: Dict[str, Tuple[int, int]] = {}
+    errors: List[str] = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            errors.append(line)
+            continue
+        fields: List[str] = line.split(":", 1)[1].split("|")
+        if fields[0].strip().isdigit():
+            times[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return times, "" if completed.returncode == 0 else "\n".join(errors)
+
+
+def reference_ms(runs: int) -> float:
+    """
+    Time the reference import, best of several runs.
+
+    Args:
+        runs: Number of clean interpreters to import it in
+
+    Returns:
+        Milliseconds spent in imports beyond interpreter start-up
+    """
+    startup, _ = import_times("sys")
+    best: Optional[float] = None
+    for _ in range(runs):
+        times, error = import_times(REFERENCE)
+        if error:
+            raise RuntimeError(f"reference import failed\n{error}")
+        # Modules of the reference, without those every interpreter loads
+        elapsed_ms: float = (
+            sum(own for name, (own, _) in times.items() if name not in startup)
+            / 1000
+        )
+        best = elapsed_ms if best is None else min(best, elapsed_ms)
+    assert best is not None
+    return best
+
+
+def check(module: str, budget_ms: float, runs: int) -> Optional[str]:
+    best: Optional[float] = None
+    times: Dict[str, Tuple[int, int]] = {}
+    for _ in range(runs):
+        times, error = import_times(module)
+        if error:
+            return f"{module}: import failed without POSTGRES_* set\n{error}"
+        cumulative_ms: float = times[module][1] / 1000
+        best = cumulative_ms if best is None else min(best, cumulative_ms)
+    assert best is not None
+    loaded: List[str] = [name for name in DEFERRED if name in times]
+    print(f"{module:45} {best:8.1f} ms  (budget {budget_ms:.0f} ms)")
+    if loaded:
+        return f"{module}: imports {', '.join(loaded)}, which must wait for first use"
+    if best > budget_ms:
+        slowest: List[Tuple[str, Tuple[int, int]]] = sorted(
+            times.items(), key=lambda item: item[1][0], reverse=True
+        )[:10]
+        report: str = "\n".join(
+            f"  {own / 1000:8.1f} ms  {name}" for name, (own, _) in slowest
+        )
+        return (
+            f"{module}: {best:.1f} ms is over its {budget_ms:.0f} ms budget; "
+            f"slowest modules by own time:\n{report}"
+        )
+    return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=3, help="best of this many")
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="multiply every budget by this"
+    )
+    args = parser.parse_args()
+
+    reference: float = reference_ms(args.runs)
+    print(f"{'reference (' + REFERENCE + ')':45} {reference:8.1f} ms")
+    failures: List[str] = []
+    for module, multiple in BUDGETS.items():
+        budget_ms: float = reference * multiple * args.scale
+        failure: Optional[str] = check(module, budget_ms, args.runs)
+        if failure:
+            failures.append(failure)
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
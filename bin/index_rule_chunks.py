@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import sys
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+import numpy as np
+from games_rule_core.postgres.models.models import RuleChunk
+from games_rule_core.postgres.session import (
+    dispose_engines,
+    get_engine,
+    get_session_maker,
+)
+from games_rule_vector.config import VectorSettings, get_vector_settings
+from games_rule_vector.embed import Embedder, create_embedder, embed_batches
+from games_rule_vector.index import VectorIndex
+from sqlalchemy import Result, Select
+from sqlmodel import col, select
+
+
+async def sync(
+    index: VectorIndex, embedder: Embedder, game_id: Optional[int]
+) -> Tuple[int, int]:
+    """Bring the index in line with rule_chunks; returns (rulebooks, rows) added."""
+    statement: Select[Any] = select(RuleChunk.document_id, RuleChunk.id)
+    if game_id is not None:
+        statement = statement.where(col(RuleChunk.game_id) == game_id)
+    wanted: Dict[int, Set[int]] = {}
+    async with get_session_maker()() as session:
+        result: Result[Any] = await session.execute(statement)
+        for document_id, chunk_id in result:
+            wanted.setdefault(document_id, set()).add(chunk_id)
+
+    indexed: Dict[int, FrozenSet[int]] = index.rulebook_chunks()
+    if game_id is None:
+        # Rulebooks whose chunks are gone from the database entirely
+        for document_id in indexed.keys() - wanted.keys():
+            index.delete_rulebook(document_id)
+
+    # Re-ingestion replaces every chunk id, so any difference means re-embed
+    changed: List[int] = [
+        document_id
+        for document_id, chunk_ids in wanted.items()
+        if indexed.get(document_id) != frozenset(chunk_ids)
+    ]
+    rows: int = 0
+    for document_id in changed:
+        index.delete_rulebook(document_id)
+        async with get_session_maker()() as session:
+            result = await session.execute(
+                select(RuleChunk.id, RuleChunk.game_id, RuleChunk.text)
+                .where(RuleChunk.document_id == document_id)
+                .order_by(col(RuleChunk.chunk_index))
+            )
+            chunks: List[Any] = list(result)
+        start: int = 0
+        for vectors in embed_batches(
+            embedder, (chunk.text for chunk in chunks), index.settings.embed_batch_size
+        ):
+            batch: List[Any] = chunks[start : start + len(vectors)]
+            rows += index.add(
+                vectors,
+                [chunk.id for chunk in batch],
+                np.full(len(batch), document_id),
+                [chunk.game_id for chunk in batch],
+            )
+            start += len(vectors)
+    return len(changed), rows
+
+
+async def run(
+    index: VectorIndex, embedder: Embedder, game_id: Optional[int]
+) -> Tuple[int, int]:
+    try:
+        return await sync(index, embedder, game_id)
+    finally:
+        await dispose_engines()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Embed rule_chunks into the vector index, re-embedding changed rulebooks."
+    )
+    parser.add_argument(
+        "--game-id",
+        type=int,
+        help="only this game's rulebooks (stale rulebooks are not removed)",
+    )
+    parser.add_argument(
+        "--train",
+        action="store_true",
+        help="retrain the inverted lists (otherwise only once the index outgrows exact search)",
+    )
+    parser.add_argument(
+        "--compact", action="store_true", help="rewrite the index without deleted rows"
+    )
+    args = parser.parse_args()
+
+    get_engine().echo = False
+    settings: VectorSettings = get_vector_settings()
+    index: VectorIndex = VectorIndex(settings)
+    rulebooks: int
+    rows: int
+    rulebooks, rows = asyncio.run(run(index, create_embedder(settings), args.game_id))
+    if args.compact:
+        index.compact()
+    if args.train or (not index.trained and len(index) > settings.exact_threshold):
+        index.train()
+    indexed: int = len(index)
+    index.close()
+
+    print(
+        f"re-embedded rulebooks: {rulebooks} ({rows} chunks), "
+        f"indexed chunks: {indexed}, trained: {index.trained}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+import argparse
+import asyncio
+import sys
+from typing import Optional
+
+from games_rule_core.ingest.config import IngestSettings, get_ingest_settings
+from games_rule_core.ingest.pipeline import IngestReport, RulebookIngestor
+from games_rule_core.postgres.session import (
+    dispose_engines,
+    get_engine,
+    get_session_maker,
+)
+
+
+async def ingest(
+    settings: IngestSettings, game_id: Optional[int], force: bool
+) -> IngestReport:
+    try:
+        return await RulebookIngestor(get_session_maker(), settings).run(
+            game_id=game_id, force=force
+        )
+    finally:
+        await dispose_engines()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Ingest new or changed rulebooks from object storage into rule_chunks."
+    )
+    parser.add_argument("--game-id", type=int, help="only this game's rulebooks")
+    parser.add_argument(
+        "--force", action="store_true", help="re-ingest even if unchanged"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="worker processes (default: INGEST_WORKERS or all cores)",
+    )
+    args = parser.parse_args()
+
+    # Statement logging would print every chunk insert
+    get_engine().echo = False
+    settings: IngestSettings = get_ingest_settings()
+    if args.workers is not None:
+        settings = settings.model_copy(update={"workers": args.workers})
+    report: IngestReport = asyncio.run(ingest(settings, args.game_id, args.force))
+
+    for error in report.errors:
+        print(f"document {error.document_id}: {error.error}", file=sys.stderr)
+    print(
+        f"ingested: {report.ingested} ({report.chunks} chunks), "
+        f"unchanged: {report.unchanged}, skipped: {report.skipped}, "
+        f"failed: {len(report.errors)}"
+    )
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -49,3 +49,10 @@ Create the name of the service account to use
 {{- default "default" .Values.serviceAccount.name }}
 {{- end }}
 {{- end }}
+
+{{/*
+Name of a CloudNativePG service, e.g. "rw" or "ro", of the release's cluster
+*/}}
+{{- define "games-rule-api.postgresService" -}}
+{{- printf "%s-%s-%s" .root.Release.Name .root.Values.global.postgresCluster .service }}
+{{- end }}
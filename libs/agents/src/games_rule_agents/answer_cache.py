@@ -0,0 +1,320 @@
+import re
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from games_rule_core.retrieval.hybrid import CitedChunk
+from numpy.typing import NDArray
+from prometheus_client import Counter, Gauge
+from pydantic import BaseModel
+
+from games_rule_agents.config import AgentSettings
+
+_NON_WORD: re.Pattern[str] = re.compile(r"[^\w\s]")
+
+ANSWER_CACHE_LOOKUPS: Counter = Counter(
+    "games_rule_answer_cache_lookups_total",
+    "Answer cache lookups by result (hit, miss, stale)",
+    ["result"],
+)
+ANSWER_CACHE_EVICTIONS: Counter = Counter(
+    "games_rule_answer_cache_evictions_total",
+    "Answer cache entries removed, by reason",
+    ["reason"],
+)
+ANSWER_CACHE_ENTRIES: Gauge = Gauge(
+    "games_rule_answer_cache_entries", "Answers held in the cache"
+)
+ANSWER_CACHE_BYTES: Gauge = Gauge(
+    "games_rule_answer_cache_bytes", "Approximate memory held by cached answers"
+)
+
+
+def normalize_question(question: str) -> str:
+    """
+    Reduce a question to a canonical form for matching.
+
+    Applies Unicode compatibility folding and case folding, drops
+    punctuation and collapses whitespace, so "How does the Robber work?!"
+    and "how does the robber work" are the same question.
+
+    Args:
+        question: Question as asked
+
+    Returns:
+        Normalized question
+    """
+    folded: str = unicodedata.normalize("NFKC", question).casefold()
+    return " ".join(_NON_WORD.sub(" ", folded).split())
+
+
+class CachedAnswer(BaseModel):
+    """An answer as served from the cache."""
+
+    question: str
+    answer: str
+    citations: List[CitedChunk]
+    # Similarity between the asked question and the one that was answered
+    similarity: float
+
+
+class AnswerCacheStats(BaseModel):
+    """Counters since the cache was created."""
+
+    entries: int
+    bytes: int
+    hits: int
+    misses: int
+    stale: int
+    hit_rate: float
+
+
+class _Entry:
+    """One cached answer and what it was produced from."""
+
+    __slots__ = (
+        "game_id",
+        "question",
+        "vector",
+        "version",
+        "answer",
+        "citations",
+        "expires_at",
+        "size",
+    )
+
+    def __init__(
+        self,
+        game_id: int,
+        question: str,
+        vector: NDArray[np.float32],
+        version: str,
+        answer: str,
+        citations: List[CitedChunk],
+        expires_at: float,
+    ) -> None:
+        self.game_id: int = game_id
+        self.question: str = question
+        self.vector: NDArray[np.float32] = vector
+        self.version: str = version
+        self.answer: str = answer
+        self.citations: List[CitedChunk] = citations
+        self.expires_at: float = expires_at
+        self.size: int = (
+            vector.nbytes
+            + len(question)
+            + len(answer)
+            + sum(len(c.text) + 128 for c in citations)
+        )
+
+
+class SemanticAnswerCache:
+    """
+    In-process cache of generated answers, matched by question similarity.
+
+    Entries are scoped to a game and to a fingerprint of the rulebook
+    versions the answer was generated from. A lookup made with a different
+    fingerprint means the game's documents changed, so every entry of that
+    game is dropped. Within a game, an exact normalized match is served
+    directly; otherwise the closest cached question by cosine similarity is
+    served if it clears ``threshold``. Least recently used entries are
+    evicted beyond ``max_entries`` or ``max_bytes``.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.9,
+        max_entries: int = 5_000,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl_seconds: float = 24 * 60 * 60,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a near-duplicate hit
+            max_entries: Entries kept before least recently used are evicted
+            max_bytes: Approximate memory kept before eviction
+            ttl_seconds: Lifetime of an entry
+        """
+        self.threshold: float = threshold
+        self.max_entries: int = max_entries
+        self.max_bytes: int = max_bytes
+        self.ttl_seconds: float = ttl_seconds
+        # (game_id, normalized question) -> entry, least recently used first
+        self._entries: OrderedDict[Tuple[int, str], _Entry] = OrderedDict()
+        # Version of each game's cached entries, and the entries per game
+        self._versions: Dict[int, str] = {}
+        self._games: Dict[int, Dict[str, _Entry]] = {}
+        self._bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._stale: int = 0
+
+    @classmethod
+    def from_settings(cls, settings: AgentSettings) -> "SemanticAnswerCache":
+        """
+        Build a cache from agent settings.
+
+        Args:
+            settings: Agent settings
+
+        Returns:
+            Configured cache
+        """
+        return cls(
+            threshold=settings.answer_cache_threshold,
+            max_entries=settings.answer_cache_max_entries,
+            max_bytes=settings.answer_cache_max_bytes,
+            ttl_seconds=settings.answer_cache_ttl_seconds,
+        )
+
+    def lookup(
+        self, game_id: int, question: str, vector: NDArray[np.float32], version: str
+    ) -> Optional[CachedAnswer]:
+        """
+        Find a cached answer to the same or a near-duplicate question.
+
+        Args:
+            game_id: Game the question is about
+            question: Normalized question
+            vector: Normalized embedding of the question
+            version: Current rulebook fingerprint of the game
+
+        Returns:
+            Cached answer, or None on a miss
+        """
+        if self._versions.get(game_id, version) != version:
+            self._stale += 1
+            ANSWER_CACHE_LOOKUPS.labels("stale").inc()
+            self.invalidate(game_id, reason="stale")
+            return None
+
+        # Expired entries go first; one could otherwise win the argmax and
+        # hide a fresh near-duplicate just below it
+        now: float = time.monotonic()
+        entries: Dict[str, _Entry] = self._games.get(game_id, {})
+        for expired in [e for e in entries.values() if e.expires_at <= now]:
+            self._remove(expired, reason="ttl")
+        entries = self._games.get(game_id, {})
+
+        best: Optional[_Entry] = entries.get(question)
+        similarity: float = 1.0
+        if best is None and entries:
+            candidates: List[_Entry] = list(entries.values())
+            scores: NDArray[np.float32] = (
+                np.stack([e.vector for e in candidates]) @ vector
+            )
+            top: int = int(np.argmax(scores))
+            if scores[top] >= self.threshold:
+                best, similarity = candidates[top], float(scores[top])
+
+        if best is None:
+            self._misses += 1
+            ANSWER_CACHE_LOOKUPS.labels("miss").inc()
+            return None
+
+        self._hits += 1
+        ANSWER_CACHE_LOOKUPS.labels("hit").inc()
+        self._entries.move_to_end((game_id, best.question))
+        return CachedAnswer(
+            question=best.question,
+            answer=best.answer,
+            citations=best.citations,
+            similarity=round(similarity, 4),
+        )
+
+    def store(
+        self,
+        game_id: int,
+        question: str,
+        vector: NDArray[np.float32],
+        version: str,
+        answer: str,
+        citations: List[CitedChunk],
+    ) -> None:
+        """
+        Cache an answer.
+
+        Args:
+            game_id: Game the question is about
+            question: Normalized question
+            vector: Normalized embedding of the question
+            version: Rulebook fingerprint the answer was generated from
+            answer: Answer text
+            citations: Chunks the answer cites
+        """
+        if self._versions.get(game_id, version) != version:
+            self.invalidate(game_id, reason="stale")
+        previous: Optional[_Entry] = self._entries.get((game_id, question))
+        if previous is not None:
+            self._remove(previous, reason="replaced")
+
+        entry: _Entry = _Entry(
+            game_id,
+            question,
+            vector,
+            version,
+            answer,
+            citations,
+            time.monotonic() + self.ttl_seconds,
+        )
+        self._entries[(game_id, question)] = entry
+        self._games.setdefault(game_id, {})[question] = entry
+        self._versions[game_id] = version
+        self._bytes += entry.size
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest: _Entry = next(iter(self._entries.values()))
+            self._remove(oldest, reason="lru")
+        self._update_gauges()
+
+    def invalidate(self, game_id: int, reason: str = "invalidated") -> int:
+        """
+        Drop every cached answer for a game.
+
+        Args:
+            game_id: Game whose answers to drop
+            reason: Label recorded in the eviction metric
+
+        Returns:
+            Number of entries removed
+        """
+        entries: List[_Entry] = list(self._games.get(game_id, {}).values())
+        for entry in entries:
+            self._remove(entry, reason=reason)
+        self._versions.pop(game_id, None)
+        return len(entries)
+
+    def stats(self) -> AnswerCacheStats:
+        """Return entry counts and hit rate."""
+        lookups: int = self._hits + self._misses + self._stale
+        return AnswerCacheStats(
+            entries=len(self._entries),
+            bytes=self._bytes,
+            hits=self._hits,
+            misses=self._misses,
+            stale=self._stale,
+            hit_rate=round(self._hits / lookups, 4) if lookups else 0.0,
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, entry: _Entry, reason: str) -> None:
+        del self._entries[(entry.game_id, entry.question)]
+        game: Dict[str, _Entry] = self._games[entry.game_id]
+        del game[entry.question]
+        if not game:
+            del self._games[entry.game_id]
+            self._versions.pop(entry.game_id, None)
+        self._bytes -= entry.size
+        ANSWER_CACHE_EVICTIONS.labels(reason).inc()
+        self._update_gauges()
+
+    def _update_gauges(self) -> None:
+        ANSWER_CACHE_ENTRIES.set(len(self._entries))
+        ANSWER_CACHE_BYTES.set(self._bytes)
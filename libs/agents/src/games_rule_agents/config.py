@@ -0,0 +1,29 @@
+from functools import lru_cache
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class AgentSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="AGENT_")
+
+    # Only the extractive stub ships today; real models plug into the LLM protocol
+    llm: Literal["stub"] = Field(default="stub")
+    # Retrieved chunks passed to the model as context
+    context_chunks: int = Field(default=8)
+    # Pacing of the stub's streamed tokens, to exercise streaming under load
+    stub_token_delay_seconds: float = Field(default=0.0)
+
+    answer_cache_enabled: bool = Field(default=True)
+    # Cosine similarity above which two normalized questions count as the same
+    answer_cache_threshold: float = Field(default=0.9)
+    answer_cache_max_entries: int = Field(default=5_000)
+    answer_cache_max_bytes: int = Field(default=32 * 1024 * 1024)
+    answer_cache_ttl_seconds: float = Field(default=24 * 60 * 60)
+
+
+@lru_cache
+def get_agent_settings() -> AgentSettings:
+    """Return the agent settings, read from AGENT_* on first use."""
+    return AgentSettings()
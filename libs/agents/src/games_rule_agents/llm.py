@@ -0,0 +1,114 @@
+import asyncio
+import re
+from typing import AsyncGenerator, List, Protocol, Sequence
+
+from games_rule_core.retrieval.hybrid import CitedChunk
+
+from games_rule_agents.config import AgentSettings
+
+_SENTENCE_END: re.Pattern[str] = re.compile(r"(?<=[.!?])\s+")
+# A word and the whitespace after it, so streamed tokens concatenate back exactly
+_TOKEN: re.Pattern[str] = re.compile(r"\S+\s*")
+
+NOT_FOUND_ANSWER: str = "I couldn't find this in the game's rulebooks."
+
+
+class LLM(Protocol):
+    """Generates an answer to a rules question from retrieved chunks."""
+
+    async def generate(self, question: str, context: Sequence[CitedChunk]) -> str:
+        """Return the answer text; ``context`` is ordered best first."""
+        ...
+
+    def stream(
+        self, question: str, context: Sequence[CitedChunk]
+    ) -> AsyncGenerator[str, None]:
+        """
+        Yield the answer as it is generated.
+
+        Closing the iterator early must stop generation, so an abandoned
+        request stops consuming the model.
+        """
+        ...
+
+
+def build_prompt(question: str, context: Sequence[CitedChunk]) -> str:
+    """
+    Render a question and its evidence as a grounded-answer prompt.
+
+    Chunks are numbered so the model can cite them as ``[n]``.
+
+    Args:
+        question: The player's question
+        context: Retrieved chunks, best first
+
+    Returns:
+        Prompt text
+    """
+    sources: List[str] = []
+    for number, chunk in enumerate(context, start=1):
+        where: str = f"p. {chunk.page_start}"
+        if chunk.page_end != chunk.page_start:
+            where = f"pp. {chunk.page_start}-{chunk.page_end}"
+        heading: str = f"{chunk.section}, {where}" if chunk.section else where
+        sources.append(f"[{number}] ({heading})\n{chunk.text}")
+    return (
+        "Answer the question using only the rulebook excerpts below and cite "
+        "them as [n]. If they do not answer it, say so.\n\n"
+        + "\n\n".join(sources)
+        + f"\n\nQuestion: {question}\nAnswer:"
+    )
+
+
+class StubLLM:
+    """
+    Extractive stand-in for a language model.
+
+    Answers with the opening sentences of the best chunk and cites it, so
+    the question answering path can run end to end without a model. Counts
+    calls, which makes cache behaviour easy to assert. Streams word by word,
+    optionally paced to mimic a model's token rate.
+    """
+
+    def __init__(self, max_sentences: int = 2, token_delay: float = 0.0) -> None:
+        """
+        Initialize stub.
+
+        Args:
+            max_sentences: Sentences quoted from the best chunk
+            token_delay: Seconds between streamed tokens
+        """
+        self.max_sentences: int = max_sentences
+        self.token_delay: float = token_delay
+        self.calls: int = 0
+
+    async def generate(self, question: str, context: Sequence[CitedChunk]) -> str:
+        self.calls += 1
+        if not context:
+            return NOT_FOUND_ANSWER
+        best: CitedChunk = context[0]
+        sentences: List[str] = _SENTENCE_END.split(" ".join(best.text.split()))
+        quoted: str = " ".join(sentences[: self.max_sentences])
+        return f"{quoted} [1]"
+
+    async def stream(
+        self, question: str, context: Sequence[CitedChunk]
+    ) -> AsyncGenerator[str, None]:
+        text: str = await self.generate(question, context)
+        for token in _TOKEN.findall(text):
+            # Yield to the loop between tokens like a real client would
+            await asyncio.sleep(self.token_delay)
+            yield token
+
+
+def create_llm(settings: AgentSettings) -> LLM:
+    """
+    Build the language model selected by settings.
+
+    Args:
+        settings: Agent settings
+
+    Returns:
+        Model client
+    """
+    return StubLLM(token_delay=settings.stub_token_delay_seconds)
@@ -0,0 +1,267 @@
+import asyncio
+import hashlib
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, List, Optional
+
+import numpy as np
+from games_rule_core.postgres.models.models import DocumentIngestion, Rulebook
+from games_rule_core.retrieval.hybrid import (
+    CitedChunk,
+    HybridRetriever,
+    RetrievalResult,
+)
+from games_rule_vector.embed import Embedder
+from numpy.typing import NDArray
+from pydantic import BaseModel
+from sqlalchemy import Result, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlmodel import col
+
+from games_rule_agents.answer_cache import (
+    CachedAnswer,
+    SemanticAnswerCache,
+    normalize_question,
+)
+from games_rule_agents.config import AgentSettings, get_agent_settings
+from games_rule_agents.llm import LLM
+
+
+class Answer(BaseModel):
+    """An answer to a rules question with the chunks it is based on."""
+
+    game_id: int
+    question: str
+    answer: str
+    citations: List[CitedChunk]
+    # Served from the answer cache rather than generated
+    cached: bool = False
+    # Some retrieval backend timed out or failed, so evidence may be missing
+    partial: bool = False
+
+
+async def rulebook_fingerprint(session: AsyncSession, game_id: int) -> str:
+    """
+    Fingerprint the current versions of a game's documents.
+
+    Changes whenever a rulebook is added, removed, re-uploaded or
+    re-ingested with different content, so answers keyed on it go stale.
+
+    Args:
+        session: SQLAlchemy async session
+        game_id: Game whose documents to fingerprint
+
+    Returns:
+        Hex digest; the same for a game without documents
+    """
+    result: Result[Any] = await session.execute(
+        select(
+            col(Rulebook.id),
+            col(Rulebook.uploaded_at),
+            col(DocumentIngestion.content_hash),
+        )
+        .outerjoin(
+            DocumentIngestion,
+            col(DocumentIngestion.document_id) == col(Rulebook.id),
+        )
+        .where(col(Rulebook.game_id) == game_id)
+        .order_by(col(Rulebook.id))
+    )
+    digest: Any = hashlib.sha256()
+    for document_id, uploaded_at, content_hash in result:
+        digest.update(f"{document_id}:{uploaded_at}:{content_hash};".encode())
+    return str(digest.hexdigest())
+
+
+class QuestionAnswerer:
+    """
+    Answers rules questions: retrieve evidence, then generate from it.
+
+    With a cache, the question is normalized and embedded first, and a
+    near-duplicate already answered against the same rulebook versions is
+    returned without retrieval or generation. Answers built from partial
+    retrieval are not cached, so a slow backend cannot pin a worse answer.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        retriever: HybridRetriever,
+        llm: LLM,
+        embedder: Embedder,
+        cache: Optional[SemanticAnswerCache] = None,
+        settings: Optional[AgentSettings] = None,
+    ) -> None:
+        """
+        Initialize answerer.
+
+        Args:
+            session_maker: Factory for sessions, used for rulebook fingerprints
+            retriever: Evidence retrieval
+            llm: Answer generation
+            embedder: Question embedder for cache matching
+            cache: Answer cache, or None to always generate
+            settings: Agent settings; read from the environment when omitted
+        """
+        self.session_maker: async_sessionmaker[AsyncSession] = session_maker
+        self.retriever: HybridRetriever = retriever
+        self.llm: LLM = llm
+        self.embedder: Embedder = embedder
+        self.cache: Optional[SemanticAnswerCache] = cache
+        self.settings: AgentSettings = settings or get_agent_settings()
+
+    async def prepare(self, game_id: int, question: str) -> "PreparedAnswer":
+        """
+        Do everything that needs the database before generation.
+
+        Checks the cache and, on a miss, retrieves evidence. Every session
+        used here is closed before this returns, so a caller streaming the
+        answer afterwards holds no connection while the model runs.
+
+        Args:
+            game_id: Game the question is about
+            question: Question as asked
+
+        Returns:
+            Cached answer or the evidence to generate one from
+
+        Raises:
+            GameNotFoundError: If the game does not exist
+        """
+        prepared: PreparedAnswer = PreparedAnswer(
+            game_id, question, normalize_question(question)
+        )
+        if self.cache is not None:
+            async with self.session_maker() as session:
+                prepared.version = await rulebook_fingerprint(session, game_id)
+            # Embedding may be a model forward pass; keep it off the event loop
+            vectors: NDArray[np.float32] = await asyncio.to_thread(
+                self.embedder.embed, [prepared.normalized]
+            )
+            prepared.vector = vectors[0]
+            hit: Optional[CachedAnswer] = self.cache.lookup(
+                game_id, prepared.normalized, prepared.vector, prepared.version
+            )
+            if hit is not None:
+                prepared.cached_answer = hit.answer
+                prepared.citations = hit.citations
+                return prepared
+
+        result: RetrievalResult = await self.retriever.retrieve(
+            game_id, question, limit=self.settings.context_chunks
+        )
+        prepared.citations = result.chunks
+        prepared.partial = result.partial
+        return prepared
+
+    async def answer(self, game_id: int, question: str) -> Answer:
+        """
+        Answer a question about one game.
+
+        Args:
+            game_id: Game the question is about
+            question: Question as asked
+
+        Returns:
+            Answer with citations
+
+        Raises:
+            GameNotFoundError: If the game does not exist
+        """
+        prepared: PreparedAnswer = await self.prepare(game_id, question)
+        text: Optional[str] = prepared.cached_answer
+        if text is None:
+            text = await self.llm.generate(question, prepared.citations)
+            self._remember(prepared, text)
+        return prepared.to_answer(text)
+
+    async def stream(self, prepared: "PreparedAnswer") -> AsyncGenerator[str, None]:
+        """
+        Stream the answer to a prepared question.
+
+        A cached answer is yielded whole. A generated one is cached only if
+        the stream runs to the end; closing it early stops the model.
+
+        Args:
+            prepared: Result of ``prepare``
+
+        Yields:
+            Pieces of answer text that concatenate to the full answer
+        """
+        if prepared.cached_answer is not None:
+            yield prepared.cached_answer
+            return
+        parts: List[str] = []
+        async with aclosing(
+            self.llm.stream(prepared.question, prepared.citations)
+        ) as tokens:
+            async for token in tokens:
+                parts.append(token)
+                yield token
+        self._remember(prepared, "".join(parts))
+
+    def _remember(self, prepared: "PreparedAnswer", text: str) -> None:
+        if (
+            self.cache is not None
+            and prepared.vector is not None
+            and prepared.version is not None
+            and prepared.citations
+            and not prepared.partial
+        ):
+            self.cache.store(
+                prepared.game_id,
+                prepared.normalized,
+                prepared.vector,
+                prepared.version,
+                text,
+                prepared.citations,
+            )
+
+
+class PreparedAnswer:
+    """A question with its cache lookup and evidence, ready for generation."""
+
+    __slots__ = (
+        "game_id",
+        "question",
+        "normalized",
+        "vector",
+        "version",
+        "cached_answer",
+        "citations",
+        "partial",
+    )
+
+    def __init__(self, game_id: int, question: str, normalized: str) -> None:
+        self.game_id: int = game_id
+        self.question: str = question
+        self.normalized: str = normalized
+        # Set only when the cache is enabled
+        self.vector: Optional[NDArray[np.float32]] = None
+        self.version: Optional[str] = None
+        self.cached_answer: Optional[str] = None
+        self.citations: List[CitedChunk] = []
+        self.partial: bool = False
+
+    @property
+    def cached(self) -> bool:
+        """Whether the answer comes from the cache."""
+        return self.cached_answer is not None
+
+    def to_answer(self, text: str) -> Answer:
+        """
+        Combine with the answer text.
+
+        Args:
+            text: Full answer text
+
+        Returns:
+            Answer with citations
+        """
+        return Answer(
+            game_id=self.game_id,
+            question=self.question,
+            answer=text,
+            citations=self.citations,
+            cached=self.cached,
+            partial=self.partial,
+        )
@@ -1,11 +1,79 @@
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, AsyncIterator
+
 from fastapi import FastAPI
+from games_rule_core.health import DependencyMonitor
+from games_rule_core.limiter import OverloadedError
+from games_rule_core.postgres.breaker import CircuitOpenError
+from games_rule_core.postgres.session import dispose_engines
 from sqlalchemy.exc import IntegrityError
 
-from games_rule_api.exceptions.exceptions import integrity_error_handler
-from games_rule_api.routers import games, health, settings
+from games_rule_api.dependencies.health import get_monitor
+from games_rule_api.exceptions.exceptions import (
+    circuit_open_handler,
+    integrity_error_handler,
+    overloaded_handler,
+)
+from games_rule_api.middleware.metrics import metrics_middleware
+from games_rule_api.routers import games, health, metrics, settings
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Dependency checks run in the background for the life of the process;
+    # registering them creates the engines, which close again on shutdown
+    monitor: DependencyMonitor = get_monitor()
+    monitor.start()
+    try:
+        yield
+    finally:
+        await monitor.stop()
+        await dispose_engines()
+        metrics.mark_worker_dead()
+
+
+def create_app() -> FastAPI:
+    """
+    Build the API application.
+
+    Construction has no side effects: settings are read and engines created
+    on first use, at startup or on the first request, and the lifespan
+    disposes them on shutdown. Serve with ``games-rule-api`` (see
+    ``games_rule_api.serve``) or ``uvicorn --factory
+    games_rule_api.api.api:create_app``.
+
+    Returns:
+        Application with routes, middleware and exception handlers
+    """
+    # The question answering routes pull in numpy, the agents and the vector
+    # index; importing them here keeps them out of importing this module
+    from games_rule_api.routers import ask, chat
+
+    app: FastAPI = FastAPI(lifespan=lifespan)
+    app.add_exception_handler(IntegrityError, integrity_error_handler)
+    app.add_exception_handler(CircuitOpenError, circuit_open_handler)
+    # Refused or reset connections before the breaker opens are just as transient
+    app.add_exception_handler(ConnectionError, circuit_open_handler)
+    app.add_exception_handler(OverloadedError, overloaded_handler)
+    app.middleware("http")(metrics_middleware)
+    app.include_router(games.router)
+    app.include_router(ask.router)
+    app.include_router(chat.router)
+    app.include_router(settings.router)
+    app.include_router(health.router)
+    app.include_router(metrics.router)
+    return app
+
+
+@lru_cache
+def _default_app() -> FastAPI:
+    return create_app()
+
 
-app = FastAPI()
-app.add_exception_handler(IntegrityError, integrity_error_handler)
-app.include_router(games.router)
-app.include_router(settings.router)
-app.include_router(health.router)
+def __getattr__(name: str) -> Any:
+    # ``app`` of earlier releases (e.g. ``uvicorn games_rule_api.api.api:app``),
+    # built on first access
+    if name == "app":
+        return _default_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
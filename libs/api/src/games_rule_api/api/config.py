@@ -1,9 +1,46 @@
+from functools import lru_cache
+from typing import Any
+
 from pydantic_settings import BaseSettings
 
 
 class Settings(BaseSettings):
     app_name: str = "Game Rule API"
     debug: bool = False
+    # Dependency checks run in the background; probes read the cached result
+    health_check_interval_seconds: float = 5.0
+    health_check_timeout_seconds: float = 2.0
+    # Chat streams per process; beyond that a short queue, then 429/503
+    chat_max_concurrent: int = 32
+    chat_max_queued: int = 64
+    chat_queue_timeout_seconds: float = 2.0
+    # Cache-Control per route; responses carry ETags, so once max-age has
+    # passed clients and the CDN revalidate with a key-only query and a 304
+    game_cache_control: str = "public, max-age=60"
+    rulebooks_cache_control: str = "public, max-age=300"
+    # games-rule-api serve; worker processes use uvicorn's WEB_CONCURRENCY
+    web_concurrency: int = 1
+    serve_host: str = "0.0.0.0"  # nosec B104 - listens on the pod's interfaces
+    serve_port: int = 8000
+    # After SIGTERM, keep serving (reporting not ready) while the load
+    # balancer stops routing here, then wait this long for in-flight requests
+    serve_drain_seconds: float = 5.0
+    serve_graceful_shutdown_seconds: float = 20.0
+    # Longer than the load balancer's idle timeout, so it closes connections first
+    serve_keep_alive_seconds: int = 75
+    serve_backlog: int = 2048
+    # Restart a worker after this many requests to bound memory growth; 0 never
+    serve_max_requests: int = 0
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the API settings, read from the environment on first use."""
+    return Settings()
 
 
-settings = Settings()
+def __getattr__(name: str) -> Any:
+    # Module attribute of earlier releases, now built on first access
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
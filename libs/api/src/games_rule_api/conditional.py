@@ -0,0 +1,127 @@
+"""
+Validators and conditional GETs for resources with a version tuple.
+
+A resource's version comes from ``PostgresReader.get_version`` (a key-only
+query) or ``PostgresReader.version_of`` (a record already loaded). The
+strong ETag is a hash of that tuple and ``Last-Modified`` its latest
+timestamp, so a revalidation can be answered with 304 without loading or
+serializing the resource.
+"""
+
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+EPOCH: datetime = datetime(1970, 1, 1, tzinfo=timezone.utc)
+# Cached rows carry timestamps as ISO strings; they parse back to the same value
+DATETIME: TypeAdapter[datetime] = TypeAdapter(datetime)
+
+
+@dataclass(frozen=True)
+class Validators:
+    """ETag and Last-Modified of one version of a resource."""
+
+    etag: str
+    last_modified: Optional[datetime]
+
+    @classmethod
+    def of(cls, version: tuple[Any, ...]) -> "Validators":
+        """
+        Build validators from a version tuple.
+
+        Strings in the tuple are taken as timestamps, and naive timestamps
+        as UTC, as the database stores them.
+
+        Args:
+            version: Tuple from ``get_version`` or ``version_of``
+
+        Returns:
+            Strong ETag and the latest timestamp of the tuple
+        """
+        parts: List[str] = []
+        stamps: List[datetime] = []
+        for value in version:
+            if isinstance(value, str):
+                value = DATETIME.validate_python(value)
+            if isinstance(value, datetime):
+                if value.tzinfo is None:
+                    value = value.replace(tzinfo=timezone.utc)
+                stamps.append(value)
+                value = (value - EPOCH) // timedelta(microseconds=1)
+            parts.append("" if value is None else str(value))
+        digest: str = hashlib.blake2b(
+            ":".join(parts).encode(), digest_size=12
+        ).hexdigest()
+        return cls(etag=f'"{digest}"', last_modified=max(stamps, default=None))
+
+    def headers(self, cache_control: str) -> Dict[str, str]:
+        """
+        Response headers that let clients and caches revalidate.
+
+        Args:
+            cache_control: Cache-Control value of the route
+
+        Returns:
+            ETag, Cache-Control and, when known, Last-Modified
+        """
+        headers: Dict[str, str] = {"ETag": self.etag, "Cache-Control": cache_control}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+    def matches(self, request: Request) -> bool:
+        """
+        Check whether the client's copy is current.
+
+        ``If-None-Match`` wins over ``If-Modified-Since`` when both are sent.
+        Dates have whole-second resolution, so a change within the second of
+        the client's date goes unnoticed; clients that need better send the
+        ETag.
+
+        Args:
+            request: Incoming request
+
+        Returns:
+            True if the response can be 304 Not Modified
+        """
+        if_none_match: Optional[str] = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            tags: List[str] = [
+                tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+            ]
+            return "*" in tags or self.etag in tags
+        if_modified_since: Optional[str] = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since: datetime = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return self.last_modified.replace(microsecond=0) <= since
+
+    def not_modified(self, cache_control: str) -> Response:
+        """
+        Build the 304 response.
+
+        Args:
+            cache_control: Cache-Control value of the route
+
+        Returns:
+            Empty response carrying the validators
+        """
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers=self.headers(cache_control),
+        )
+
+
+def is_conditional(request: Request) -> bool:
+    """Return whether the request asks to revalidate a copy it holds."""
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
@@ -0,0 +1,29 @@
+from functools import lru_cache
+from typing import Optional
+
+from games_rule_agents.answer_cache import SemanticAnswerCache
+from games_rule_agents.config import AgentSettings, get_agent_settings
+from games_rule_agents.llm import create_llm
+from games_rule_agents.qa import QuestionAnswerer
+from games_rule_core.postgres.session import get_session_maker
+
+from games_rule_api.dependencies.retrieval import get_embedder, get_retriever
+
+
+@lru_cache
+def get_answerer() -> QuestionAnswerer:
+    """Return the process-wide question answerer and its answer cache."""
+    settings: AgentSettings = get_agent_settings()
+    cache: Optional[SemanticAnswerCache] = (
+        SemanticAnswerCache.from_settings(settings)
+        if settings.answer_cache_enabled
+        else None
+    )
+    return QuestionAnswerer(
+        get_session_maker(),
+        get_retriever(),
+        create_llm(settings),
+        get_embedder(),
+        cache,
+        settings,
+    )
@@ -0,0 +1,10 @@
+from functools import lru_cache
+
+from games_rule_core.cache.cache import ReadThroughCache
+from games_rule_core.cache.config import get_cache_settings
+
+
+@lru_cache
+def get_cache() -> ReadThroughCache:
+    """Return the process-wide read-through cache built from settings."""
+    return ReadThroughCache.from_settings(get_cache_settings())
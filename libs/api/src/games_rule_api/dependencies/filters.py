@@ -0,0 +1,43 @@
+from typing import List, Optional
+
+from fastapi import HTTPException, Query
+from games_rule_core.postgres.reader.filters import GameFilter
+from pydantic import ValidationError
+
+
+def get_game_filter(
+    players: Optional[int] = Query(default=None, description="Playable with N"),
+    max_playtime: Optional[int] = Query(default=None, description="Minutes, at most"),
+    min_playtime: Optional[int] = Query(default=None, description="Minutes, at least"),
+    age: Optional[int] = Query(default=None, description="Suitable for this age"),
+    min_complexity: Optional[float] = None,
+    max_complexity: Optional[float] = None,
+    min_year: Optional[int] = None,
+    max_year: Optional[int] = None,
+    types_all: List[str] = Query(default=[], description="Has every type"),
+    types_any: List[str] = Query(default=[], description="Has any of the types"),
+    mechanics_all: List[str] = Query(default=[], description="Has every mechanic"),
+    mechanics_any: List[str] = Query(default=[], description="Has any mechanic"),
+    publisher: List[str] = Query(default=[]),
+    designer: List[str] = Query(default=[]),
+) -> GameFilter:
+    """Collect catalogue filter query parameters into a GameFilter."""
+    try:
+        return GameFilter(
+            players=players,
+            max_playtime=max_playtime,
+            min_playtime=min_playtime,
+            age=age,
+            min_complexity=min_complexity,
+            max_complexity=max_complexity,
+            min_year=min_year,
+            max_year=max_year,
+            types_all=types_all,
+            types_any=types_any,
+            mechanics_all=mechanics_all,
+            mechanics_any=mechanics_any,
+            publisher=publisher,
+            designer=designer,
+        )
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False))
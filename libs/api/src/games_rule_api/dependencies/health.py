@@ -0,0 +1,33 @@
+from functools import lru_cache
+
+from games_rule_core.health import DependencyMonitor, engine_check
+from games_rule_core.postgres.session import (
+    breakers,
+    get_engine,
+    get_replica_engines,
+)
+
+from games_rule_api.api.config import Settings, get_settings
+
+
+@lru_cache
+def get_monitor() -> DependencyMonitor:
+    """Return the process-wide dependency monitor with its checks registered."""
+    settings: Settings = get_settings()
+    monitor: DependencyMonitor = DependencyMonitor(
+        interval=settings.health_check_interval_seconds,
+        timeout=settings.health_check_timeout_seconds,
+    )
+    monitor.register(
+        "postgres", engine_check(get_engine()), breaker=breakers["primary"]
+    )
+    # Reads fall back to the primary, so a lost replica doesn't make the pod unready
+    for index, engine in enumerate(get_replica_engines()):
+        name: str = f"replica-{index}"
+        monitor.register(
+            f"postgres-{name}",
+            engine_check(engine),
+            critical=False,
+            breaker=breakers[name],
+        )
+    return monitor
@@ -0,0 +1,17 @@
+from functools import lru_cache
+
+from games_rule_core.limiter import ConcurrencyLimiter
+
+from games_rule_api.api.config import Settings, get_settings
+
+
+@lru_cache
+def get_chat_limiter() -> ConcurrencyLimiter:
+    """Return the process-wide limiter on concurrent chat streams."""
+    settings: Settings = get_settings()
+    return ConcurrencyLimiter(
+        "chat",
+        max_concurrent=settings.chat_max_concurrent,
+        max_queued=settings.chat_max_queued,
+        queue_timeout=settings.chat_queue_timeout_seconds,
+    )
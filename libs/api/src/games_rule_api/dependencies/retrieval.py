@@ -0,0 +1,24 @@
+from functools import lru_cache
+
+from games_rule_core.postgres.session import get_session_maker
+from games_rule_core.retrieval.config import get_retrieval_settings
+from games_rule_core.retrieval.hybrid import HybridRetriever
+from games_rule_vector.config import get_vector_settings
+from games_rule_vector.embed import Embedder, create_embedder
+from games_rule_vector.searcher import IndexSearcher
+
+
+@lru_cache
+def get_embedder() -> Embedder:
+    """Return the process-wide question embedder; models load once."""
+    return create_embedder(get_vector_settings())
+
+
+@lru_cache
+def get_retriever() -> HybridRetriever:
+    """Return the process-wide hybrid retriever over Postgres and the vector index."""
+    return HybridRetriever(
+        get_session_maker(),
+        IndexSearcher(get_vector_settings(), get_embedder()),
+        get_retrieval_settings(),
+    )
@@ -1,5 +1,9 @@
+import math
+
 from fastapi import Request, Response, status
 from fastapi.responses import JSONResponse
+from games_rule_core.limiter import OverloadedError, QueueFullError
+from games_rule_core.postgres.breaker import CircuitOpenError
 from sqlalchemy.exc import IntegrityError
 
 
@@ -41,3 +45,34 @@ async def integrity_error_handler(
                 "msg": error_msg,
             },
         )
+
+
+async def circuit_open_handler(
+    request: Request,
+    exc: Exception,
+) -> Response:
+    """Answer 503 while the database is unreachable or its circuit breaker is open"""
+    retry_after: float = exc.retry_after if isinstance(exc, CircuitOpenError) else 1
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Database temporarily unavailable", "msg": str(exc)},
+        headers={"Retry-After": str(max(math.ceil(retry_after), 1))},
+    )
+
+
+async def overloaded_handler(
+    request: Request,
+    exc: Exception,
+) -> Response:
+    """Answer 429 when the wait queue is full and 503 when a queued request timed out"""
+    retry_after: float = exc.retry_after if isinstance(exc, OverloadedError) else 1
+    status_code: int = (
+        status.HTTP_429_TOO_MANY_REQUESTS
+        if isinstance(exc, QueueFullError)
+        else status.HTTP_503_SERVICE_UNAVAILABLE
+    )
+    return JSONResponse(
+        status_code=status_code,
+        content={"detail": "Server busy", "msg": str(exc)},
+        headers={"Retry-After": str(max(math.ceil(retry_after), 1))},
+    )
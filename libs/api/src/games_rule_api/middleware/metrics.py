@@ -0,0 +1,31 @@
+import time
+from typing import Awaitable, Callable
+
+from fastapi import Request, Response
+from prometheus_client import Histogram
+from starlette.routing import BaseRoute
+
+REQUEST_LATENCY: Histogram = Histogram(
+    "games_rule_http_request_seconds",
+    "HTTP request latency by route",
+    ["method", "route", "status"],
+)
+
+
+async def metrics_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Time each request, labelled by route template rather than raw path."""
+    started: float = time.perf_counter()
+    status: int = 500
+    try:
+        response: Response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Unmatched paths share one label so scanners can't inflate cardinality
+        route: BaseRoute | None = request.scope.get("route")
+        template: str = getattr(route, "path", "unmatched")
+        REQUEST_LATENCY.labels(request.method, template, str(status)).observe(
+            time.perf_counter() - started
+        )
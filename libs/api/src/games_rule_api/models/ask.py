@@ -0,0 +1,25 @@
+from pydantic import BaseModel, Field
+
+
+class AskRequest(BaseModel):
+    """A rules question about one game"""
+
+    question: str = Field(min_length=1, max_length=500)
+
+    class Config:
+        json_schema_extra = {"example": {"question": "How does the robber work?"}}
+
+
+class RetrieveRequest(BaseModel):
+    """A rules question to gather evidence for"""
+
+    question: str = Field(min_length=1, max_length=500)
+    limit: int = Field(default=8, ge=1, le=50)
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "question": "Can players trade during the robber phase?",
+                "limit": 8,
+            }
+        }
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, Field
+
+
+class ChatRequest(BaseModel):
+    """A rules question to answer as a stream"""
+
+    game_id: int
+    question: str = Field(min_length=1, max_length=500)
+
+    class Config:
+        json_schema_extra = {
+            "example": {"game_id": 1, "question": "How does the robber work?"}
+        }
@@ -1,3 +1,6 @@
+from typing import Dict
+
+from games_rule_core.health import DependencyStatus
 from pydantic import BaseModel
 
 
@@ -11,3 +14,10 @@ class HealthResponse(BaseModel):
         json_schema_extra = {
             "example": {"status": "ok", "message": "Service is healthy"}
         }
+
+
+class ReadinessResponse(BaseModel):
+    """Readiness with the cached status of each dependency"""
+
+    status: str
+    dependencies: Dict[str, DependencyStatus]
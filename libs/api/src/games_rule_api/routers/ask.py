@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, HTTPException
+from games_rule_agents.qa import Answer, QuestionAnswerer
+from games_rule_core.postgres.reader.filters import GameFilter
+from games_rule_core.retrieval.hybrid import (
+    GameNotFoundError,
+    HybridRetriever,
+    RetrievalResult,
+)
+
+from games_rule_api.dependencies.agents import get_answerer
+from games_rule_api.dependencies.filters import get_game_filter
+from games_rule_api.dependencies.retrieval import get_retriever
+from games_rule_api.models.ask import AskRequest, RetrieveRequest
+
+router = APIRouter(tags=["ask"])
+
+
+@router.post("/games/{game_id}/ask", response_model=Answer)
+async def ask(
+    game_id: int,
+    request: AskRequest,
+    answerer: QuestionAnswerer = Depends(get_answerer),
+) -> Answer:
+    """Answer a rules question; repeats of an answered question come from cache"""
+    try:
+        return await answerer.answer(game_id, request.question)
+    except GameNotFoundError:
+        raise HTTPException(status_code=404, detail="Game not found")
+
+
+@router.post("/games/{game_id}/ask/retrieve", response_model=RetrievalResult)
+async def retrieve(
+    game_id: int,
+    request: RetrieveRequest,
+    filters: GameFilter = Depends(get_game_filter),
+    retriever: HybridRetriever = Depends(get_retriever),
+) -> RetrievalResult:
+    """Cited rulebook chunks for a question; slow backends are dropped, not awaited"""
+    try:
+        return await retriever.retrieve(
+            game_id,
+            request.question,
+            limit=request.limit,
+            filters=filters.to_condition(),
+        )
+    except GameNotFoundError:
+        raise HTTPException(status_code=404, detail="Game not found")
@@ -0,0 +1,105 @@
+import json
+import logging
+from contextlib import aclosing
+from typing import Any, AsyncIterator, Dict, Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from games_rule_agents.qa import PreparedAnswer, QuestionAnswerer
+from games_rule_core.limiter import ConcurrencyLimiter, Slot
+from games_rule_core.retrieval.hybrid import GameNotFoundError
+from starlette.types import Receive, Scope, Send
+
+from games_rule_api.dependencies.agents import get_answerer
+from games_rule_api.dependencies.limits import get_chat_limiter
+from games_rule_api.models.chat import ChatRequest
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["chat"])
+
+
+class SlotStreamingResponse(StreamingResponse):
+    """Streaming response that gives its limiter slot back however it ends."""
+
+    def __init__(self, content: AsyncIterator[str], slot: Slot, **kwargs: Any) -> None:
+        super().__init__(content, **kwargs)
+        self.slot: Slot = slot
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # Covers a stream cancelled before its first event was pulled
+            self.slot.release()
+
+
+def server_sent_event(event: str, data: Dict[str, Any]) -> str:
+    """Format one server-sent event with a JSON payload."""
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def answer_events(
+    answerer: QuestionAnswerer,
+    prepared: PreparedAnswer,
+    slot: Slot,
+) -> AsyncIterator[str]:
+    """
+    Stream a prepared answer as ``citations``, ``token``... and ``done`` events.
+
+    Each event is awaited into the transport before the next token is
+    pulled, so a slow reader slows generation rather than buffering it.
+    When the client goes away Starlette cancels the stream, which closes
+    the model's token iterator. The slot is given back however it ends.
+    """
+    try:
+        yield server_sent_event(
+            "citations",
+            {
+                "citations": [c.model_dump() for c in prepared.citations],
+                "cached": prepared.cached,
+                "partial": prepared.partial,
+            },
+        )
+        async with aclosing(answerer.stream(prepared)) as tokens:
+            async for token in tokens:
+                yield server_sent_event("token", {"text": token})
+        yield server_sent_event("done", {"cached": prepared.cached})
+    except Exception:
+        # Headers are already sent; report in-band and end the stream
+        logger.exception("Chat generation failed for game %s", prepared.game_id)
+        yield server_sent_event("error", {"detail": "Generation failed"})
+    finally:
+        slot.release()
+
+
+@router.post(
+    "/chat",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}},
+        429: {"description": "Every chat slot is busy and the queue is full"},
+        503: {"description": "No chat slot freed up in time"},
+    },
+)
+async def chat(
+    request: ChatRequest,
+    answerer: QuestionAnswerer = Depends(get_answerer),
+    limiter: ConcurrencyLimiter = Depends(get_chat_limiter),
+) -> StreamingResponse:
+    """Stream an answer as server-sent events; no database session is held while generating"""
+    slot: Slot = await limiter.acquire()
+    prepared: Optional[PreparedAnswer] = None
+    try:
+        prepared = await answerer.prepare(request.game_id, request.question)
+    except GameNotFoundError:
+        raise HTTPException(status_code=404, detail="Game not found")
+    finally:
+        if prepared is None:
+            slot.release()
+    return SlotStreamingResponse(
+        answer_events(answerer, prepared, slot),
+        slot,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
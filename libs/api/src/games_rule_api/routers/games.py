@@ -1,56 +1,240 @@
-from typing import List, Sequence
+from typing import Any, AsyncIterator, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from games_rule_core.cache.cache import ReadThroughCache
+from games_rule_core.cache.reader import CachedReader
 from games_rule_core.postgres.models.models import Game, GameBase, Rulebook
+from games_rule_core.postgres.reader.export import (
+    ExportFormat,
+    encode_csv,
+    encode_ndjson,
+    gzip_chunks,
+)
+from games_rule_core.postgres.reader.facets import FacetCounts, game_facets
+from games_rule_core.postgres.reader.filters import GameFilter, InvalidFilterError
+from games_rule_core.postgres.reader.pagination import (
+    InvalidCursorError,
+    InvalidSortError,
+    Page,
+)
 from games_rule_core.postgres.reader.reader import PostgresReader
-from games_rule_core.postgres.session import get_async_session
-from sqlalchemy.ext.asyncio import AsyncSession
+from games_rule_core.postgres.reader.rows import dump_page, dump_row
+from games_rule_core.postgres.reader.search import SearchHit, game_search
+from games_rule_core.postgres.session import get_unit_of_work
+from games_rule_core.postgres.unit_of_work import UnitOfWork
+from games_rule_core.postgres.writer.writer import (
+    BulkResult,
+    BulkWriter,
+    game_writer,
+)
+
+from games_rule_api.api.config import get_settings
+from games_rule_api.conditional import Validators, is_conditional
+from games_rule_api.dependencies.cache import get_cache
+from games_rule_api.dependencies.filters import get_game_filter
 
 router = APIRouter()
 
 
 @router.post("/games/", response_model=Game)
 async def create_game(
-    game: GameBase, session: AsyncSession = Depends(get_async_session)
+    game: GameBase,
+    uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+    cache: ReadThroughCache = Depends(get_cache),
 ) -> Game:
     # Convert GameBase to Game (table model)
     db_game: Game = Game.model_validate(game)
     # insert game
-    reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+    reader: CachedReader[Game] = CachedReader[Game](uow.session, Game, cache)
     return await reader.create(db_game)
 
 
-@router.get("/games/", response_model=List[Game])
+@router.post(
+    "/games/bulk",
+    response_model=BulkResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+)
+async def bulk_create_games(
+    request: Request,
+    uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+    cache: ReadThroughCache = Depends(get_cache),
+) -> BulkResult:
+    # Body is NDJSON, one game per line; read as it arrives and inserted in chunks
+    writer: BulkWriter[Game] = game_writer(uow.session, cache=cache)
+    return await writer.write(_ndjson_lines(request))
+
+
+@router.get("/games/", response_model=Page[Game])
 async def get_games(
-    session: AsyncSession = Depends(get_async_session),
-) -> Sequence[Game] | None:
-    # Fetch games from database
-    reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
-    game: Sequence[Game] | None = await reader.get_all()
-    return game  # Automatic Pydantic serialization
+    cursor: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=500),
+    sort: str = "id",
+    uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+) -> Response:
+    # Fetch one keyset page of games; follow next_cursor for the next page
+    reader: PostgresReader[Game] = PostgresReader[Game](uow.session, Game)
+    try:
+        page: Page[Dict[str, Any]] = await reader.get_rows_page(
+            limit=limit, cursor=cursor, sort=sort
+        )
+    except (InvalidCursorError, InvalidSortError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Plain rows serialized once; response_model only documents the shape
+    return Response(dump_page(page), media_type="application/json")
+
+
+@router.get("/games/search", response_model=Page[SearchHit[Game]])
+async def search_games(
+    q: Optional[str] = Query(default=None, min_length=1, max_length=200),
+    fuzzy: bool = True,
+    cursor: Optional[str] = None,
+    limit: int = Query(default=100, ge=1, le=500),
+    sort: str = "id",
+    filters: GameFilter = Depends(get_game_filter),
+    uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+) -> Page[SearchHit[Game]]:
+    # Filters compile to one statement so the array/range indexes do the work
+    try:
+        if q is not None:
+            # Ranked full-text search; results are ordered by rank, not sort
+            return await game_search(uow.session).search(
+                q, limit=limit, cursor=cursor, where=filters.to_condition(), fuzzy=fuzzy
+            )
+        reader: PostgresReader[Game] = PostgresReader[Game](uow.session, Game)
+        page: Page[Game] = await reader.get_page(
+            limit=limit, cursor=cursor, sort=sort, where=filters.to_condition()
+        )
+    except (InvalidCursorError, InvalidSortError, InvalidFilterError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Page[SearchHit[Game]](
+        items=[SearchHit[Game](item=game) for game in page.items],
+        next_cursor=page.next_cursor,
+        limit=page.limit,
+        sort=page.sort,
+    )
+
+
+@router.get("/games/facets", response_model=FacetCounts)
+async def get_game_facets(
+    filters: GameFilter = Depends(get_game_filter),
+    uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+) -> FacetCounts:
+    # Counts per type, mechanic, player count and playtime in one statement
+    try:
+        return await game_facets(uow.session).count(filters.to_condition())
+    except InvalidFilterError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/games/export", response_class=StreamingResponse)
+async def export_games(
+    format: ExportFormat = "ndjson",
+    gzip: bool = False,
+    sort: str = "id",
+    filters: GameFilter = Depends(get_game_filter),
+    # Request scope: rows are still being read while the response streams
+    uow: UnitOfWork = Depends(get_unit_of_work),
+) -> StreamingResponse:
+    # Rows come from a server-side cursor, so memory stays flat for any size
+    reader: PostgresReader[Game] = PostgresReader[Game](uow.session, Game)
+    rows: AsyncIterator[Game] = reader.stream(sort=sort, where=filters.to_condition())
+    try:
+        # Start the query now so bad sort/filter input fails before streaming
+        first: Optional[Game] = await anext(rows, None)
+    except (InvalidSortError, InvalidFilterError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def all_rows() -> AsyncIterator[Game]:
+        if first is None:
+            return
+        yield first
+        async for game in rows:
+            yield game
+
+    body: AsyncIterator[bytes] = (
+        encode_csv(all_rows(), Game) if format == "csv" else encode_ndjson(all_rows())
+    )
+    headers: dict[str, str] = {
+        "Content-Disposition": f'attachment; filename="games.{format}"'
+    }
+    if gzip:
+        body = gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+    media_type: str = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(body, media_type=media_type, headers=headers)
 
 
 @router.get("/games/{game_id}", response_model=Game)
 async def get_game(
-    game_id: int, session: AsyncSession = Depends(get_async_session)
-) -> Game:
-    # Fetch game from DB
-    reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
-    game: Game | None = await reader.get_by_id(game_id)
+    game_id: int,
+    request: Request,
+    uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+    cache: ReadThroughCache = Depends(get_cache),
+) -> Response:
+    # Fetch game from cache, falling back to the DB on a miss
+    reader: CachedReader[Game] = CachedReader[Game](uow.session, Game, cache)
+    if is_conditional(request):
+        # Revalidate from the cache entry, or read updated_at alone on a miss
+        version: Optional[tuple[Any, ...]] = await reader.get_version(game_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Game not found")
+        current: Validators = Validators.of(version)
+        if current.matches(request):
+            return current.not_modified(get_settings().game_cache_control)
+    game: Dict[str, Any] | None = await reader.get_row(game_id)
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
-    return game  # Automatic Pydantic serialization
+    validators: Validators = Validators.of(reader.version_of(game))
+    return Response(
+        dump_row(game),
+        media_type="application/json",
+        headers=validators.headers(get_settings().game_cache_control),
+    )
 
 
 @router.get("/games/{game_id}/rulebooks", response_model=List[Rulebook])
 async def get_game_with_rulebooks(
-    game_id: int, session: AsyncSession = Depends(get_async_session)
-) -> List[Rulebook]:
-    # Fetch game with eager-loaded rulebooks using selectinload
-    game_reader: PostgresReader[Game] = PostgresReader[Game](session, Game)
+    game_id: int,
+    request: Request,
+    response: Response,
+    uow: UnitOfWork = Depends(get_unit_of_work, scope="function"),
+    cache: ReadThroughCache = Depends(get_cache),
+) -> List[Rulebook] | Response:
+    # Fetch game with eager-loaded rulebooks; cached until a rulebook changes
+    game_reader: CachedReader[Game] = CachedReader[Game](uow.session, Game, cache)
+    if is_conditional(request):
+        version: Optional[tuple[Any, ...]] = await game_reader.get_version(
+            game_id, "rulebooks"
+        )
+        if version is None:
+            raise HTTPException(status_code=404, detail="Game not found")
+        current: Validators = Validators.of(version)
+        if current.matches(request):
+            return current.not_modified(get_settings().rulebooks_cache_control)
     game: Game | None = await game_reader.get_with_relations(game_id, "rulebooks")
 
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
 
+    validators: Validators = Validators.of(game_reader.version_of(game, "rulebooks"))
+    response.headers.update(validators.headers(get_settings().rulebooks_cache_control))
     return list(game.rulebooks)
+
+
+async def _ndjson_lines(request: Request) -> AsyncIterator[bytes]:
+    # Split the streamed body on newlines without buffering the whole upload
+    buffer: bytes = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
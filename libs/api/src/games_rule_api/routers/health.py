@@ -1,34 +1,35 @@
-from fastapi import APIRouter
+from typing import Dict
 
-from games_rule_api.models.health import HealthResponse
+from fastapi import APIRouter, Depends, Response, status
+from games_rule_core.health import DependencyMonitor, DependencyStatus
+
+from games_rule_api.dependencies.health import get_monitor
+from games_rule_api.models.health import HealthResponse, ReadinessResponse
 
 router = APIRouter(tags=["health"])
 
 
-@router.get("/health/ready")
-@router.get("/health/live")
+@router.get("/health/live", response_model=HealthResponse)
 @router.get("/health", response_model=HealthResponse)
 async def health_check() -> HealthResponse:
-    """Simple health check endpoint"""
+    """Liveness: the process is serving; dependencies are deliberately not checked"""
     return HealthResponse(status="ok", message="Service is healthy")
 
 
-# @router.get("/health/live")
-# async def liveness():
-#     # Simple check - is the process running?
-#     return {"status": "alive"}
-
-
-# @router.get("/health/ready")
-# async def readiness():
-#     # Check if dependencies are available
-#     try:
-#         # Check PostgreSQL
-#         await db.execute("SELECT 1")
-#         # Check Weaviate
-#         await weaviate_client.is_ready()
-#         # Check MinIO
-#         await minio_client.bucket_exists("game-rules")
-#         return {"status": "ready"}
-#     except Exception:
-#         raise HTTPException(status_code=503, detail="Not ready")
+@router.get(
+    "/health/ready",
+    response_model=ReadinessResponse,
+    responses={503: {"model": ReadinessResponse}},
+)
+async def readiness(
+    response: Response, monitor: DependencyMonitor = Depends(get_monitor)
+) -> ReadinessResponse:
+    """Readiness from cached background checks, so the probe never blocks on I/O"""
+    dependencies: Dict[str, DependencyStatus] = monitor.status()
+    ready: bool = all(dep.ok for dep in dependencies.values() if dep.critical)
+    if monitor.draining or not ready:
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    state: str = "ready" if ready else "unavailable"
+    return ReadinessResponse(
+        status="draining" if monitor.draining else state, dependencies=dependencies
+    )
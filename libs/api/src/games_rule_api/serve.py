@@ -0,0 +1,122 @@
+"""
+Serve the API with one or more uvicorn worker processes.
+
+    games-rule-api                 # WEB_CONCURRENCY workers, default 1
+    games-rule-api --workers 4 --port 8080
+
+The parent binds the socket and supervises the workers, replacing any that
+die. Each worker runs ``create_app`` on uvloop and httptools where they are
+installed, and sizes its database pools from ``POSTGRES_CONNECTION_BUDGET``
+for the number of workers started here, so adding workers does not add
+connections.
+
+On SIGTERM a worker first reports not ready for ``SERVE_DRAIN_SECONDS``
+while still serving, so load balancers stop routing to the pod before it
+closes its socket, then waits up to ``SERVE_GRACEFUL_SHUTDOWN_SECONDS`` for
+in-flight requests. A second SIGTERM, or SIGINT, skips the drain.
+"""
+
+import argparse
+import logging
+import os
+import signal
+import sys
+import tempfile
+import threading
+from types import FrameType
+from typing import Optional
+
+import uvicorn
+from games_rule_core.postgres.config import get_settings as get_db_settings
+from uvicorn.supervisors import Multiprocess
+
+from games_rule_api.api.config import Settings, get_settings
+from games_rule_api.dependencies.health import get_monitor
+
+logger = logging.getLogger("uvicorn.error")
+
+APP: str = "games_rule_api.api.api:create_app"
+
+
+class DrainingServer(uvicorn.Server):
+    """uvicorn server that stops reporting ready before it shuts down."""
+
+    def __init__(self, config: uvicorn.Config, drain_seconds: float) -> None:
+        """
+        Initialize server.
+
+        Args:
+            config: uvicorn configuration
+            drain_seconds: Time between SIGTERM and closing the socket
+        """
+        super().__init__(config)
+        self.drain_seconds: float = drain_seconds
+        self.draining: bool = False
+
+    def handle_exit(self, sig: int, frame: Optional[FrameType]) -> None:
+        if sig != signal.SIGTERM or self.draining or self.drain_seconds <= 0:
+            super().handle_exit(sig, frame)
+            return
+        self.draining = True
+        get_monitor().drain()
+        logger.info("Draining for %.1fs before shutting down", self.drain_seconds)
+        timer: threading.Timer = threading.Timer(
+            self.drain_seconds, self._shut_down, (sig, frame)
+        )
+        timer.daemon = True
+        timer.start()
+
+    def _shut_down(self, sig: int, frame: Optional[FrameType]) -> None:
+        if not self.should_exit:
+            super().handle_exit(sig, frame)
+
+
+def main() -> int:
+    settings: Settings = get_settings()
+    parser = argparse.ArgumentParser(description="Serve the games rule API.")
+    parser.add_argument("--workers", type=int, default=settings.web_concurrency)
+    parser.add_argument("--host", default=settings.serve_host)
+    parser.add_argument("--port", type=int, default=settings.serve_port)
+    args = parser.parse_args()
+
+    # Workers inherit the environment; they size their pools by WEB_CONCURRENCY
+    # and, with several workers, write metrics where /metrics can merge them
+    os.environ["WEB_CONCURRENCY"] = str(args.workers)
+    if args.workers > 1 and "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(
+            prefix="games-rule-api-metrics-"
+        )
+
+    config: uvicorn.Config = uvicorn.Config(
+        APP,
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        loop="auto",
+        http="auto",
+        backlog=settings.serve_backlog,
+        timeout_keep_alive=settings.serve_keep_alive_seconds,
+        timeout_graceful_shutdown=int(settings.serve_graceful_shutdown_seconds),
+        limit_max_requests=settings.serve_max_requests or None,
+    )
+    # Fails here, not in every worker, when the budget is too small
+    pool_size, max_overflow = get_db_settings().pool_sizes
+    logger.info(
+        "%d worker(s), each with %d pooled + %d overflow connections per server",
+        args.workers,
+        pool_size,
+        max_overflow,
+    )
+
+    server: DrainingServer = DrainingServer(config, settings.serve_drain_seconds)
+    if args.workers > 1:
+        Multiprocess(config, target=server.run, sockets=[config.bind_socket()]).run()
+        return 0
+    server.run()
+    # uvicorn's exit code when startup (e.g. the lifespan) failed
+    return 0 if server.started else 3
+
+
+if __name__ == "__main__":
+    sys.exit(main())
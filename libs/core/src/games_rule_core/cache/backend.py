@@ -0,0 +1,110 @@
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Protocol, Tuple
+
+
+class CacheBackend(Protocol):
+    """Byte-oriented key/value store with per-entry expiry."""
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """Return the value for key, or None if missing or expired."""
+        ...
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store value for ttl seconds."""
+        ...
+
+    async def delete(self, *keys: str) -> None:
+        """Remove keys if present."""
+        ...
+
+    async def close(self) -> None:
+        """Release any connections held by the backend."""
+        ...
+
+
+class MemoryBackend:
+    """
+    In-process LRU cache with per-entry TTL.
+
+    Used as the per-replica cache and as the stand-in for a shared backend in
+    tests, since it implements the same interface as ``RedisBackend``.
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries: Entries kept before least recently used ones are evicted
+        """
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[str, Tuple[float, bytes]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry: Optional[Tuple[float, bytes]] = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def close(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class RedisBackend:
+    """
+    Shared cache backed by Redis so every API replica sees the same entries.
+
+    Requires the optional ``redis`` dependency (``games_rule_core[redis]``).
+    Eviction is left to the server's ``maxmemory-policy`` (e.g. allkeys-lru).
+    """
+
+    def __init__(self, url: str, prefix: str = "games_rule:") -> None:
+        """
+        Initialize a client for the given Redis URL.
+
+        Args:
+            url: Redis connection URL, e.g. ``redis://cache:6379/0``
+            prefix: Namespace prepended to every key
+        """
+        try:
+            from redis.asyncio import Redis
+        except ImportError as e:
+            raise ImportError(
+                "RedisBackend requires the 'redis' extra: "
+                "pip install 'games_rule_core[redis]'"
+            ) from e
+        self.prefix: str = prefix
+        self._client: Any = Redis.from_url(url)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value: Optional[bytes] = await self._client.get(self.prefix + key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._client.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._client.delete(*(self.prefix + key for key in keys))
+
+    async def close(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,152 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Iterable, Optional
+
+from games_rule_core.cache.backend import CacheBackend, MemoryBackend, RedisBackend
+from games_rule_core.cache.config import CacheSettings
+
+
+class ReadThroughCache:
+    """
+    Read-through cache with per-table TTLs and single-flight loading.
+
+    Concurrent misses for the same key in this process share one load, so a
+    burst of requests for a cold game issues a single database query.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        default_ttl: float = 300.0,
+        ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        Initialize cache over a backend.
+
+        Args:
+            backend: Storage for serialized entries
+            default_ttl: Seconds an entry lives when its table has no override
+            ttls: Per-table TTL overrides keyed by table name
+        """
+        self.backend: CacheBackend = backend
+        self.default_ttl: float = default_ttl
+        self.ttls: Dict[str, float] = dict(ttls or {})
+        self.hits: int = 0
+        self.misses: int = 0
+        self._inflight: Dict[str, asyncio.Future[Optional[bytes]]] = {}
+        # Bumped on every invalidation so loads that raced a write are not stored
+        self._epoch: int = 0
+
+    @classmethod
+    def from_settings(cls, settings: CacheSettings) -> "ReadThroughCache":
+        """
+        Build a cache from settings.
+
+        Args:
+            settings: Cache settings
+
+        Returns:
+            Cache using the configured backend
+        """
+        backend: CacheBackend
+        if settings.backend == "redis":
+            if not settings.redis_url:
+                raise ValueError("CACHE_REDIS_URL is required for the redis backend")
+            backend = RedisBackend(settings.redis_url)
+        else:
+            backend = MemoryBackend(settings.max_entries)
+        return cls(backend, settings.default_ttl_seconds, settings.ttl_seconds)
+
+    def ttl_for(self, table: str) -> float:
+        """Return the TTL in seconds for entries of a table."""
+        return self.ttls.get(table, self.default_ttl)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Return the cached value for key without loading it on a miss.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Serialized value, or None if nothing is cached
+        """
+        cached: Optional[bytes] = await self.backend.get(key)
+        if cached is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return cached
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[bytes]]],
+        ttl: float,
+    ) -> Optional[bytes]:
+        """
+        Return the cached value for key, loading and storing it on a miss.
+
+        Args:
+            key: Cache key
+            loader: Coroutine producing the serialized value, or None if absent
+            ttl: Seconds to keep a loaded value
+
+        Returns:
+            Serialized value, or None if the loader found nothing
+        """
+        cached: Optional[bytes] = await self.backend.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        self.misses += 1
+
+        pending: Optional[asyncio.Future[Optional[bytes]]] = self._inflight.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise
+            except Exception:
+                pass
+            # The leading load failed or was cancelled; load independently
+            return await loader()
+
+        future: asyncio.Future[Optional[bytes]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        epoch: int = self._epoch
+        try:
+            value: Optional[bytes] = await loader()
+            if value is not None and epoch == self._epoch:
+                await self.backend.set(key, value, ttl)
+            future.set_result(value)
+            return value
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Followers fall back to their own load; don't warn if none waited
+            future.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+    async def invalidate(self, keys: Iterable[str]) -> None:
+        """
+        Drop keys from the cache and any load racing with the write.
+
+        Args:
+            keys: Cache keys to remove
+        """
+        to_delete = list(keys)
+        self._epoch += 1
+        for key in to_delete:
+            self._inflight.pop(key, None)
+        await self.backend.delete(*to_delete)
+
+    async def close(self) -> None:
+        """Close the underlying backend."""
+        await self.backend.close()
@@ -0,0 +1,22 @@
+from functools import lru_cache
+from typing import Literal, Optional
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="CACHE_")
+
+    backend: Literal["memory", "redis"] = Field(default="memory")
+    redis_url: Optional[str] = Field(default=None)
+    max_entries: int = Field(default=10_000)
+    default_ttl_seconds: float = Field(default=300.0)
+    # Per-table overrides, e.g. CACHE_TTL_SECONDS='{"game_documents": 60}'
+    ttl_seconds: dict[str, float] = Field(default_factory=dict)
+
+
+@lru_cache
+def get_cache_settings() -> CacheSettings:
+    """Return the cache settings, read from CACHE_* on first use."""
+    return CacheSettings()
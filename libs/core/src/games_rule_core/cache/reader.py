@@ -0,0 +1,337 @@
+import json
+from itertools import combinations
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
+
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstanceState, Mapper, RelationshipProperty
+from sqlalchemy.orm.attributes import instance_state, set_committed_value
+from sqlalchemy.orm.interfaces import MANYTOONE
+from sqlmodel import SQLModel
+
+from games_rule_core.cache.cache import ReadThroughCache
+from games_rule_core.postgres.reader.pagination import CursorCodec
+from games_rule_core.postgres.reader.reader import ModelType, PostgresReader
+from games_rule_core.postgres.reader.rows import dump_row
+from games_rule_core.postgres.routing import use_primary
+from games_rule_core.postgres.unit_of_work import UnitOfWork, unit_of_work
+
+
+class CachedReader(PostgresReader[ModelType]):
+    """
+    PostgresReader whose id lookups are served through a read-through cache.
+
+    ``get_by_id``, ``get_row`` and ``get_with_relations`` are cached per
+    record, and ``get_version`` answers from those entries; ``create``,
+    ``update`` and ``delete`` invalidate the record and the relation entries
+    of any parent it belongs to (e.g. a rulebook write drops the game's
+    cached rulebook list); inside a ``UnitOfWork`` that happens once it has
+    committed. Cached instances are transient copies, never
+    shared between sessions.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        model_class: Type[ModelType],
+        cache: ReadThroughCache,
+        cursor_codec: Optional[CursorCodec] = None,
+    ) -> None:
+        """
+        Initialize reader with a session, model class and cache.
+
+        Args:
+            session: SQLAlchemy async session
+            model_class: The SQLModel class to query
+            cache: Shared read-through cache
+            cursor_codec: Codec for pagination cursors
+        """
+        super().__init__(session, model_class, cursor_codec)
+        self.cache: ReadThroughCache = cache
+        self._mapper: Mapper[ModelType] = inspect(model_class)
+
+    async def get_by_id(self, record_id: int) -> Optional[ModelType]:
+        """
+        Fetch a single record by ID, from cache when possible.
+
+        Args:
+            record_id: Primary key of the record
+
+        Returns:
+            Model instance or None if not found
+        """
+
+        async def load() -> Optional[bytes]:
+            instance: Optional[ModelType] = await PostgresReader.get_by_id(
+                self, record_id
+            )
+            return None if instance is None else self._encode(instance, ())
+
+        raw: Optional[bytes] = await self.cache.get_or_load(
+            record_key(self.model_class, record_id),
+            load,
+            self.cache.ttl_for(table_name(self.model_class)),
+        )
+        return None if raw is None else self._decode(raw)
+
+    async def get_row(self, record_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a single record by ID as a column mapping, from cache when possible.
+
+        Shares the cache entry with ``get_by_id``; values in a cached row are
+        their JSON forms (e.g. datetimes as ISO strings).
+
+        Args:
+            record_id: Primary key of the record
+
+        Returns:
+            Column values keyed by field name, or None if not found
+        """
+
+        async def load() -> Optional[bytes]:
+            row: Optional[Dict[str, Any]] = await PostgresReader.get_row(
+                self, record_id
+            )
+            return None if row is None else dump_row({"item": row, "relations": {}})
+
+        raw: Optional[bytes] = await self.cache.get_or_load(
+            record_key(self.model_class, record_id),
+            load,
+            self.cache.ttl_for(table_name(self.model_class)),
+        )
+        if raw is None:
+            return None
+        item: Dict[str, Any] = json.loads(raw)["item"]
+        return item
+
+    async def get_with_relations(
+        self, record_id: int, *relations: str
+    ) -> Optional[ModelType]:
+        """
+        Fetch record with eager-loaded relationships, from cache when possible.
+
+        Args:
+            record_id: Primary key of the record
+            relations: Names of relationships to eager load
+
+        Returns:
+            Model instance with loaded relationships or None
+        """
+
+        async def load() -> Optional[bytes]:
+            instance: Optional[ModelType] = await PostgresReader.get_with_relations(
+                self, record_id, *relations
+            )
+            return None if instance is None else self._encode(instance, relations)
+
+        raw: Optional[bytes] = await self.cache.get_or_load(
+            record_key(self.model_class, record_id, relations),
+            load,
+            self.cache.ttl_for(table_name(self.model_class)),
+        )
+        return None if raw is None else self._decode(raw)
+
+    async def get_version(
+        self, record_id: int, *relations: str
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Fetch a record's version, from its cache entry when there is one.
+
+        A cached entry is what ``get_row`` or ``get_with_relations`` would
+        return, so its version describes the response they would build; the
+        key-only query runs only on a miss.
+
+        Args:
+            record_id: Primary key of the record
+            relations: Names of one-to-many relationships to include
+
+        Returns:
+            Version tuple, or None if the record doesn't exist
+        """
+        raw: Optional[bytes] = await self.cache.get(
+            record_key(self.model_class, record_id, relations)
+        )
+        if raw is None:
+            return await super().get_version(record_id, *relations)
+        data: Dict[str, Any] = json.loads(raw)
+        return self.version_of({**data["item"], **data["relations"]}, *relations)
+
+    async def create(self, instance: ModelType) -> ModelType:
+        """
+        Create a new record and invalidate affected parent entries.
+
+        Args:
+            instance: Model instance to create
+
+        Returns:
+            Created model instance with ID
+        """
+        created: ModelType = await super().create(instance)
+        await self._invalidate(invalidation_keys(created))
+        return created
+
+    async def update(self, instance: ModelType) -> ModelType:
+        """
+        Update an existing record and invalidate its cache entries.
+
+        Instances that came from the cache are merged into the session first,
+        so they update the existing row rather than inserting a new one.
+
+        Args:
+            instance: Model instance to update
+
+        Returns:
+            Updated model instance
+        """
+        # Merging loads the current row; it must come from the primary
+        use_primary(self.session)
+        state: InstanceState[ModelType] = instance_state(instance)
+        if not state.persistent:
+            instance = await self.session.merge(instance)
+        # Collect keys before the write so a moved child clears its old parent
+        keys: Set[str] = invalidation_keys(instance, include_previous=True)
+        updated: ModelType = await super().update(instance)
+        await self._invalidate(keys | invalidation_keys(updated))
+        return updated
+
+    async def delete(self, record_id: int) -> bool:
+        """
+        Delete a record by ID and invalidate its cache entries.
+
+        Args:
+            record_id: Primary key of the record to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+        use_primary(self.session)
+        instance: Optional[ModelType] = await self.session.get(
+            self.model_class, record_id
+        )
+        if instance is None:
+            return False
+        keys: Set[str] = invalidation_keys(instance)
+        deleted: bool = await super().delete(record_id)
+        await self._invalidate(keys)
+        return deleted
+
+    async def _invalidate(self, keys: Set[str]) -> None:
+        # Dropping entries before the commit would let a concurrent read cache
+        # the old rows again, so inside a unit of work wait for its commit
+        owner: Optional[UnitOfWork] = unit_of_work(self.session)
+        if owner is None:
+            await self.cache.invalidate(keys)
+        else:
+            owner.after_commit(lambda: self.cache.invalidate(keys))
+
+    def _encode(self, instance: ModelType, relations: tuple[str, ...]) -> bytes:
+        loaded: Dict[str, Any] = {}
+        for name in relations:
+            value: Any = getattr(instance, name)
+            if isinstance(value, list):
+                loaded[name] = [child.model_dump(mode="json") for child in value]
+            else:
+                loaded[name] = None if value is None else value.model_dump(mode="json")
+        return json.dumps(
+            {"item": instance.model_dump(mode="json"), "relations": loaded},
+            separators=(",", ":"),
+        ).encode()
+
+    def _decode(self, raw: bytes) -> ModelType:
+        data: Dict[str, Any] = json.loads(raw)
+        instance: ModelType = self.model_class.model_validate(data["item"])
+        for name, value in data["relations"].items():
+            target: Type[SQLModel] = self._mapper.relationships[name].mapper.class_
+            related: Any
+            if isinstance(value, list):
+                related = [target.model_validate(child) for child in value]
+            else:
+                related = None if value is None else target.model_validate(value)
+            # Attach without change tracking so the copy stays a clean snapshot
+            set_committed_value(instance, name, related)
+        return instance
+
+
+def table_name(model_class: Type[SQLModel]) -> str:
+    """Return the table a model maps to, used as the cache namespace."""
+    mapper: Mapper[Any] = inspect(model_class)
+    return str(mapper.local_table.name)  # type: ignore[attr-defined]
+
+
+def record_key(
+    model_class: Type[SQLModel], record_id: Any, relations: tuple[str, ...] = ()
+) -> str:
+    """
+    Build the cache key for a record, optionally with eager-loaded relations.
+
+    Args:
+        model_class: The SQLModel class
+        record_id: Primary key of the record
+        relations: Names of eager-loaded relationships
+
+    Returns:
+        Cache key such as ``games:1`` or ``games:1|rulebooks``
+    """
+    key: str = f"{table_name(model_class)}:{record_id}"
+    if relations:
+        key += "|" + ",".join(sorted(set(relations)))
+    return key
+
+
+def record_keys(model_class: Type[SQLModel], record_id: Any) -> Set[str]:
+    """
+    Return every cache key a record can be stored under.
+
+    Args:
+        model_class: The SQLModel class
+        record_id: Primary key of the record
+
+    Returns:
+        The plain key plus one key per combination of relationships
+    """
+    mapper: Mapper[Any] = inspect(model_class)
+    names: List[str] = sorted(mapper.relationships.keys())
+    keys: Set[str] = {record_key(model_class, record_id)}
+    for size in range(1, len(names) + 1):
+        for combo in combinations(names, size):
+            keys.add(record_key(model_class, record_id, combo))
+    return keys
+
+
+def invalidation_keys(instance: SQLModel, include_previous: bool = False) -> Set[str]:
+    """
+    Return the cache keys a write to this instance makes stale.
+
+    Covers the record itself and, for each many-to-one relationship, the
+    parent record's entries (whose eager-loaded children include this one).
+
+    Args:
+        instance: Instance being written
+        include_previous: Also include parents referenced before pending changes
+
+    Returns:
+        Set of cache keys to invalidate
+    """
+    model_class: Type[SQLModel] = type(instance)
+    mapper: Mapper[Any] = inspect(model_class)
+    keys: Set[str] = set()
+    record_id: Any = getattr(instance, "id", None)
+    if record_id is not None:
+        keys |= record_keys(model_class, record_id)
+
+    state: InstanceState[SQLModel] = instance_state(instance)
+    relationship: RelationshipProperty[Any]
+    for relationship in mapper.relationships:
+        if relationship.direction is not MANYTOONE:
+            continue
+        parent_class: Type[SQLModel] = relationship.mapper.class_
+        for column in relationship.local_columns:
+            attribute: str = mapper.get_property_by_column(column).key
+            parent_ids: Set[Any] = {getattr(instance, attribute)}
+            if include_previous:
+                history = state.attrs[attribute].history
+                parent_ids.update(history.deleted or ())
+            for parent_id in parent_ids:
+                if parent_id is not None:
+                    keys |= record_keys(parent_class, parent_id)
+    return keys
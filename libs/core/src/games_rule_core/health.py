@@ -0,0 +1,175 @@
+import asyncio
+import logging
+import time
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from games_rule_core.postgres.breaker import CircuitBreaker
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+HealthCheck = Callable[[], Awaitable[None]]
+
+
+class DependencyStatus(BaseModel):
+    """Last known health of one dependency."""
+
+    ok: bool
+    critical: bool = True
+    latency_ms: Optional[float] = None
+    error: Optional[str] = None
+    circuit: Optional[str] = None
+    checked_at: Optional[datetime] = None
+
+
+class DependencyMonitor:
+    """
+    Runs dependency checks in the background and caches their results.
+
+    Readiness probes read ``status()`` and never wait on I/O themselves. A
+    dependency whose last result is older than ``stale_after`` counts as
+    down, so a stuck monitor cannot keep a pod marked ready.
+    """
+
+    def __init__(self, interval: float = 5.0, timeout: float = 2.0) -> None:
+        """
+        Initialize monitor.
+
+        Args:
+            interval: Seconds between check rounds
+            timeout: Seconds a single check may take before it counts as failed
+        """
+        self.interval: float = interval
+        self.timeout: float = timeout
+        self.stale_after: float = interval * 3 + timeout
+        self._checks: Dict[str, HealthCheck] = {}
+        self._critical: Dict[str, bool] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._results: Dict[str, DependencyStatus] = {}
+        self._checked_at: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task[None]] = None
+        # Set once the process is shutting down; readiness then fails
+        self.draining: bool = False
+
+    def register(
+        self,
+        name: str,
+        check: HealthCheck,
+        critical: bool = True,
+        breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        """
+        Add a dependency check.
+
+        Args:
+            name: Dependency name shown in the readiness response
+            check: Coroutine raising on failure
+            critical: Whether a failure makes the service not ready
+            breaker: Circuit breaker whose state is reported alongside
+        """
+        self._checks[name] = check
+        self._critical[name] = critical
+        if breaker is not None:
+            self._breakers[name] = breaker
+
+    def start(self) -> None:
+        """Start checking in the background; call from a running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background checks."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def drain(self) -> None:
+        """Report not ready from now on, so traffic moves away before shutdown."""
+        self.draining = True
+
+    async def check_all(self) -> None:
+        """Run every check once, concurrently, and cache the results."""
+        await asyncio.gather(*(self._check(name) for name in list(self._checks)))
+
+    def status(self) -> Dict[str, DependencyStatus]:
+        """
+        Return the cached status of every dependency.
+
+        Returns:
+            Status keyed by dependency name
+        """
+        now: float = time.monotonic()
+        statuses: Dict[str, DependencyStatus] = {}
+        for name in self._checks:
+            breaker: Optional[CircuitBreaker] = self._breakers.get(name)
+            circuit: Optional[str] = breaker.state.value if breaker else None
+            result: Optional[DependencyStatus] = self._results.get(name)
+            if result is None:
+                statuses[name] = DependencyStatus(
+                    ok=False,
+                    critical=self._critical[name],
+                    error="not checked yet",
+                    circuit=circuit,
+                )
+            elif now - self._checked_at[name] > self.stale_after:
+                statuses[name] = result.model_copy(
+                    update={"ok": False, "error": "status is stale", "circuit": circuit}
+                )
+            else:
+                statuses[name] = result.model_copy(update={"circuit": circuit})
+        return statuses
+
+    async def _run(self) -> None:
+        while True:
+            await self.check_all()
+            await asyncio.sleep(self.interval)
+
+    async def _check(self, name: str) -> None:
+        started: float = time.perf_counter()
+        error: Optional[str] = None
+        try:
+            async with asyncio.timeout(self.timeout):
+                await self._checks[name]()
+        except TimeoutError:
+            error = f"timed out after {self.timeout:.1f}s"
+        except Exception as e:
+            # First line only; driver errors append the SQL and a docs link
+            error = (str(e) or type(e).__name__).splitlines()[0]
+        previous: Optional[DependencyStatus] = self._results.get(name)
+        if error is not None and (previous is None or previous.ok):
+            logger.warning("Dependency %s is down: %s", name, error)
+        self._results[name] = DependencyStatus(
+            ok=error is None,
+            critical=self._critical[name],
+            latency_ms=round((time.perf_counter() - started) * 1000, 2),
+            error=error,
+            checked_at=datetime.now(timezone.utc),
+        )
+        self._checked_at[name] = time.monotonic()
+
+
+def engine_check(engine: AsyncEngine) -> HealthCheck:
+    """
+    Build a check that runs ``SELECT 1`` on a pooled connection.
+
+    Args:
+        engine: Engine to check
+
+    Returns:
+        Health check for ``DependencyMonitor.register``
+    """
+
+    async def check() -> None:
+        connection: AsyncConnection
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+    return check
@@ -0,0 +1,236 @@
+import re
+from typing import FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+from pydantic import BaseModel
+
+from games_rule_core.ingest.extract import PageText
+
+# Headings stay short; longer lines are body text even if they look like one
+MAX_HEADING_CHARS: int = 80
+
+_MARKDOWN_HEADING: re.Pattern[str] = re.compile(r"^#{1,6}\s+(\S.*)$")
+# "2.1 Setting up", "3. Scoring", "IV. Endgame"
+_SUBSECTION_HEADING: re.Pattern[str] = re.compile(r"^\d+(?:\.\d+)+\.?\s+\S")
+_NUMBERED_HEADING: re.Pattern[str] = re.compile(r"^(?:\d+|[IVXLC]+)\.?\s+\S")
+# Words left lowercase in title-cased headings
+_MINOR_WORDS: FrozenSet[str] = frozenset(
+    {"a", "an", "and", "as", "at", "by", "for", "in", "of", "on", "or", "the", "to"}
+)
+
+
+class Chunk(BaseModel):
+    """A section-aware slice of a document's extracted text."""
+
+    index: int
+    section: Optional[str] = None
+    page_start: int
+    page_end: int
+    # Span in the extracted text; whitespace between paragraphs is normalised
+    # in ``text``, so ``text`` may be shorter than ``char_end - char_start``
+    char_start: int
+    char_end: int
+    text: str
+
+
+class _Span(NamedTuple):
+    text: str
+    start: int
+    end: int
+    page_start: int
+    page_end: int
+    # Separator before this span: a blank line, or a newline inside a paragraph
+    joiner: str = "\n\n"
+
+
+def is_heading(line: str) -> bool:
+    """
+    Guess whether a stripped line is a section heading.
+
+    Recognises markdown headings, numbered subsections (``2.1 Setup``),
+    short numbered titles (``3. Scoring``) and short all-caps lines.
+
+    Args:
+        line: Line with surrounding whitespace removed
+
+    Returns:
+        True if the line looks like a heading
+    """
+    if not line or len(line) > MAX_HEADING_CHARS:
+        return False
+    if _MARKDOWN_HEADING.match(line):
+        return True
+    if line[-1] in ".,;:!?":
+        return False
+    if _SUBSECTION_HEADING.match(line):
+        return True
+    # A bare number is usually a list item ("1. Roll dice") unless title-cased
+    if _NUMBERED_HEADING.match(line):
+        words: List[str] = line.split()[1:]
+        return len(words) <= 6 and all(
+            word[0].isupper() or word in _MINOR_WORDS or not word[0].isalpha()
+            for word in words
+        )
+    letters: List[str] = [char for char in line if char.isalpha()]
+    return len(letters) >= 3 and all(char.isupper() for char in letters)
+
+
+class SectionChunker:
+    """
+    Split extracted text into chunks that respect section boundaries.
+
+    Paragraphs are packed into chunks of up to ``max_chars``; a heading
+    always starts a new chunk and names the section of every chunk after it.
+    Within a section, consecutive chunks share trailing paragraphs up to
+    ``overlap_chars`` so a rule split across a boundary appears whole in at
+    least one chunk. Input is consumed line by line, so memory is bounded by
+    one chunk rather than the document.
+    """
+
+    def __init__(self, max_chars: int = 1500, overlap_chars: int = 200) -> None:
+        """
+        Initialize chunker.
+
+        Args:
+            max_chars: Target maximum characters per chunk
+            overlap_chars: Characters of trailing paragraphs repeated in the
+                next chunk of the same section
+        """
+        if max_chars < 1:
+            raise ValueError("max_chars must be at least 1")
+        if not 0 <= overlap_chars < max_chars:
+            raise ValueError("overlap_chars must be between 0 and max_chars")
+        self.max_chars: int = max_chars
+        self.overlap_chars: int = overlap_chars
+
+    def chunk(self, pages: Iterable[PageText]) -> Iterator[Chunk]:
+        """
+        Chunk a document.
+
+        Args:
+            pages: Page text segments in document order, e.g. from
+                ``extract_pages``
+
+        Yields:
+            Chunks in document order, numbered from 0
+        """
+        index: int = 0
+        section: Optional[str] = None
+        current: List[_Span] = []
+        size: int = 0
+        heading_span: Optional[_Span] = None
+
+        def emit() -> Chunk:
+            return Chunk(
+                index=index,
+                section=section,
+                page_start=current[0].page_start,
+                page_end=current[-1].page_end,
+                char_start=current[0].start,
+                char_end=current[-1].end,
+                text=current[0].text
+                + "".join(span.joiner + span.text for span in current[1:]),
+            )
+
+        for span, heading in self._spans(pages):
+            if heading is not None:
+                if current:
+                    yield emit()
+                    index += 1
+                section, heading_span = heading, span
+                current, size = [span], len(span.text)
+                continue
+            # A chunk holding only its section heading still takes the next paragraph
+            if current and size + 2 + len(span.text) > self.max_chars:
+                if current != [heading_span]:
+                    yield emit()
+                    index += 1
+                    current = self._overlap(current)
+                    size = sum(len(kept.text) + 2 for kept in current)
+                    if size + len(span.text) > self.max_chars:
+                        current, size = [], 0
+            current.append(span)
+            size += len(span.text) + 2
+        if current:
+            yield emit()
+
+    def _overlap(self, spans: List[_Span]) -> List[_Span]:
+        kept: List[_Span] = []
+        size: int = 0
+        for span in reversed(spans):
+            size += len(span.text) + 2
+            if size > self.overlap_chars:
+                break
+            kept.append(span)
+        kept.reverse()
+        return kept
+
+    def _spans(
+        self, pages: Iterable[PageText]
+    ) -> Iterator[Tuple[_Span, Optional[str]]]:
+        """Yield paragraphs no longer than max_chars, with the title if a heading."""
+        offset: int = 0
+        # (stripped text, start, end, page) of the current paragraph's lines
+        lines: List[Tuple[str, int, int, int]] = []
+        # Right after a numbered list item, "2. Trade" is the next item, not a heading
+        in_list: bool = False
+        for page in pages:
+            for raw in page.text.splitlines(keepends=True):
+                line: str = raw.rstrip("\r\n\f\v")
+                text: str = line.strip()
+                start: int = offset + len(line) - len(line.lstrip())
+                offset += len(raw)
+                if not text:
+                    yield from self._paragraph(lines)
+                    lines, in_list = [], False
+                    continue
+                numbered: bool = bool(_NUMBERED_HEADING.match(text))
+                if not (in_list and numbered) and is_heading(text):
+                    yield from self._paragraph(lines)
+                    lines = []
+                    match: Optional[re.Match[str]] = _MARKDOWN_HEADING.match(text)
+                    title: str = match.group(1).strip() if match else text
+                    span = _Span(
+                        text, start, start + len(text), page.number, page.number
+                    )
+                    yield span, title
+                    in_list = False
+                    continue
+                in_list = numbered
+                lines.append((text, start, start + len(text), page.number))
+        yield from self._paragraph(lines)
+
+    def _paragraph(
+        self, lines: List[Tuple[str, int, int, int]]
+    ) -> Iterator[Tuple[_Span, Optional[str]]]:
+        if not lines:
+            return
+        if sum(len(line[0]) + 1 for line in lines) - 1 <= self.max_chars:
+            text: str = "\n".join(line[0] for line in lines)
+            yield (
+                _Span(text, lines[0][1], lines[-1][2], lines[0][3], lines[-1][3]),
+                None,
+            )
+            return
+        # Too long for one chunk: pack it line by line so chunks can overlap
+        joiner: str = "\n\n"
+        for line in lines:
+            for text, start, end, page in self._split_line(line):
+                yield _Span(text, start, end, page, page, joiner), None
+                joiner = "\n"
+
+    def _split_line(
+        self, line: Tuple[str, int, int, int]
+    ) -> Iterator[Tuple[str, int, int, int]]:
+        text, start, _, page = line
+        while len(text) > self.max_chars:
+            # Break at the last space that fits, or hard-split a giant token
+            cut: int = text.rfind(" ", 0, self.max_chars + 1)
+            if cut <= 0:
+                cut = self.max_chars
+            piece: str = text[:cut].rstrip()
+            yield piece, start, start + len(piece), page
+            skipped: int = len(text[cut:]) - len(text[cut:].lstrip())
+            start += cut + skipped
+            text = text[cut:].lstrip()
+        if text:
+            yield text, start, start + len(text), page
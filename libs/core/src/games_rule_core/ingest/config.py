@@ -0,0 +1,31 @@
+from functools import lru_cache
+from typing import Literal, Optional
+
+from pydantic import Field, SecretStr
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class IngestSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="INGEST_")
+
+    store: Literal["local", "minio"] = Field(default="local")
+    # Local store: objects live at <local_root>/<bucket>/<object path>
+    local_root: str = Field(default="./object-store")
+    minio_endpoint: Optional[str] = Field(default=None)
+    minio_access_key: Optional[str] = Field(default=None)
+    minio_secret_key: Optional[SecretStr] = Field(default=None)
+    minio_secure: bool = Field(default=True)
+
+    # Worker processes; None uses every core
+    workers: Optional[int] = Field(default=None)
+    # Target characters per chunk and characters carried over between chunks
+    chunk_chars: int = Field(default=1500)
+    chunk_overlap_chars: int = Field(default=200)
+    # Objects larger than this are spooled to disk instead of memory
+    spool_max_bytes: int = Field(default=8 * 1024 * 1024)
+
+
+@lru_cache
+def get_ingest_settings() -> IngestSettings:
+    """Return the ingestion settings, read from INGEST_* on first use."""
+    return IngestSettings()
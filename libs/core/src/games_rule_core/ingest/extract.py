@@ -0,0 +1,114 @@
+import codecs
+from typing import BinaryIO, Iterator, List, Optional
+
+from pydantic import BaseModel
+
+# Text documents are yielded in segments of whole lines up to about this size
+TEXT_SEGMENT_CHARS: int = 64 * 1024
+
+PDF_MAGIC: bytes = b"%PDF-"
+
+
+class ExtractionError(ValueError):
+    """Raised when a document's text cannot be extracted."""
+
+
+class PageText(BaseModel):
+    """
+    A run of extracted text from one page.
+
+    Joining the ``text`` of every yielded segment gives the document's
+    extracted text, which chunk offsets index into.
+    """
+
+    number: int
+    text: str
+
+
+def extract_pages(
+    source: BinaryIO, mime_type: Optional[str] = None, file_name: str = ""
+) -> Iterator[PageText]:
+    """
+    Extract text from a PDF or plain-text document page by page.
+
+    PDFs are parsed lazily from the seekable ``source``, so only the page
+    being extracted is held in memory. Anything else is decoded as UTF-8,
+    with form feeds starting a new page.
+
+    Args:
+        source: Seekable binary stream positioned at the start
+        mime_type: Declared MIME type, if known
+        file_name: Original file name, used when the MIME type is missing
+
+    Yields:
+        Page text segments in document order
+
+    Raises:
+        ExtractionError: If the PDF is unreadable or pypdf is missing
+    """
+    magic: bytes = source.read(len(PDF_MAGIC))
+    source.seek(0)
+    if (
+        magic == PDF_MAGIC
+        or mime_type == "application/pdf"
+        or file_name.lower().endswith(".pdf")
+    ):
+        yield from _pdf_pages(source)
+    else:
+        yield from _text_pages(source)
+
+
+def _pdf_pages(source: BinaryIO) -> Iterator[PageText]:
+    try:
+        from pypdf import PdfReader
+        from pypdf.errors import PyPdfError
+    except ImportError as e:
+        raise ExtractionError(
+            "PDF extraction requires the 'ingest' extra: "
+            "pip install 'games_rule_core[ingest]'"
+        ) from e
+    try:
+        reader: PdfReader = PdfReader(source)
+        for number, page in enumerate(reader.pages, start=1):
+            text: str = page.extract_text() or ""
+            # Keep pages on separate lines so offsets never merge two pages' words
+            yield PageText(
+                number=number, text=text if text.endswith("\n") else text + "\n"
+            )
+    except PyPdfError as e:
+        raise ExtractionError(f"Unreadable PDF: {e}") from e
+
+
+def _text_pages(source: BinaryIO) -> Iterator[PageText]:
+    decoder: codecs.IncrementalDecoder = codecs.getincrementaldecoder("utf-8")(
+        errors="replace"
+    )
+    number: int = 1
+    pending: str = ""
+    segment: List[str] = []
+    size: int = 0
+    while True:
+        block: bytes = source.read(TEXT_SEGMENT_CHARS)
+        pending += decoder.decode(block, final=not block)
+        # Hold back a trailing partial line until the rest of it arrives
+        lines: List[str] = pending.splitlines(keepends=True)
+        pending = (
+            lines.pop() if lines and block and not lines[-1].endswith("\n") else ""
+        )
+        for line in lines:
+            for index, part in enumerate(line.split("\f")):
+                if index:
+                    if segment:
+                        yield PageText(number=number, text="".join(segment))
+                        segment, size = [], 0
+                    number += 1
+                if part:
+                    segment.append(part)
+                    size += len(part)
+            if size >= TEXT_SEGMENT_CHARS:
+                yield PageText(number=number, text="".join(segment))
+                segment, size = [], 0
+        if not block:
+            break
+    if segment:
+        yield PageText(number=number, text="".join(segment))
@@ -0,0 +1,367 @@
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime
+from tempfile import SpooledTemporaryFile
+from typing import Any, Dict, List, Literal, Optional, Set, Tuple
+
+from pydantic import BaseModel, Field
+from sqlalchemy import Result, Select, delete, func, insert
+from sqlalchemy.dialects.postgresql import Insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlmodel import select
+
+from games_rule_core.ingest.chunker import Chunk, SectionChunker
+from games_rule_core.ingest.config import IngestSettings, get_ingest_settings
+from games_rule_core.ingest.extract import extract_pages
+from games_rule_core.ingest.store import ObjectInfo, ObjectStore, create_store
+from games_rule_core.postgres.models.models import (
+    DocumentIngestion,
+    Rulebook,
+    RuleChunk,
+)
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+IngestStatus = Literal["ingested", "unchanged", "skipped", "failed"]
+
+# Chunk rows per INSERT; asyncpg batches each executemany into one round trip
+INSERT_BATCH: int = 500
+
+
+class IngestJob(BaseModel):
+    """One rulebook to check and, if it changed, ingest."""
+
+    document_id: int
+    game_id: int
+    bucket: str
+    path: str
+    file_name: str
+    mime_type: Optional[str] = None
+    uploaded_at: Optional[datetime] = None
+    # State from the last successful ingestion, if any
+    previous_hash: Optional[str] = None
+    previous_etag: Optional[str] = None
+    previous_uploaded_at: Optional[datetime] = None
+    force: bool = False
+
+
+class IngestOutcome(BaseModel):
+    """Result of processing one job in a worker."""
+
+    document_id: int
+    status: IngestStatus
+    content_hash: Optional[str] = None
+    etag: Optional[str] = None
+    chunks: List[Chunk] = Field(default_factory=list)
+    error: Optional[str] = None
+
+
+class DocumentError(BaseModel):
+    """A rulebook that could not be ingested."""
+
+    document_id: int
+    error: str
+
+
+class IngestReport(BaseModel):
+    """Totals for one ingestion run."""
+
+    ingested: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    chunks: int = 0
+    errors: List[DocumentError] = Field(default_factory=list)
+
+
+# Per-process store, built once by the pool initializer
+_worker_store: Optional[ObjectStore] = None
+_worker_settings: Optional[IngestSettings] = None
+
+
+def _init_worker(settings: IngestSettings) -> None:
+    global _worker_store, _worker_settings
+    _worker_settings = settings
+    _worker_store = create_store(settings)
+
+
+def process_document(job: IngestJob) -> IngestOutcome:
+    """
+    Check one rulebook for changes and chunk it if needed; runs in a worker.
+
+    The object is skipped without downloading when its etag and
+    ``uploaded_at`` match the last ingestion. Otherwise it is streamed into
+    a spooled temporary file (memory up to ``spool_max_bytes``, disk beyond)
+    while hashing; an unchanged hash skips extraction.
+
+    Args:
+        job: Rulebook and its previous ingestion state
+
+    Returns:
+        Outcome with the new chunks when the content changed
+    """
+    global _worker_store, _worker_settings
+    if _worker_settings is None:
+        _worker_settings = get_ingest_settings()
+    if _worker_store is None:
+        _worker_store = create_store(_worker_settings)
+    store: ObjectStore = _worker_store
+    settings: IngestSettings = _worker_settings
+    try:
+        info: ObjectInfo = store.stat(job.bucket, job.path)
+        if (
+            not job.force
+            and job.previous_etag == info.etag
+            and job.previous_uploaded_at == job.uploaded_at
+        ):
+            return IngestOutcome(
+                document_id=job.document_id, status="skipped", etag=info.etag
+            )
+
+        digest = hashlib.sha256()
+        with SpooledTemporaryFile(max_size=settings.spool_max_bytes) as spool:
+            for block in store.iter_bytes(job.bucket, job.path):
+                digest.update(block)
+                spool.write(block)
+            content_hash: str = digest.hexdigest()
+            if not job.force and content_hash == job.previous_hash:
+                return IngestOutcome(
+                    document_id=job.document_id,
+                    status="unchanged",
+                    content_hash=content_hash,
+                    etag=info.etag,
+                )
+            spool.seek(0)
+            chunker: SectionChunker = SectionChunker(
+                settings.chunk_chars, settings.chunk_overlap_chars
+            )
+            chunks: List[Chunk] = list(
+                chunker.chunk(extract_pages(spool, job.mime_type, job.file_name))  # type: ignore[arg-type]
+            )
+    except Exception as e:
+        return IngestOutcome(
+            document_id=job.document_id,
+            status="failed",
+            error=(str(e) or type(e).__name__).splitlines()[0],
+        )
+    return IngestOutcome(
+        document_id=job.document_id,
+        status="ingested",
+        content_hash=content_hash,
+        etag=info.etag,
+        chunks=chunks,
+    )
+
+
+class RulebookIngestor:
+    """
+    Incrementally ingest rulebooks from object storage into ``rule_chunks``.
+
+    Download, extraction and chunking run on a process pool, at most
+    ``2 * workers`` documents in flight so results are written as they
+    arrive rather than buffered. Each document's chunks are replaced in one
+    transaction together with its ``document_ingestions`` row, so readers
+    never see a half-ingested rulebook.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        settings: Optional[IngestSettings] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        """
+        Initialize ingestor.
+
+        Args:
+            session_maker: Factory for sessions on the primary database
+            settings: Store, chunking and worker settings; read from the
+                environment when omitted
+            executor: Pool to run ``process_document`` on; by default a
+                process pool of ``settings.workers`` created per run
+        """
+        self.session_maker: async_sessionmaker[AsyncSession] = session_maker
+        self.settings: IngestSettings = settings or get_ingest_settings()
+        self.executor: Optional[Executor] = executor
+
+    async def plan(
+        self, game_id: Optional[int] = None, force: bool = False
+    ) -> List[IngestJob]:
+        """
+        List rulebooks with their previous ingestion state.
+
+        Every rulebook becomes a job; workers skip unchanged ones cheaply, so
+        objects replaced in storage without a database update are still seen.
+
+        Args:
+            game_id: Only rulebooks of this game
+            force: Re-ingest even if nothing changed
+
+        Returns:
+            Jobs ordered by document id
+        """
+        statement: Select[Any] = (
+            select(Rulebook, DocumentIngestion)
+            .outerjoin(
+                DocumentIngestion,
+                DocumentIngestion.document_id == Rulebook.id,  # type: ignore[arg-type]
+            )
+            .order_by(Rulebook.id)  # type: ignore[arg-type]
+        )
+        if game_id is not None:
+            statement = statement.where(Rulebook.game_id == game_id)  # type: ignore[arg-type]
+        async with self.session_maker() as session:
+            result: Result[Any] = await session.execute(statement)
+            rows: List[Tuple[Rulebook, Optional[DocumentIngestion]]] = [
+                (row[0], row[1]) for row in result.all()
+            ]
+
+        jobs: List[IngestJob] = []
+        for rulebook, state in rows:
+            assert rulebook.id is not None
+            done: bool = state is not None and state.status == "done"
+            jobs.append(
+                IngestJob(
+                    document_id=rulebook.id,
+                    game_id=rulebook.game_id,
+                    bucket=rulebook.minio_bucket,
+                    path=rulebook.minio_object_path,
+                    file_name=rulebook.file_name,
+                    mime_type=rulebook.mime_type,
+                    uploaded_at=rulebook.uploaded_at,
+                    previous_hash=state.content_hash if done and state else None,
+                    previous_etag=state.source_etag if done and state else None,
+                    previous_uploaded_at=(
+                        state.source_uploaded_at if done and state else None
+                    ),
+                    force=force,
+                )
+            )
+        return jobs
+
+    async def run(
+        self, game_id: Optional[int] = None, force: bool = False
+    ) -> IngestReport:
+        """
+        Ingest every new or changed rulebook.
+
+        Args:
+            game_id: Only rulebooks of this game
+            force: Re-ingest even if nothing changed
+
+        Returns:
+            Counts per outcome and the documents that failed
+        """
+        jobs: List[IngestJob] = await self.plan(game_id, force)
+        report: IngestReport = IngestReport()
+        if not jobs:
+            return report
+
+        workers: int = self.settings.workers or os.cpu_count() or 1
+        executor: Executor = self.executor or ProcessPoolExecutor(
+            max_workers=workers,
+            # Spawned workers share nothing with the parent's event loop or pool
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.settings,),
+        )
+        # Keep workers busy without holding every finished document in memory
+        limit: int = 2 * workers
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        by_document: Dict[int, IngestJob] = {job.document_id: job for job in jobs}
+        pending: Set[asyncio.Future[IngestOutcome]] = set()
+        queue: List[IngestJob] = list(reversed(jobs))
+        try:
+            while queue or pending:
+                while queue and len(pending) < limit:
+                    pending.add(
+                        loop.run_in_executor(executor, process_document, queue.pop())
+                    )
+                done: Set[asyncio.Future[IngestOutcome]]
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    outcome: IngestOutcome = future.result()
+                    await self._record(by_document[outcome.document_id], outcome)
+                    _tally(report, outcome)
+        finally:
+            for future in pending:
+                future.cancel()
+            if self.executor is None:
+                executor.shutdown(wait=True, cancel_futures=True)
+        report.errors.sort(key=lambda error: error.document_id)
+        return report
+
+    async def _record(self, job: IngestJob, outcome: IngestOutcome) -> None:
+        if outcome.status == "skipped":
+            return
+        async with self.session_maker() as session, session.begin():
+            if outcome.status == "ingested":
+                await session.execute(
+                    delete(RuleChunk).where(
+                        RuleChunk.document_id == job.document_id  # type: ignore[arg-type]
+                    )
+                )
+                rows: List[Dict[str, Any]] = [
+                    {
+                        "document_id": job.document_id,
+                        "game_id": job.game_id,
+                        "chunk_index": chunk.index,
+                        "section": chunk.section,
+                        "page_start": chunk.page_start,
+                        "page_end": chunk.page_end,
+                        "char_start": chunk.char_start,
+                        "char_end": chunk.char_end,
+                        "text": chunk.text,
+                    }
+                    for chunk in outcome.chunks
+                ]
+                for start in range(0, len(rows), INSERT_BATCH):
+                    await session.execute(
+                        insert(RuleChunk), rows[start : start + INSERT_BATCH]
+                    )
+            await session.execute(_state_upsert(job, outcome))
+        if outcome.status == "failed":
+            logger.warning(
+                "Ingesting document %s failed: %s", job.document_id, outcome.error
+            )
+
+
+def _state_upsert(job: IngestJob, outcome: IngestOutcome) -> Insert:
+    values: Dict[str, Any] = {
+        "document_id": job.document_id,
+        "status": "failed" if outcome.status == "failed" else "done",
+        "content_hash": outcome.content_hash,
+        "source_etag": outcome.etag,
+        "source_uploaded_at": job.uploaded_at,
+        "error": outcome.error,
+        "ingested_at": func.now(),
+    }
+    if outcome.status == "ingested":
+        values["chunk_count"] = len(outcome.chunks)
+    statement: Insert = pg_insert(DocumentIngestion).values(**values)
+    # An unchanged document keeps its chunk count; a failure keeps old chunks
+    # but clears the hash and etag so the next run retries it
+    updates: Dict[str, Any] = {
+        key: statement.excluded[key] for key in values if key != "document_id"
+    }
+    return statement.on_conflict_do_update(index_elements=["document_id"], set_=updates)
+
+
+def _tally(report: IngestReport, outcome: IngestOutcome) -> None:
+    if outcome.status == "ingested":
+        report.ingested += 1
+        report.chunks += len(outcome.chunks)
+    elif outcome.status == "unchanged":
+        report.unchanged += 1
+    elif outcome.status == "skipped":
+        report.skipped += 1
+    else:
+        report.errors.append(
+            DocumentError(document_id=outcome.document_id, error=outcome.error or "")
+        )
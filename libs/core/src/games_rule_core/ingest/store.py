@@ -0,0 +1,165 @@
+import os
+from pathlib import Path
+from typing import Any, Iterator, Protocol
+
+from pydantic import BaseModel
+
+from games_rule_core.ingest.config import IngestSettings
+
+# Bytes read from the store per request
+READ_CHUNK_BYTES: int = 1024 * 1024
+
+
+class ObjectNotFoundError(LookupError):
+    """Raised when a bucket/path pair does not name an object."""
+
+
+class ObjectInfo(BaseModel):
+    """Size and version tag of a stored object."""
+
+    size: int
+    # Changes whenever the object's content may have changed
+    etag: str
+
+
+class ObjectStore(Protocol):
+    """Read-only access to documents in object storage."""
+
+    def stat(self, bucket: str, path: str) -> ObjectInfo:
+        """Return size and version tag without reading the object."""
+        ...
+
+    def iter_bytes(self, bucket: str, path: str) -> Iterator[bytes]:
+        """Yield the object's content in bounded chunks."""
+        ...
+
+
+class LocalObjectStore:
+    """
+    Object store backed by a directory, one sub-directory per bucket.
+
+    Stand-in for MinIO in tests and local development. The etag is derived
+    from size and modification time, so touching a file marks it changed.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        """
+        Initialize store over a directory.
+
+        Args:
+            root: Directory holding one sub-directory per bucket
+        """
+        self.root: Path = Path(root).resolve()
+
+    def stat(self, bucket: str, path: str) -> ObjectInfo:
+        try:
+            result: os.stat_result = self._path(bucket, path).stat()
+        except FileNotFoundError as e:
+            raise ObjectNotFoundError(f"No object {bucket}/{path}") from e
+        return ObjectInfo(
+            size=result.st_size, etag=f"{result.st_size:x}-{result.st_mtime_ns:x}"
+        )
+
+    def iter_bytes(self, bucket: str, path: str) -> Iterator[bytes]:
+        try:
+            with open(self._path(bucket, path), "rb") as stream:
+                while chunk := stream.read(READ_CHUNK_BYTES):
+                    yield chunk
+        except FileNotFoundError as e:
+            raise ObjectNotFoundError(f"No object {bucket}/{path}") from e
+
+    def _path(self, bucket: str, path: str) -> Path:
+        resolved: Path = (self.root / bucket / path).resolve()
+        # Object paths come from the database; never let one escape the root
+        if not resolved.is_relative_to(self.root / bucket):
+            raise ObjectNotFoundError(f"No object {bucket}/{path}")
+        return resolved
+
+
+class MinioObjectStore:
+    """
+    Object store backed by MinIO or any S3-compatible server.
+
+    Requires the optional ``minio`` dependency (``games_rule_core[minio]``).
+    """
+
+    def __init__(
+        self, endpoint: str, access_key: str, secret_key: str, secure: bool = True
+    ) -> None:
+        """
+        Initialize a client for a MinIO endpoint.
+
+        Args:
+            endpoint: Host and port, e.g. ``minio:9000``
+            access_key: Access key id
+            secret_key: Secret access key
+            secure: Whether to use TLS
+        """
+        try:
+            from minio import Minio
+        except ImportError as e:
+            raise ImportError(
+                "MinioObjectStore requires the 'minio' extra: "
+                "pip install 'games_rule_core[minio]'"
+            ) from e
+        self._client: Any = Minio(
+            endpoint, access_key=access_key, secret_key=secret_key, secure=secure
+        )
+
+    def stat(self, bucket: str, path: str) -> ObjectInfo:
+        from minio.error import S3Error
+
+        try:
+            result: Any = self._client.stat_object(bucket, path)
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchBucket"):
+                raise ObjectNotFoundError(f"No object {bucket}/{path}") from e
+            raise
+        return ObjectInfo(size=result.size, etag=result.etag)
+
+    def iter_bytes(self, bucket: str, path: str) -> Iterator[bytes]:
+        from minio.error import S3Error
+
+        try:
+            response: Any = self._client.get_object(bucket, path)
+        except S3Error as e:
+            if e.code in ("NoSuchKey", "NoSuchBucket"):
+                raise ObjectNotFoundError(f"No object {bucket}/{path}") from e
+            raise
+        try:
+            yield from response.stream(READ_CHUNK_BYTES)
+        finally:
+            response.close()
+            response.release_conn()
+
+
+def create_store(settings: IngestSettings) -> ObjectStore:
+    """
+    Build the object store selected by settings.
+
+    Args:
+        settings: Ingestion settings
+
+    Returns:
+        Local or MinIO store
+
+    Raises:
+        ValueError: If the MinIO store is selected without its endpoint or keys
+    """
+    if settings.store == "minio":
+        if not (
+            settings.minio_endpoint
+            and settings.minio_access_key
+            and settings.minio_secret_key
+        ):
+            raise ValueError(
+                "INGEST_MINIO_ENDPOINT, INGEST_MINIO_ACCESS_KEY and "
+                "INGEST_MINIO_SECRET_KEY are required for the minio store"
+            )
+        return MinioObjectStore(
+            settings.minio_endpoint,
+            settings.minio_access_key,
+            settings.minio_secret_key.get_secret_value(),
+            secure=settings.minio_secure,
+        )
+    return LocalObjectStore(settings.local_root)
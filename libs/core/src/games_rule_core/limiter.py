@@ -0,0 +1,124 @@
+import asyncio
+
+from prometheus_client import Counter, Gauge
+
+LIMITER_ACTIVE: Gauge = Gauge(
+    "games_rule_limiter_active", "Slots currently held, per limiter", ["limiter"]
+)
+LIMITER_QUEUED: Gauge = Gauge(
+    "games_rule_limiter_queued", "Callers waiting for a slot, per limiter", ["limiter"]
+)
+LIMITER_REJECTED: Counter = Counter(
+    "games_rule_limiter_rejected_total",
+    "Callers turned away, by limiter and reason (queue_full, queue_timeout)",
+    ["limiter", "reason"],
+)
+
+
+class OverloadedError(RuntimeError):
+    """Raised when a limiter turns a caller away instead of letting it wait."""
+
+    def __init__(self, name: str, reason: str, retry_after: float) -> None:
+        super().__init__(
+            f"'{name}' is at capacity ({reason}); retry in {retry_after:.0f}s"
+        )
+        self.name: str = name
+        self.reason: str = reason
+        self.retry_after: float = retry_after
+
+
+class QueueFullError(OverloadedError):
+    """Every slot is busy and the wait queue is already full."""
+
+
+class QueueTimeoutError(OverloadedError):
+    """A queued caller did not get a slot within the queue timeout."""
+
+
+class Slot:
+    """A held limiter slot; releasing it more than once is harmless."""
+
+    def __init__(self, limiter: "ConcurrencyLimiter") -> None:
+        self._limiter: "ConcurrencyLimiter" = limiter
+        self._released: bool = False
+
+    def release(self) -> None:
+        """Give the slot back to the limiter."""
+        if self._released:
+            return
+        self._released = True
+        self._limiter._release()
+
+
+class ConcurrencyLimiter:
+    """
+    Bounds concurrent work in one process, with a short bounded wait queue.
+
+    Up to ``max_concurrent`` callers hold a slot at once. Beyond that, up to
+    ``max_queued`` wait at most ``queue_timeout`` seconds for one; anyone
+    else is rejected at once. Rejections are cheap and immediate, so a
+    saturated process answers 429/503 instead of letting requests pile up
+    until their clients time out.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int = 32,
+        max_queued: int = 64,
+        queue_timeout: float = 2.0,
+    ) -> None:
+        """
+        Initialize limiter.
+
+        Args:
+            name: Label used in errors and metrics
+            max_concurrent: Slots that may be held at once
+            max_queued: Callers that may wait for a slot; 0 disables waiting
+            queue_timeout: Seconds a queued caller waits before giving up
+        """
+        self.name: str = name
+        self.max_concurrent: int = max_concurrent
+        self.max_queued: int = max_queued
+        self.queue_timeout: float = queue_timeout
+        self.active: int = 0
+        self.queued: int = 0
+        self._semaphore: asyncio.Semaphore = asyncio.Semaphore(max_concurrent)
+
+    async def acquire(self) -> Slot:
+        """
+        Take a slot, waiting in the queue if every slot is busy.
+
+        Returns:
+            Slot to release once the work is finished
+
+        Raises:
+            QueueFullError: If the queue is full
+            QueueTimeoutError: If no slot freed up within ``queue_timeout``
+        """
+        if self._semaphore.locked():
+            if self.queued >= self.max_queued:
+                LIMITER_REJECTED.labels(self.name, "queue_full").inc()
+                raise QueueFullError(self.name, "queue full", self.queue_timeout)
+            self.queued += 1
+            LIMITER_QUEUED.labels(self.name).set(self.queued)
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), self.queue_timeout)
+            except TimeoutError:
+                LIMITER_REJECTED.labels(self.name, "queue_timeout").inc()
+                raise QueueTimeoutError(
+                    self.name, "queue timeout", self.queue_timeout
+                ) from None
+            finally:
+                self.queued -= 1
+                LIMITER_QUEUED.labels(self.name).set(self.queued)
+        else:
+            await self._semaphore.acquire()
+        self.active += 1
+        LIMITER_ACTIVE.labels(self.name).set(self.active)
+        return Slot(self)
+
+    def _release(self) -> None:
+        self.active -= 1
+        LIMITER_ACTIVE.labels(self.name).set(self.active)
+        self._semaphore.release()
@@ -0,0 +1,103 @@
+import logging
+import time
+from enum import Enum
+from typing import Optional
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(ConnectionError):
+    """Raised instead of connecting while a circuit breaker is open."""
+
+    def __init__(self, name: str, retry_after: float) -> None:
+        super().__init__(f"Database '{name}' unavailable; retry in {retry_after:.0f}s")
+        self.name: str = name
+        self.retry_after: float = retry_after
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Fail fast while a dependency is down instead of waiting on timeouts.
+
+    After ``failure_threshold`` consecutive failures the breaker opens and
+    every call is rejected for ``reset_timeout`` seconds. The first call after
+    that is let through as a trial: success closes the breaker, failure opens
+    it again.
+    """
+
+    def __init__(
+        self, name: str, failure_threshold: int = 5, reset_timeout: float = 10.0
+    ) -> None:
+        """
+        Initialize a closed breaker.
+
+        Args:
+            name: Dependency name used in errors and logs
+            failure_threshold: Consecutive failures that open the breaker
+            reset_timeout: Seconds to reject calls before allowing a trial
+        """
+        self.name: str = name
+        self.failure_threshold: int = failure_threshold
+        self.reset_timeout: float = reset_timeout
+        self.failures: int = 0
+        self._opened_at: Optional[float] = None
+        # Start of the in-flight half-open trial; a lost trial expires after reset_timeout
+        self._trial_started: Optional[float] = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Current breaker state."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if time.monotonic() - self._opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    def before_call(self) -> None:
+        """
+        Check whether a call may proceed.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with a
+                trial call already in flight
+        """
+        state: CircuitState = self.state
+        if state is CircuitState.CLOSED:
+            return
+        now: float = time.monotonic()
+        if state is CircuitState.HALF_OPEN and (
+            self._trial_started is None
+            or now - self._trial_started >= self.reset_timeout
+        ):
+            self._trial_started = now
+            return
+        assert self._opened_at is not None
+        remaining: float = self.reset_timeout - (now - self._opened_at)
+        raise CircuitOpenError(self.name, max(remaining, 0.0))
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful call."""
+        if self._opened_at is not None:
+            logger.info("Circuit for %s closed", self.name)
+        self.failures = 0
+        self._opened_at = None
+        self._trial_started = None
+
+    def record_failure(self) -> None:
+        """Count a failed call, opening the breaker at the threshold."""
+        self.failures += 1
+        if self.failures < self.failure_threshold:
+            return
+        if self._opened_at is None:
+            logger.warning(
+                "Circuit for %s opened after %d failures", self.name, self.failures
+            )
+        # Re-opening restarts the wait, including after a failed trial
+        self._opened_at = time.monotonic()
+        self._trial_started = None
@@ -1,4 +1,7 @@
-from pydantic import Field
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,6 +14,50 @@ class Settings(BaseSettings):
     postgres_port: int = Field(default=5432)
     postgres_db: str = Field(default=...)
 
+    # Read replicas as "host" or "host:port", e.g. '["postgres-ro"]'
+    postgres_replica_hosts: List[str] = Field(default_factory=list)
+    # Replicas further behind the primary than this are skipped for reads
+    postgres_replica_max_lag_seconds: float = Field(default=10.0)
+    postgres_replica_check_interval_seconds: float = Field(default=5.0)
+
+    # Connections one process keeps open, and opens beyond that under load
+    postgres_pool_size: int = Field(default=20)
+    postgres_max_overflow: int = Field(default=10)
+    # Connections every API process together may open to each server. When
+    # set, each process gets an equal share, split between pool and overflow
+    # in the ratio above, instead of the fixed sizes.
+    postgres_connection_budget: Optional[int] = Field(default=None)
+    # Pods sharing the budget; with autoscaling, the most there can be
+    postgres_budget_pods: int = Field(default=1)
+    # Worker processes per pod (uvicorn's variable, set by games-rule-api serve)
+    web_concurrency: int = Field(default=1)
+
+    # Fail connects fast; the breaker then rejects checkouts while the DB is down
+    postgres_connect_timeout_seconds: float = Field(default=5.0)
+    postgres_breaker_failure_threshold: int = Field(default=5)
+    postgres_breaker_reset_seconds: float = Field(default=10.0)
+
+    # Log every statement; for local debugging only, it costs throughput
+    postgres_echo: bool = Field(default=False)
+    # Statements slower than this are logged at WARNING; unset disables the log
+    postgres_slow_query_ms: Optional[float] = Field(default=500.0)
+
+    # Built statements PostgresReader reuses across calls of the same shape
+    postgres_statement_cache_size: int = Field(default=500)
+    # asyncpg prepared statements kept per connection (SQLAlchemy's default is
+    # 100); 0 prepares each statement afresh
+    postgres_prepared_statement_cache_size: int = Field(default=500)
+    # Connecting through PgBouncer in transaction pooling mode: prepared
+    # statements get unique names, since consecutive transactions may land on
+    # different server connections. Needs PgBouncer >= 1.21 with
+    # max_prepared_statements set; otherwise also set the cache size to 0.
+    postgres_pgbouncer: bool = Field(default=False)
+
+    # Signs keyset pagination cursors; shared by every process serving them.
+    # When unset each process picks a random key, so cursors only work
+    # against the process that issued them
+    cursor_secret: Optional[SecretStr] = Field(default=None)
+
     @property
     def database_url(self) -> str:
         return (
@@ -19,5 +66,47 @@ class Settings(BaseSettings):
             f"{self.postgres_port}/{self.postgres_db}"
         )
 
+    @property
+    def pool_sizes(self) -> Tuple[int, int]:
+        """Pool size and max overflow of this process's engines."""
+        if self.postgres_connection_budget is None:
+            return self.postgres_pool_size, self.postgres_max_overflow
+        processes: int = self.postgres_budget_pods * self.web_concurrency
+        share: int = self.postgres_connection_budget // processes
+        if share < 1:
+            raise ValueError(
+                f"POSTGRES_CONNECTION_BUDGET={self.postgres_connection_budget} "
+                f"leaves no connection for each of {processes} processes"
+            )
+        size: int = max(
+            1,
+            share
+            * self.postgres_pool_size
+            // (self.postgres_pool_size + self.postgres_max_overflow),
+        )
+        return size, share - size
+
+    @property
+    def replica_urls(self) -> List[str]:
+        urls: List[str] = []
+        for host in self.postgres_replica_hosts:
+            address: str = host if ":" in host else f"{host}:{self.postgres_port}"
+            urls.append(
+                f"postgresql+asyncpg://{self.postgres_user}:"
+                f"{self.postgres_password}@{address}/{self.postgres_db}"
+            )
+        return urls
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, read from the environment on first use."""
+    return Settings()
+
 
-settings = Settings()
+def __getattr__(name: str) -> Any:
+    # ``settings`` resolves on first access, so importing this module never
+    # reads the environment; new code calls get_settings()
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
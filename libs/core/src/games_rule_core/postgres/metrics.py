@@ -0,0 +1,176 @@
+import functools
+import logging
+import time
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    List,
+    Optional,
+    ParamSpec,
+    TypeVar,
+)
+
+from prometheus_client import Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext, ExecutionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import ConnectionPoolEntry, QueuePool
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+READER_LATENCY: Histogram = Histogram(
+    "games_rule_reader_seconds",
+    "Latency of PostgresReader methods",
+    ["model", "method"],
+)
+POOL_CHECKOUT_WAIT: Histogram = Histogram(
+    "games_rule_db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+CONNECTION_HELD: Histogram = Histogram(
+    "games_rule_db_connection_held_seconds",
+    "Time a connection stays checked out of the pool",
+    ["engine"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 10, 60),
+)
+QUERY_LATENCY: Histogram = Histogram(
+    "games_rule_db_query_seconds",
+    "Database statement execution time",
+    ["engine"],
+)
+
+
+# Set on pool events rather than read at scrape time, so that under several
+# worker processes /metrics merges every worker's pools, not just its own
+POOL_SIZE: Gauge = Gauge(
+    "games_rule_db_pool_size",
+    "Configured pool size",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+POOL_IN_USE: Gauge = Gauge(
+    "games_rule_db_pool_in_use",
+    "Connections checked out of the pool",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+POOL_OVERFLOW: Gauge = Gauge(
+    "games_rule_db_pool_overflow",
+    "Connections open beyond the pool size",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+
+
+def instrument_engine(
+    engine: AsyncEngine, name: str, slow_query_ms: Optional[float] = None
+) -> None:
+    """
+    Export pool gauges, connection hold times and statement timings for an engine.
+
+    Args:
+        engine: Engine to observe
+        name: Label identifying the engine, e.g. ``primary`` or ``replica-0``
+        slow_query_ms: Log statements slower than this at WARNING; None disables
+    """
+    histogram: Histogram = QUERY_LATENCY.labels(name)
+    held: Histogram = CONNECTION_HELD.labels(name)
+    pool: Any = engine.pool
+    queue_pool: Optional[QueuePool] = pool if isinstance(pool, QueuePool) else None
+    in_use: Gauge = POOL_IN_USE.labels(name)
+    overflow: Gauge = POOL_OVERFLOW.labels(name)
+    if queue_pool is not None:
+        POOL_SIZE.labels(name).set(queue_pool.size())
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def checkout(
+        dbapi_connection: Any, record: ConnectionPoolEntry, proxy: Any
+    ) -> None:
+        record.info["checked_out_at"] = time.perf_counter()
+        if queue_pool is not None:
+            in_use.set(queue_pool.checkedout())
+            overflow.set(max(queue_pool.overflow(), 0))
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def checkin(dbapi_connection: Any, record: ConnectionPoolEntry) -> None:
+        started: Optional[float] = record.info.pop("checked_out_at", None)
+        if started is not None:
+            held.observe(time.perf_counter() - started)
+        if queue_pool is not None:
+            # The connection is returned after this event; a full pool closes
+            # it instead, which ends one overflow connection
+            closing: int = int(queue_pool.checkedin() >= queue_pool.size())
+            in_use.set(max(queue_pool.checkedout() - 1, 0))
+            overflow.set(max(queue_pool.overflow() - closing, 0))
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before_cursor_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Optional[ExecutionContext],
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after_cursor_execute(
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Optional[ExecutionContext],
+        executemany: bool,
+    ) -> None:
+        started: List[float] = conn.info["query_started"]
+        elapsed: float = time.perf_counter() - started.pop()
+        histogram.observe(elapsed)
+        if slow_query_ms is not None and elapsed * 1000 >= slow_query_ms:
+            logger.warning(
+                "Slow query on %s (%.1f ms): %s",
+                name,
+                elapsed * 1000,
+                " ".join(statement.split())[:1000],
+            )
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(context: ExceptionContext) -> None:
+        # after_cursor_execute never runs for a failed statement
+        if context.connection is not None:
+            started: List[float] = context.connection.info.get("query_started", [])
+            if started:
+                started.pop()
+
+
+def timed(
+    method: Callable[P, Coroutine[Any, Any, R]],
+) -> Callable[P, Coroutine[Any, Any, R]]:
+    """
+    Record a reader method's latency in ``games_rule_reader_seconds``.
+
+    Args:
+        method: Async method of a class with a ``model_class`` attribute
+
+    Returns:
+        Wrapped method
+    """
+
+    @functools.wraps(method)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        started: float = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            model: str = getattr(getattr(args[0], "model_class", None), "__name__", "")
+            READER_LATENCY.labels(model, method.__name__).observe(
+                time.perf_counter() - started
+            )
+
+    return wrapper
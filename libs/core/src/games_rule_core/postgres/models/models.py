@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import List, Optional
 
 from pydantic import field_validator, model_validator
-from sqlalchemy import ARRAY, String, func
+from sqlalchemy import ARRAY, Index, String, func
 from sqlmodel import Column, Field, Relationship, SQLModel
 from typing_extensions import Self
 
@@ -78,13 +78,27 @@ class GameBase(SQLModel):
 # Database table model (adds ID and timestamps)
 class Game(GameBase, table=True):
     __tablename__: str = "games"  # type: ignore
+    # Server defaults come back through INSERT/UPDATE ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+    # (sort column, id) indexes back keyset pagination; PostgresReader sorts
+    # only by columns indexed this way
+    __table_args__ = (
+        Index("idx_games_name", "name", "id"),
+        Index("idx_games_created_at", "created_at", "id"),
+        Index("idx_games_updated_at", "updated_at", "id"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
+    # None until the insert returns the server default; never NULL in the
+    # table, so descending sorts can scan the indexes backwards
     created_at: Optional[datetime] = Field(
-        default=None, sa_column_kwargs={"server_default": func.now()}
+        default=None,
+        nullable=False,
+        sa_column_kwargs={"server_default": func.now()},
     )
     updated_at: Optional[datetime] = Field(
         default=None,
+        nullable=False,
         sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
 
@@ -103,10 +117,50 @@ class RulebookBase(SQLModel):
 
 class Rulebook(RulebookBase, table=True):
     __tablename__: str = "game_documents"  # type: ignore
+    # Server defaults come back through INSERT/UPDATE ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Optional[int] = Field(default=None, primary_key=True)
+    # Bumped on every write so the game's rulebook version changes with it
     uploaded_at: Optional[datetime] = Field(
-        default=None, sa_column_kwargs={"server_default": func.now()}
+        default=None,
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()},
     )
 
     game: Optional["Game"] = Relationship(back_populates="rulebooks")
+
+
+class RuleChunk(SQLModel, table=True):
+    """Section-aware slice of a rulebook's text, written by ``ingest``."""
+
+    __tablename__: str = "rule_chunks"  # type: ignore
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    document_id: int = Field(foreign_key="game_documents.id")
+    game_id: int = Field(foreign_key="games.id")
+    chunk_index: int
+    section: Optional[str] = None
+    page_start: int
+    page_end: int
+    char_start: int
+    char_end: int
+    text: str
+
+
+class DocumentIngestion(SQLModel, table=True):
+    """Ingestion state of one rulebook, used to skip unchanged documents."""
+
+    __tablename__: str = "document_ingestions"  # type: ignore
+    # Server defaults come back through INSERT/UPDATE ... RETURNING
+    __mapper_args__ = {"eager_defaults": True}
+
+    document_id: int = Field(foreign_key="game_documents.id", primary_key=True)
+    status: str
+    content_hash: Optional[str] = None
+    source_etag: Optional[str] = None
+    source_uploaded_at: Optional[datetime] = None
+    chunk_count: int = 0
+    error: Optional[str] = None
+    ingested_at: Optional[datetime] = Field(
+        default=None, sa_column_kwargs={"server_default": func.now()}
+    )
@@ -0,0 +1,98 @@
+import time
+from typing import Any, Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.engine.interfaces import DBAPIConnection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import (
+    AsyncAdaptedQueuePool,
+    ConnectionPoolEntry,
+    PoolProxiedConnection,
+    QueuePool,
+)
+
+from games_rule_core.postgres.breaker import CircuitBreaker
+from games_rule_core.postgres.metrics import POOL_CHECKOUT_WAIT
+
+
+class GuardedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Async queue pool that times checkouts and guards connects with a breaker.
+
+    While the breaker is open, checkouts raise ``CircuitOpenError`` at once
+    instead of each waiting out a connect timeout against a dead server.
+    """
+
+    engine_name: str = "primary"
+    breaker: Optional[CircuitBreaker] = None
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # Every new or replacement DBAPI connection goes through _invoke_creator
+        invoke_creator: Callable[[ConnectionPoolEntry], DBAPIConnection] = (
+            self._invoke_creator
+        )
+
+        def guarded_creator(rec: ConnectionPoolEntry) -> DBAPIConnection:
+            try:
+                connection: DBAPIConnection = invoke_creator(rec)
+            except Exception:
+                if self.breaker is not None:
+                    self.breaker.record_failure()
+                raise
+            if self.breaker is not None:
+                self.breaker.record_success()
+            return connection
+
+        self._invoke_creator = guarded_creator
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        if self.breaker is not None:
+            self.breaker.before_call()
+        started: float = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            POOL_CHECKOUT_WAIT.labels(self.engine_name).observe(
+                time.perf_counter() - started
+            )
+
+    def recreate(self) -> "GuardedQueuePool":
+        pool: QueuePool = super().recreate()
+        assert isinstance(pool, GuardedQueuePool)
+        pool.engine_name = self.engine_name
+        pool.breaker = self.breaker
+        return pool
+
+
+def guard_engine(engine: AsyncEngine, name: str, breaker: CircuitBreaker) -> None:
+    """
+    Attach a circuit breaker to an engine using ``GuardedQueuePool``.
+
+    Failed connects and dropped connections count as failures; a new
+    connection or a checkout that passed its pre-ping closes the breaker.
+
+    Args:
+        engine: Engine created with ``poolclass=GuardedQueuePool``
+        name: Label identifying the engine in metrics
+        breaker: Breaker to trip on connection failures
+    """
+    pool: Any = engine.pool
+    assert isinstance(pool, GuardedQueuePool)
+    pool.engine_name = name
+    pool.breaker = breaker
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def checkout(
+        dbapi_connection: DBAPIConnection,
+        record: ConnectionPoolEntry,
+        proxy: PoolProxiedConnection,
+    ) -> None:
+        # Fires only after pre-ping succeeded, so the server answered
+        breaker.record_success()
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def handle_error(context: ExceptionContext) -> None:
+        if context.is_disconnect:
+            breaker.record_failure()
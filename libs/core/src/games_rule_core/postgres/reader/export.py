@@ -0,0 +1,94 @@
+import csv
+import io
+import zlib
+from datetime import datetime
+from typing import Any, AsyncIterable, AsyncIterator, List, Literal, Type
+
+from sqlmodel import SQLModel
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# Encoded rows are buffered up to this size before being yielded downstream
+FLUSH_BYTES: int = 64 * 1024
+
+# Separator for list values (game_types, game_mechanics) inside one CSV cell
+CSV_LIST_SEPARATOR: str = ";"
+
+
+async def encode_ndjson(rows: AsyncIterable[SQLModel]) -> AsyncIterator[bytes]:
+    """
+    Encode rows as newline-delimited JSON.
+
+    Args:
+        rows: Model instances, e.g. from ``PostgresReader.stream``
+
+    Yields:
+        Chunks of roughly ``FLUSH_BYTES`` holding whole lines
+    """
+    buffer: bytearray = bytearray()
+    async for row in rows:
+        buffer += row.model_dump_json().encode()
+        buffer += b"\n"
+        if len(buffer) >= FLUSH_BYTES:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+async def encode_csv(
+    rows: AsyncIterable[SQLModel], model_class: Type[SQLModel]
+) -> AsyncIterator[bytes]:
+    """
+    Encode rows as CSV with a header of the model's fields.
+
+    List values are joined with ``CSV_LIST_SEPARATOR`` and None is written as
+    an empty cell.
+
+    Args:
+        rows: Model instances, e.g. from ``PostgresReader.stream``
+        model_class: Model whose fields become the columns
+
+    Yields:
+        Chunks of roughly ``FLUSH_BYTES`` holding whole records
+    """
+    fields: List[str] = list(model_class.model_fields)
+    text: io.StringIO = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(fields)
+    async for row in rows:
+        writer.writerow([_csv_cell(getattr(row, field)) for field in fields])
+        if text.tell() >= FLUSH_BYTES:
+            yield text.getvalue().encode()
+            text.seek(0)
+            text.truncate()
+    if text.tell():
+        yield text.getvalue().encode()
+
+
+async def gzip_chunks(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """
+    Gzip a byte stream on the fly.
+
+    Args:
+        chunks: Uncompressed chunks
+
+    Yields:
+        Chunks of one gzip member, ending with its trailer
+    """
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        compressed: bytes = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, list):
+        return CSV_LIST_SEPARATOR.join(str(item) for item in value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
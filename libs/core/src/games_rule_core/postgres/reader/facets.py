@@ -0,0 +1,268 @@
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel, Field
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    Result,
+    Select,
+    Table,
+    Text,
+    and_,
+    cast,
+    func,
+    inspect,
+    literal,
+    null,
+    select,
+    true,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapper
+from sqlalchemy.sql.selectable import TableValuedAlias
+
+from games_rule_core.postgres.metrics import timed
+from games_rule_core.postgres.models.models import Game
+from games_rule_core.postgres.reader.filters import Binder, Condition
+from games_rule_core.postgres.reader.reader import ModelType
+from games_rule_core.postgres.reader.statements import (
+    StatementCache,
+    get_statement_cache,
+)
+
+# Player counts and playtime limits the game facets count for; they match
+# the ``players`` and ``max_playtime`` filters, so a count is what the
+# filter would return
+PLAYER_COUNTS: Tuple[int, ...] = (1, 2, 3, 4, 5, 6, 7, 8)
+PLAYTIME_LIMITS: Tuple[int, ...] = (15, 30, 45, 60, 90, 120, 180)
+
+TOTAL: str = "total"
+
+
+class FacetCount(BaseModel):
+    """Number of matching records with one facet value."""
+
+    value: Union[int, str]
+    count: int
+
+
+class FacetCounts(BaseModel):
+    """Facet counts over the records a filter matches."""
+
+    total: int
+    facets: Dict[str, List[FacetCount]] = Field(default_factory=dict)
+
+
+class Facets(Generic[ModelType]):
+    """
+    Counts per facet value, for all facets in one statement.
+
+    The statement is a ``UNION ALL`` of branches that each apply the filter
+    to the table, so every branch can use the filter's indexes:
+
+    - one aggregate row counts the matches and, with ``count(*) FILTER``,
+      span facets (rows whose ``[lower, upper]`` columns contain a point,
+      as ``Spans`` filters) and limit facets (rows whose column is at most
+      a limit, as ``Range(lte=...)`` filters), unnested into one row each;
+    - each value facet unnests an array column and counts every element.
+
+    Statements are cached per filter shape like ``PostgresReader``'s.
+    Counts are over the filtered rows, including a facet's own filter.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        model_class: Type[ModelType],
+        values: Sequence[str] = (),
+        spans: Optional[Dict[str, Tuple[str, str, Sequence[int]]]] = None,
+        limits: Optional[Dict[str, Tuple[str, Sequence[int]]]] = None,
+        statements: Optional[StatementCache] = None,
+    ) -> None:
+        """
+        Initialize facets over one model.
+
+        Args:
+            session: SQLAlchemy async session
+            model_class: The SQLModel class to count
+            values: Array columns counted per element
+            spans: Facet name to lower column, upper column and points
+            limits: Facet name to column and upper limits
+            statements: Cache of built statements; defaults to the
+                process-wide cache
+        """
+        self.session: AsyncSession = session
+        self.model_class: Type[ModelType] = model_class
+        self.values: Tuple[str, ...] = tuple(values)
+        self.spans: Dict[str, Tuple[str, str, Tuple[int, ...]]] = {
+            name: (lower, upper, tuple(points))
+            for name, (lower, upper, points) in (spans or {}).items()
+        }
+        self.limits: Dict[str, Tuple[str, Tuple[int, ...]]] = {
+            name: (column, tuple(bounds))
+            for name, (column, bounds) in (limits or {}).items()
+        }
+        self.statements: StatementCache = (
+            statements if statements is not None else get_statement_cache()
+        )
+
+    @timed
+    async def count(self, where: Optional[Condition] = None) -> FacetCounts:
+        """
+        Count every facet over the records matching a filter.
+
+        Args:
+            where: Optional filter condition, e.g. ``GameFilter.to_condition()``
+
+        Returns:
+            Total matches and, per facet, counts ordered by descending count
+            (value facets) or by point (span and limit facets)
+
+        Raises:
+            InvalidFilterError: If the filter names an unknown column
+        """
+        shape: Optional[Hashable] = None if where is None else where.shape()
+        statement: CompoundSelect[Any]
+        params: Dict[str, Any] = {}
+        if where is not None and shape is None:
+            statement = self._build(where, named=False)
+        else:
+            key: Tuple[Hashable, ...] = (
+                Facets,
+                self.model_class,
+                self.values,
+                tuple(self.spans.items()),
+                tuple(self.limits.items()),
+                shape,
+            )
+            statement = self.statements.get(key, lambda: self._build(where, True))
+            if where is not None:
+                params = where.bind_params()
+        result: Result[Any] = await self.session.execute(statement, params)
+
+        total: int = 0
+        counts: Dict[str, Dict[Any, int]] = {
+            name: {} for name in (*self.values, *self.spans, *self.limits)
+        }
+        for facet, value, count in result:
+            if facet == TOTAL:
+                total = count
+            elif facet in self.values:
+                counts[facet][value] = count
+            else:
+                counts[facet][int(value)] = count
+
+        facets: Dict[str, List[FacetCount]] = {
+            name: [
+                FacetCount(value=value, count=count)
+                for value, count in sorted(
+                    counts[name].items(), key=lambda item: (-item[1], item[0])
+                )
+            ]
+            for name in self.values
+        }
+        points: Dict[str, Tuple[int, ...]] = {
+            **{name: spanned for name, (_, _, spanned) in self.spans.items()},
+            **{name: bounds for name, (_, bounds) in self.limits.items()},
+        }
+        for name, facet_points in points.items():
+            facets[name] = [
+                FacetCount(value=point, count=counts[name][point])
+                for point in facet_points
+            ]
+        return FacetCounts(total=total, facets=facets)
+
+    def _build(self, where: Optional[Condition], named: bool) -> CompoundSelect[Any]:
+        table: Table = self._table()
+
+        def filtered(statement: Select[Any]) -> Select[Any]:
+            # Each branch binds the filter anew, under the same names
+            if where is None:
+                return statement
+            binder: Optional[Binder] = Binder() if named else None
+            return statement.where(where.compile(self.model_class, binder))
+
+        facets: List[str] = [TOTAL]
+        points: List[Optional[int]] = [None]
+        counts: List[ColumnElement[int]] = [func.count()]
+        for name, (lower, upper, spanned) in self.spans.items():
+            for point in spanned:
+                facets.append(name)
+                points.append(point)
+                counts.append(
+                    func.count().filter(
+                        and_(table.c[lower] <= point, table.c[upper] >= point)
+                    )
+                )
+        for name, (column, bounds) in self.limits.items():
+            for bound in bounds:
+                facets.append(name)
+                points.append(bound)
+                counts.append(func.count().filter(table.c[column] <= bound))
+        branches: List[Select[Any]] = [
+            filtered(
+                select(
+                    func.unnest(array([literal(facet) for facet in facets])),
+                    func.unnest(
+                        array(
+                            [
+                                cast(null() if point is None else literal(point), Text)
+                                for point in points
+                            ]
+                        )
+                    ),
+                    func.unnest(array(counts)),
+                ).select_from(table)
+            )
+        ]
+        for column in self.values:
+            elements: TableValuedAlias = (
+                func.unnest(table.c[column]).table_valued("value").render_derived()
+            )
+            branches.append(
+                filtered(
+                    select(literal(column), elements.c.value, func.count())
+                    .select_from(table.join(elements, true()))
+                    .group_by(elements.c.value)
+                )
+            )
+        return union_all(*branches)
+
+    def _table(self) -> Table:
+        mapper: Mapper[ModelType] = inspect(self.model_class)
+        table: Any = mapper.local_table
+        assert isinstance(table, Table)
+        return table
+
+
+def game_facets(session: AsyncSession) -> Facets[Game]:
+    """
+    Build the catalogue facets: types, mechanics, player counts and playtimes.
+
+    Args:
+        session: SQLAlchemy async session
+
+    Returns:
+        Facets named after the columns and the ``players``/``max_playtime``
+        filters they match
+    """
+    return Facets[Game](
+        session,
+        Game,
+        values=("game_types", "game_mechanics"),
+        spans={"players": ("min_players", "max_players", PLAYER_COUNTS)},
+        limits={"max_playtime": ("max_playtime_minutes", PLAYTIME_LIMITS)},
+    )
@@ -0,0 +1,452 @@
+from abc import ABC, abstractmethod
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from pydantic import BaseModel, Field
+from sqlalchemy import (
+    ARRAY,
+    BindParameter,
+    Column,
+    ColumnElement,
+    Text,
+    and_,
+    bindparam,
+    inspect,
+    not_,
+    or_,
+)
+from sqlalchemy.orm import Mapper
+from sqlalchemy.types import TypeEngine
+from sqlmodel import SQLModel
+
+
+class InvalidFilterError(ValueError):
+    """Raised when a filter names an unknown column or misuses an operator."""
+
+
+class Binder:
+    """
+    Creates the bind parameters of a compiled condition.
+
+    Named binders call the parameters ``w0``, ``w1``... in compile order,
+    matching ``Condition.bind_params``, so a statement built for one filter
+    can be re-run with another filter of the same shape. Anonymous binders
+    behave like plain literals.
+    """
+
+    def __init__(self, named: bool = True) -> None:
+        self.named: bool = named
+        self.count: int = 0
+
+    def __call__(
+        self,
+        value: Any,
+        type_: Optional[TypeEngine[Any]] = None,
+        expanding: bool = False,
+    ) -> BindParameter[Any]:
+        if not self.named:
+            return bindparam(None, value, type_=type_, expanding=expanding, unique=True)
+        name: str = f"w{self.count}"
+        self.count += 1
+        return bindparam(name, value, type_=type_, expanding=expanding)
+
+
+class Condition(BaseModel, ABC):
+    """
+    Base class for composable filter conditions.
+
+    Conditions compile to a single SQL boolean expression and can be combined
+    with ``&``, ``|`` and ``~``. Each set field named in ``value_fields``
+    compiles to exactly one bind parameter, in field order; that is what
+    lets ``shape`` and ``bind_params`` describe a statement without
+    compiling it.
+    """
+
+    # Fields holding values rather than structure; None marks a condition
+    # whose parameters are not bound through a Binder, so it is never cached
+    value_fields: ClassVar[Optional[Tuple[str, ...]]] = None
+
+    @abstractmethod
+    def compile(
+        self, model_class: Type[SQLModel], binder: Optional[Binder] = None
+    ) -> ColumnElement[bool]:
+        """
+        Compile the condition into a SQL expression for a model.
+
+        Args:
+            model_class: The SQLModel class being queried
+            binder: Creates bind parameters; anonymous literals when unset
+
+        Returns:
+            SQL boolean expression for a WHERE clause
+        """
+
+    def shape(self) -> Optional[Hashable]:
+        """
+        Describe the SQL this condition compiles to, ignoring its values.
+
+        Returns:
+            Hashable shape, or None if the condition cannot be cached
+        """
+        if self.value_fields is None:
+            return None
+        parts: List[Hashable] = [type(self).__name__]
+        for name in type(self).model_fields:
+            value: Any = getattr(self, name)
+            if name in self.value_fields:
+                # Unset bounds and IS NULL change the SQL; the values do not
+                parts.append(value is not None)
+            elif isinstance(value, Condition):
+                child: Optional[Hashable] = value.shape()
+                if child is None:
+                    return None
+                parts.append(child)
+            elif isinstance(value, list):
+                children: Tuple[Optional[Hashable], ...] = tuple(
+                    c.shape() for c in value
+                )
+                if None in children:
+                    return None
+                parts.append(children)
+            else:
+                parts.append(value)
+        return tuple(parts)
+
+    def bind_params(self) -> Dict[str, Any]:
+        """
+        Return the values a named ``Binder`` would bind, by parameter name.
+
+        Returns:
+            Parameters for a statement built from a condition of this shape
+        """
+        values: List[Any] = []
+        self._collect_values(values)
+        return {f"w{index}": value for index, value in enumerate(values)}
+
+    def _collect_values(self, values: List[Any]) -> None:
+        for name in type(self).model_fields:
+            value: Any = getattr(self, name)
+            if name in (self.value_fields or ()):
+                if value is not None:
+                    values.append(value)
+            elif isinstance(value, Condition):
+                value._collect_values(values)
+            elif isinstance(value, list):
+                for condition in value:
+                    condition._collect_values(values)
+
+    def __and__(self, other: "Condition") -> "And":
+        return And(conditions=[self, other])
+
+    def __or__(self, other: "Condition") -> "Or":
+        return Or(conditions=[self, other])
+
+    def __invert__(self) -> "Not":
+        return Not(condition=self)
+
+
+class Eq(Condition):
+    """``field = value``, or ``field IS NULL`` when value is None."""
+
+    field: str
+    value: Any
+
+    value_fields: ClassVar[Optional[Tuple[str, ...]]] = ("value",)
+
+    def compile(
+        self, model_class: Type[SQLModel], binder: Optional[Binder] = None
+    ) -> ColumnElement[bool]:
+        column: Column[Any] = resolve_column(model_class, self.field)
+        if self.value is None:
+            return column.is_(None)
+        bind: Binder = binder or Binder(named=False)
+        equals: ColumnElement[bool] = column == bind(self.value, column.type)
+        return equals
+
+
+class In(Condition):
+    """``field IN (values)``."""
+
+    field: str
+    values: List[Any]
+
+    value_fields: ClassVar[Optional[Tuple[str, ...]]] = ("values",)
+
+    def compile(
+        self, model_class: Type[SQLModel], binder: Optional[Binder] = None
+    ) -> ColumnElement[bool]:
+        column: Column[Any] = resolve_column(model_class, self.field, scalar=True)
+        # Expanding, so the statement shape does not depend on the list length
+        bind: Binder = binder or Binder(named=False)
+        return column.in_(bind(self.values, column.type, expanding=True))
+
+
+class Range(Condition):
+    """Inclusive/exclusive bounds on a scalar column; unset bounds are open."""
+
+    field: str
+    gte: Optional[Any] = None
+    gt: Optional[Any] = None
+    lte: Optional[Any] = None
+    lt: Optional[Any] = None
+
+    value_fields: ClassVar[Optional[Tuple[str, ...]]] = ("gte", "gt", "lte", "lt")
+
+    def compile(
+        self, model_class: Type[SQLModel], binder: Optional[Binder] = None
+    ) -> ColumnElement[bool]:
+        column: Column[Any] = resolve_column(model_class, self.field, scalar=True)
+        bind: Binder = binder or Binder(named=False)
+        clauses: List[ColumnElement[bool]] = []
+        if self.gte is not None:
+            clauses.append(column >= bind(self.gte, column.type))
+        if self.gt is not None:
+            clauses.append(column > bind(self.gt, column.type))
+        if self.lte is not None:
+            clauses.append(column <= bind(self.lte, column.type))
+        if self.lt is not None:
+            clauses.append(column < bind(self.lt, column.type))
+        if not clauses:
+            raise InvalidFilterError(f"Range on '{self.field}' has no bounds")
+        return and_(*clauses)
+
+
+class Spans(Condition):
+    """
+    Rows whose ``[lower, upper]`` column pair contains ``value``.
+
+    For example ``Spans(lower="min_players", upper="max_players", value=3)``
+    matches games playable with three players, seeking ``idx_games_players``.
+    """
+
+    lower: str
+    upper: str
+    value: Any
+
+    value_fields: ClassVar[Optional[Tuple[str, ...]]] = ("value",)
+
+    def compile(
+        self, model_class: Type[SQLModel], binder: Optional[Binder] = None
+    ) -> ColumnElement[bool]:
+        lower: Column[Any] = resolve_column(model_class, self.lower, scalar=True)
+        upper: Column[Any] = resolve_column(model_class, self.upper, scalar=True)
+        # One parameter used twice, as value_fields promises
+        value: BindParameter[Any] = (binder or Binder(named=False))(
+            self.value, lower.type
+        )
+        return and_(lower <= value, upper >= value)
+
+
+class Contains(Condition):
+    """ARRAY ``field @> values``: every value is present (GIN indexed)."""
+
+    field: str
+    values: List[Any] = Field(min_length=1)
+
+    value_fields: ClassVar[Optional[Tuple[str, ...]]] = ("values",)
+
+    def compile(
+        self, model_class: Type[SQLModel], binder: Optional[Binder] = None
+    ) -> ColumnElement[bool]:
+        column: Column[Any] = resolve_column(model_class, self.field, array=True)
+        return column.bool_op("@>")(_array_param(self.values, binder))
+
+
+class Overlaps(Condition):
+    """ARRAY ``field && values``: at least one value is present (GIN indexed)."""
+
+    field: str
+    values: List[Any] = Field(min_length=1)
+
+    value_fields: ClassVar[Optional[Tuple[str, ...]]] = ("values",)
+
+    def compile(
+        self, model_class: Type[SQLModel], binder: Optional[Binder] = None
+    ) -> ColumnElement[bool]:
+        column: Column[Any] = resolve_column(model_class, self.field, array=True)
+        return column.bool_op("&&")(_array_param(self.values, binder))
+
+
+class And(Condition):
+    """All nested conditions must match."""
+
+    conditions: List[Condition] = Field(min_length=1)
+
+    value_fields: ClassVar[Optional[Tuple[str, ...]]] = ()
+
+    def compile(
+        self, model_class: Type[SQLModel], binder: Optional[Binder] = None
+    ) -> ColumnElement[bool]:
+        return and_(*(c.compile(model_class, binder) for c in self.conditions))
+
+    def __and__(self, other: Condition) -> "And":
+        return And(conditions=[*self.conditions, other])
+
+
+class Or(Condition):
+    """At least one nested condition must match."""
+
+    conditions: List[Condition] = Field(min_length=1)
+
+    value_fields: ClassVar[Optional[Tuple[str, ...]]] = ()
+
+    def compile(
+        self, model_class: Type[SQLModel], binder: Optional[Binder] = None
+    ) -> ColumnElement[bool]:
+        return or_(*(c.compile(model_class, binder) for c in self.conditions))
+
+
+class Not(Condition):
+    """Negates the nested condition."""
+
+    condition: Condition
+
+    value_fields: ClassVar[Optional[Tuple[str, ...]]] = ()
+
+    def compile(
+        self, model_class: Type[SQLModel], binder: Optional[Binder] = None
+    ) -> ColumnElement[bool]:
+        return not_(self.condition.compile(model_class, binder))
+
+
+def resolve_column(
+    model_class: Type[SQLModel], name: str, scalar: bool = False, array: bool = False
+) -> Column[Any]:
+    """
+    Look up a mapped column by name, rejecting unknown fields.
+
+    Args:
+        model_class: The SQLModel class being queried
+        name: Column name
+        scalar: Require a non-ARRAY column
+        array: Require an ARRAY column
+
+    Returns:
+        Mapped table column
+
+    Raises:
+        InvalidFilterError: If the column does not exist or has the wrong kind
+    """
+    mapper: Mapper[Any] = inspect(model_class)
+    column: Optional[Column[Any]] = mapper.columns.get(name)
+    if column is None:
+        raise InvalidFilterError(f"{model_class.__name__} has no column '{name}'")
+    is_array: bool = isinstance(column.type, ARRAY)
+    if scalar and is_array:
+        raise InvalidFilterError(f"'{name}' is an array column; use Contains/Overlaps")
+    if array and not is_array:
+        raise InvalidFilterError(f"'{name}' is not an array column")
+    return column
+
+
+def _array_param(values: List[Any], binder: Optional[Binder]) -> ColumnElement[Any]:
+    # The schema declares the tag columns TEXT[]; a VARCHAR[] bind has no @>/&&
+    return (binder or Binder(named=False))(values, ARRAY(Text))
+
+
+def combine(conditions: Sequence[Condition], **equals: Any) -> Optional[Condition]:
+    """
+    AND together explicit conditions and ``field=value`` equality shorthands.
+
+    Args:
+        conditions: Filter conditions
+        **equals: Equality filters keyed by column name
+
+    Returns:
+        A single condition, or None when nothing was given
+    """
+    merged: List[Condition] = [
+        *conditions,
+        *(Eq(field=field, value=value) for field, value in equals.items()),
+    ]
+    if not merged:
+        return None
+    if len(merged) == 1:
+        return merged[0]
+    return And(conditions=merged)
+
+
+class GameFilter(BaseModel):
+    """
+    Typed catalogue filter for ``Game`` queries.
+
+    Every set field adds one predicate; all predicates are ANDed and compiled
+    into a single statement so the player/playtime B-tree and type/mechanic
+    GIN indexes do the filtering.
+    """
+
+    players: Optional[int] = Field(default=None, gt=0)
+    max_playtime: Optional[int] = Field(default=None, gt=0)
+    min_playtime: Optional[int] = Field(default=None, gt=0)
+    age: Optional[int] = Field(default=None, gt=0)
+    min_complexity: Optional[float] = Field(default=None, ge=1.0, le=5.0)
+    max_complexity: Optional[float] = Field(default=None, ge=1.0, le=5.0)
+    min_year: Optional[int] = None
+    max_year: Optional[int] = None
+    types_all: List[str] = Field(default_factory=list)
+    types_any: List[str] = Field(default_factory=list)
+    mechanics_all: List[str] = Field(default_factory=list)
+    mechanics_any: List[str] = Field(default_factory=list)
+    publisher: List[str] = Field(default_factory=list)
+    designer: List[str] = Field(default_factory=list)
+
+    def to_condition(self) -> Optional[Condition]:
+        """
+        Convert the set fields into a composable condition.
+
+        Returns:
+            Combined condition, or None if no filter is set
+        """
+        conditions: List[Condition] = []
+        if self.players is not None:
+            conditions.append(
+                Spans(lower="min_players", upper="max_players", value=self.players)
+            )
+        if self.max_playtime is not None:
+            conditions.append(
+                Range(field="max_playtime_minutes", lte=self.max_playtime)
+            )
+        if self.min_playtime is not None:
+            conditions.append(
+                Range(field="min_playtime_minutes", gte=self.min_playtime)
+            )
+        if self.age is not None:
+            conditions.append(Range(field="min_age", lte=self.age))
+        if self.min_complexity is not None or self.max_complexity is not None:
+            conditions.append(
+                Range(
+                    field="complexity_rating",
+                    gte=self.min_complexity,
+                    lte=self.max_complexity,
+                )
+            )
+        if self.min_year is not None or self.max_year is not None:
+            conditions.append(
+                Range(field="year_published", gte=self.min_year, lte=self.max_year)
+            )
+        if self.types_all:
+            conditions.append(Contains(field="game_types", values=self.types_all))
+        if self.types_any:
+            conditions.append(Overlaps(field="game_types", values=self.types_any))
+        if self.mechanics_all:
+            conditions.append(
+                Contains(field="game_mechanics", values=self.mechanics_all)
+            )
+        if self.mechanics_any:
+            conditions.append(
+                Overlaps(field="game_mechanics", values=self.mechanics_any)
+            )
+        if self.publisher:
+            conditions.append(In(field="publisher", values=self.publisher))
+        if self.designer:
+            conditions.append(In(field="designer", values=self.designer))
+        return combine(conditions)
@@ -0,0 +1,174 @@
+import asyncio
+from typing import (
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+)
+
+from prometheus_client import Histogram
+
+from games_rule_core.postgres.reader.reader import ModelType, PostgresReader
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+BatchFetch = Callable[[List[K]], Awaitable[Dict[K, V]]]
+
+LOADER_BATCH_KEYS: Histogram = Histogram(
+    "games_rule_loader_batch_keys",
+    "Distinct keys per batched lookup query",
+    ["loader"],
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500),
+)
+
+
+class BatchLoader(Generic[K, V]):
+    """
+    Coalesce concurrent lookups by key into one query.
+
+    Every ``load`` issued before the batch is dispatched (within the same
+    event loop tick, or within ``window`` seconds if set) joins it, and
+    duplicate keys are fetched once. ``fetch`` receives the distinct keys
+    and returns whatever it found keyed by key; keys it leaves out resolve
+    to None. A failed fetch fails every caller in the batch.
+
+    Batches run one at a time, so a loader may wrap a single request's
+    ``AsyncSession``, which cannot run two queries at once. Loaders that
+    open a session per fetch can still share one loader per process.
+    """
+
+    def __init__(
+        self,
+        fetch: BatchFetch[K, V],
+        max_batch_size: int = 500,
+        window: float = 0.0,
+        name: str = "default",
+    ) -> None:
+        """
+        Initialize loader.
+
+        Args:
+            fetch: Loads many keys in one query, typically ``id = ANY(:ids)``
+            max_batch_size: Distinct keys per query; a full batch dispatches
+                at once
+            window: Seconds to wait for more keys before dispatching
+            name: Label used in metrics
+        """
+        self.fetch: BatchFetch[K, V] = fetch
+        self.max_batch_size: int = max_batch_size
+        self.window: float = window
+        self.name: str = name
+        self._pending: Dict[K, List[asyncio.Future[Optional[V]]]] = {}
+        self._scheduled: Optional[asyncio.TimerHandle | asyncio.Handle] = None
+        self._lock: asyncio.Lock = asyncio.Lock()
+        # Strong references, so in-flight batches are not garbage collected
+        self._tasks: Set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> Optional[V]:
+        """
+        Look up one key as part of the next batch.
+
+        Args:
+            key: Key to load
+
+        Returns:
+            Fetched value, or None if ``fetch`` did not return the key
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        future: asyncio.Future[Optional[V]] = loop.create_future()
+        self._pending.setdefault(key, []).append(future)
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._scheduled is None:
+            self._scheduled = (
+                loop.call_later(self.window, self._dispatch)
+                if self.window > 0
+                else loop.call_soon(self._dispatch)
+            )
+        return await future
+
+    async def load_many(self, keys: Sequence[K]) -> List[Optional[V]]:
+        """
+        Look up several keys, in as few batches as fit.
+
+        Args:
+            keys: Keys to load
+
+        Returns:
+            One value per key, in input order, None where not found
+        """
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        if self._scheduled is not None:
+            self._scheduled.cancel()
+            self._scheduled = None
+        batch: Dict[K, List[asyncio.Future[Optional[V]]]] = self._pending
+        self._pending = {}
+        if not batch:
+            return
+        task: asyncio.Task[None] = asyncio.get_running_loop().create_task(
+            self._run(batch)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, batch: Dict[K, List[asyncio.Future[Optional[V]]]]) -> None:
+        async with self._lock:
+            LOADER_BATCH_KEYS.labels(self.name).observe(len(batch))
+            try:
+                found: Dict[K, V] = await self.fetch(list(batch))
+            except Exception as e:
+                for futures in batch.values():
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(e)
+                return
+        for key, futures in batch.items():
+            for future in futures:
+                # Callers that were cancelled meanwhile have nothing to receive
+                if not future.done():
+                    future.set_result(found.get(key))
+
+
+def reader_loader(
+    reader: PostgresReader[ModelType],
+    max_batch_size: int = 500,
+    window: float = 0.0,
+) -> BatchLoader[int, ModelType]:
+    """
+    Batch a reader's ``get_by_id`` calls into ``get_many`` queries.
+
+    The loader shares the reader's session, so create one per request (or
+    unit of work) alongside the reader and drop it with the session.
+
+    Args:
+        reader: Reader bound to the request's session
+        max_batch_size: IDs per query
+        window: Seconds to wait for more IDs before dispatching
+
+    Returns:
+        Loader whose ``load`` stands in for ``reader.get_by_id``
+    """
+
+    async def fetch(record_ids: List[int]) -> Dict[int, ModelType]:
+        items: List[Optional[ModelType]] = await reader.get_many(record_ids)
+        return {
+            record_id: item
+            for record_id, item in zip(record_ids, items)
+            if item is not None
+        }
+
+    return BatchLoader(
+        fetch,
+        max_batch_size=max_batch_size,
+        window=window,
+        name=reader.model_class.__name__.lower(),
+    )
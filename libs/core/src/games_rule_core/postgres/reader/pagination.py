@@ -0,0 +1,243 @@
+import base64
+import hashlib
+import hmac
+import json
+import logging
+import secrets
+from datetime import date, datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, Generic, List, Optional, Tuple, TypeVar
+
+from pydantic import BaseModel
+from sqlalchemy import BindParameter, ColumnElement, and_, bindparam, or_, tuple_
+
+from games_rule_core.postgres.config import Settings, get_settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+ItemType = TypeVar("ItemType")
+
+# Scalar values a keyset cursor can carry for the sort column
+CursorValue = Optional[str | int | float | datetime | date]
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor token is malformed, tampered with or mismatched."""
+
+
+class InvalidSortError(ValueError):
+    """Raised when a sort key does not name a sortable column."""
+
+
+class Page(BaseModel, Generic[ItemType]):
+    """A single page of keyset-paginated results."""
+
+    items: List[ItemType]
+    next_cursor: Optional[str] = None
+    limit: int
+    sort: str
+
+
+class SortKey(BaseModel):
+    """Parsed sort specification such as ``name`` or ``-updated_at``."""
+
+    column: str
+    descending: bool = False
+
+    @classmethod
+    def parse(cls, sort: str) -> "SortKey":
+        """
+        Parse a sort string, where a leading ``-`` means descending.
+
+        Args:
+            sort: Sort string from the caller
+
+        Returns:
+            Parsed sort key
+        """
+        sort = sort.strip()
+        if sort.startswith("-"):
+            return cls(column=sort[1:], descending=True)
+        return cls(column=sort.lstrip("+"), descending=False)
+
+    def __str__(self) -> str:
+        return f"-{self.column}" if self.descending else self.column
+
+
+class CursorCodec:
+    """
+    Encode and decode opaque, HMAC-signed keyset cursors.
+
+    A cursor records the sort key it was issued for and the ``(sort value, id)``
+    of the last row on the page, so the next page can seek straight to it.
+    """
+
+    def __init__(self, secret: bytes) -> None:
+        """
+        Initialize codec with the signing secret.
+
+        Args:
+            secret: Key used to sign cursors; must match across API replicas
+        """
+        self._secret: bytes = secret
+
+    def encode(self, sort: SortKey, value: CursorValue, record_id: int) -> str:
+        """
+        Build a signed cursor pointing after the given row.
+
+        Args:
+            sort: Sort key the page was produced with
+            value: Sort column value of the last row
+            record_id: Primary key of the last row
+
+        Returns:
+            Opaque URL-safe cursor token
+        """
+        payload: bytes = json.dumps(
+            {"s": str(sort), "v": _dump_value(value), "i": record_id},
+            separators=(",", ":"),
+        ).encode()
+        return f"{_b64encode(payload)}.{_b64encode(self._sign(payload))}"
+
+    def decode(self, token: str, sort: SortKey) -> Tuple[CursorValue, int]:
+        """
+        Verify a cursor and extract the seek position.
+
+        Args:
+            token: Cursor token previously returned by ``encode``
+            sort: Sort key of the current request
+
+        Returns:
+            Tuple of (sort value, id) of the last row of the previous page
+
+        Raises:
+            InvalidCursorError: If the token is malformed, has a bad signature
+                or was issued for a different sort key
+        """
+        try:
+            body, signature = token.split(".", 1)
+            payload: bytes = _b64decode(body)
+            valid: bool = hmac.compare_digest(
+                _b64decode(signature), self._sign(payload)
+            )
+        except ValueError as e:
+            raise InvalidCursorError("Malformed cursor") from e
+        if not valid:
+            raise InvalidCursorError("Cursor signature does not match")
+
+        try:
+            data: dict[str, Any] = json.loads(payload)
+            issued_for: str = data["s"]
+            value: CursorValue = _load_value(data["v"])
+            record_id: int = int(data["i"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise InvalidCursorError("Malformed cursor") from e
+        if issued_for != str(sort):
+            raise InvalidCursorError(
+                f"Cursor was issued for sort '{issued_for}', not '{sort}'"
+            )
+        return value, record_id
+
+    def _sign(self, payload: bytes) -> bytes:
+        return hmac.new(self._secret, payload, hashlib.sha256).digest()[:16]
+
+
+@lru_cache
+def get_cursor_codec() -> CursorCodec:
+    """Return the process-wide cursor codec keyed from settings."""
+    settings: Settings = get_settings()
+    if settings.cursor_secret is not None:
+        secret: bytes = settings.cursor_secret.get_secret_value().encode()
+    else:
+        # Never derived from other settings: a key guessable from them would
+        # let anyone holding a cursor test guesses offline
+        logger.warning(
+            "CURSOR_SECRET is unset; cursors are signed with a per-process key "
+            "and fail on any other process"
+        )
+        secret = secrets.token_bytes(32)
+    return CursorCodec(secret)
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def _b64decode(text: str) -> bytes:
+    try:
+        return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid base64") from e
+
+
+def _dump_value(value: CursorValue | Decimal) -> Any:
+    # Tag temporal values so they round-trip with their original type
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, date):
+        return {"d": value.isoformat()}
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _load_value(raw: Any) -> CursorValue:
+    if isinstance(raw, dict):
+        if "dt" in raw:
+            return datetime.fromisoformat(raw["dt"])
+        if "d" in raw:
+            return date.fromisoformat(raw["d"])
+        raise InvalidCursorError("Unknown cursor value type")
+    if raw is None or isinstance(raw, (str, int, float)):
+        return raw
+    raise InvalidCursorError("Unknown cursor value type")
+
+
+def seek_condition(
+    column: ColumnElement[Any],
+    primary_key: ColumnElement[Any],
+    value: CursorValue,
+    record_id: int,
+    descending: bool,
+    nullable: bool,
+) -> ColumnElement[bool]:
+    """
+    Build the keyset predicate selecting rows strictly after a cursor position.
+
+    Rows are ordered by ``(column, id)`` with NULL sort values last, so the
+    non-NULL branch is a row-value comparison the composite index can seek on.
+    The position is bound as ``cursor_value`` and ``cursor_id``, so a cached
+    statement can be re-run from another cursor, provided both values are
+    NULL or both are not.
+
+    Args:
+        column: Sort column
+        primary_key: Primary key column used as the tie-breaker
+        value: Sort value of the last row on the previous page
+        record_id: Primary key of the last row on the previous page
+        descending: Whether the page is sorted descending
+        nullable: Whether the sort column can hold NULL
+
+    Returns:
+        SQL boolean expression for the WHERE clause
+    """
+    last_id: BindParameter[Any] = bindparam("cursor_id", record_id, primary_key.type)
+    if column is primary_key:
+        return primary_key < last_id if descending else primary_key > last_id
+
+    if value is None:
+        # Already in the trailing NULL block; only the tie-breaker advances
+        after_id: ColumnElement[bool] = (
+            primary_key < last_id if descending else primary_key > last_id
+        )
+        return and_(column.is_(None), after_id)
+
+    row: ColumnElement[Any] = tuple_(column, primary_key)
+    position: ColumnElement[Any] = tuple_(
+        bindparam("cursor_value", value, column.type), last_id
+    )
+    after: ColumnElement[bool] = row < position if descending else row > position
+    if nullable:
+        return or_(after, column.is_(None))
+    return after
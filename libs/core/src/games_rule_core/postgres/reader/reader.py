@@ -1,29 +1,128 @@
-from typing import Any, Generic, Optional, Sequence, Tuple, Type, TypeVar
-
-from sqlalchemy import Result
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    Column,
+    ColumnElement,
+    Result,
+    RowMapping,
+    Select,
+    String,
+    Table,
+    TypeDecorator,
+    any_,
+    bindparam,
+    distinct,
+    inspect,
+)
+from sqlalchemy.ext.asyncio import AsyncScalarResult, AsyncSession
+from sqlalchemy.orm import Mapper, selectinload
+from sqlalchemy.types import TypeEngine
 from sqlmodel import SQLModel, func, select
 from sqlmodel.sql._expression_select_cls import SelectOfScalar
 
+from games_rule_core.postgres.metrics import timed
+from games_rule_core.postgres.reader.filters import (
+    Binder,
+    Condition,
+    InvalidFilterError,
+    combine,
+    resolve_column,
+)
+from games_rule_core.postgres.reader.pagination import (
+    CursorCodec,
+    CursorValue,
+    InvalidSortError,
+    Page,
+    SortKey,
+    get_cursor_codec,
+    seek_condition,
+)
+from games_rule_core.postgres.reader.statements import (
+    StatementCache,
+    StatementType,
+    get_statement_cache,
+)
+from games_rule_core.postgres.routing import use_primary
+from games_rule_core.postgres.unit_of_work import unit_of_work
+
 # Generic type variable for SQLModel models
 ModelType = TypeVar("ModelType", bound=SQLModel)
+# Entity or column select, so paging works for both instances and plain rows
+SelectType = TypeVar("SelectType", bound=Select[Any])
+# Timestamp columns the database sets when a row is written, in order of
+# preference; the first a table has versions its rows (see get_version)
+VERSION_COLUMNS: Tuple[str, ...] = ("updated_at", "uploaded_at")
 
 
-class PostgresReader(Generic[ModelType]):
-    """Async PostgreSQL reader for SQLModel models with full type safety."""
+def version_column(table: Table) -> Column[Any]:
+    """
+    Return the column that changes whenever a row of the table does.
+
+    Args:
+        table: Table to look in
+
+    Returns:
+        First of ``VERSION_COLUMNS`` the table has
+
+    Raises:
+        ValueError: If the table has none of them
+    """
+    for name in VERSION_COLUMNS:
+        if name in table.c:
+            return table.c[name]
+    raise ValueError(f"{table.name} has none of {', '.join(VERSION_COLUMNS)}")
 
-    def __init__(self, session: AsyncSession, model_class: Type[ModelType]) -> None:
+
+class PostgresReader(Generic[ModelType]):
+    """
+    Async PostgreSQL reader for SQLModel models with full type safety.
+
+    Hot paths reuse statements from a ``StatementCache`` keyed by model,
+    operation and filter shape, passing values as bind parameters; see
+    ``statements``.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        model_class: Type[ModelType],
+        cursor_codec: Optional[CursorCodec] = None,
+        statements: Optional[StatementCache] = None,
+    ) -> None:
         """
         Initialize reader with an async session and model class.
 
         Args:
             session: SQLAlchemy async session
             model_class: The SQLModel class to query
+            cursor_codec: Codec for pagination cursors; defaults to the
+                settings-keyed codec
+            statements: Cache of built statements; defaults to the
+                process-wide cache
         """
         self.session: AsyncSession = session
         self.model_class: Type[ModelType] = model_class
+        self.cursor_codec: CursorCodec = cursor_codec or get_cursor_codec()
+        self.statements: StatementCache = (
+            statements if statements is not None else get_statement_cache()
+        )
 
+    @timed
     async def get_by_id(self, record_id: int) -> Optional[ModelType]:
         """
         Fetch a single record by ID.
@@ -36,9 +135,37 @@ class PostgresReader(Generic[ModelType]):
         """
         return await self.session.get(self.model_class, record_id)
 
+    @timed
+    async def get_many(self, record_ids: Sequence[int]) -> List[Optional[ModelType]]:
+        """
+        Fetch several records by ID in one query.
+
+        Args:
+            record_ids: Primary keys; duplicates are fetched once
+
+        Returns:
+            One entry per requested ID, in input order, None where not found
+        """
+        if not record_ids:
+            return []
+        statement: SelectOfScalar[ModelType] = self._cached(
+            ("get_many",), lambda: select(self.model_class).where(self._id_in())
+        )
+        result: Result[Tuple[ModelType]] = await self.session.execute(
+            statement, self._ids_param(record_ids)
+        )
+        found: Dict[int, ModelType] = {
+            getattr(item, "id"): item for item in result.scalars()
+        }
+        return [found.get(record_id) for record_id in record_ids]
+
+    @timed
     async def get_all(self, limit: int = 100, offset: int = 0) -> Sequence[ModelType]:
         """
-        Fetch all records with pagination.
+        Fetch all records with offset pagination.
+
+        Deep offsets scan and discard every skipped row; prefer ``get_page``
+        for walking large tables.
 
         Args:
             limit: Maximum number of records to return
@@ -47,48 +174,452 @@ class PostgresReader(Generic[ModelType]):
         Returns:
             Sequence of model instances
         """
-        statement = select(self.model_class).limit(limit).offset(offset)
-        result = await self.session.execute(statement)
+        statement: SelectOfScalar[ModelType] = self._cached(
+            ("get_all",),
+            lambda: (
+                select(self.model_class)
+                .limit(bindparam("limit"))
+                .offset(bindparam("offset"))
+            ),
+        )
+        result: Result[Tuple[ModelType]] = await self.session.execute(
+            statement, {"limit": limit, "offset": offset}
+        )
         return result.scalars().all()
 
-    async def get_by_filter(self, **filters: dict[str, Any]) -> Sequence[ModelType]:
+    @timed
+    async def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        sort: str = "id",
+        where: Optional[Condition] = None,
+    ) -> Page[ModelType]:
         """
-        Fetch records matching filter conditions.
+        Fetch one page of records using keyset (cursor) pagination.
+
+        Rows are ordered by ``(sort column, id)`` and each page seeks past the
+        last row of the previous one, so page N costs the same as page 1.
 
         Args:
-            **filters: Keyword arguments for filtering (field=value)
+            limit: Maximum number of records to return
+            cursor: Token from a previous page's ``next_cursor``
+            sort: Column to sort by, prefixed with ``-`` for descending
+            where: Optional filter condition applied before paging
 
         Returns:
-            Sequence of matching model instances
+            Page of model instances with the cursor for the next page
+
+        Raises:
+            InvalidSortError: If the sort key is not a sortable column
+            InvalidCursorError: If the cursor is invalid for this sort
+            InvalidFilterError: If the filter names an unknown column
+        """
+        sort_key: SortKey = SortKey.parse(sort)
+        statement: SelectOfScalar[ModelType]
+        params: Dict[str, Any]
+        statement, params = self._page_statement(
+            "get_page", lambda: select(self.model_class), sort_key, cursor, where, limit
+        )
+
+        result: Result[Tuple[ModelType]] = await self.session.execute(statement, params)
+        items: List[ModelType] = list(result.scalars().all())
+
+        next_cursor: Optional[str] = None
+        if len(items) > limit:
+            items = items[:limit]
+            last: ModelType = items[-1]
+            next_cursor = self.cursor_codec.encode(
+                sort_key, getattr(last, sort_key.column), getattr(last, "id")
+            )
+        return Page[ModelType](
+            items=items, next_cursor=next_cursor, limit=limit, sort=str(sort_key)
+        )
+
+    @timed
+    async def get_row(self, record_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a single record by ID as a plain column mapping.
+
+        Skips the ORM identity map and pydantic validation; pair with
+        ``rows.dump_row`` to serialize straight to JSON.
+
+        Args:
+            record_id: Primary key of the record
+
+        Returns:
+            Column values keyed by field name, or None if not found
+        """
+        table: Table = self._table()
+        statement: Select[Any] = self._cached(
+            ("get_row",),
+            lambda: select(*table.columns).where(table.c.id == bindparam("id")),
+        )
+        result: Result[Any] = await self.session.execute(statement, {"id": record_id})
+        row: Optional[RowMapping] = result.mappings().one_or_none()
+        return None if row is None else dict(row)
+
+    @timed
+    async def get_rows_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        sort: str = "id",
+        where: Optional[Condition] = None,
+    ) -> Page[Dict[str, Any]]:
+        """
+        Fetch one keyset page as plain column mappings.
+
+        Same ordering and cursors as ``get_page``, so the two can be mixed,
+        but rows are neither loaded into the session nor validated.
+
+        Args:
+            limit: Maximum number of records to return
+            cursor: Token from a previous page's ``next_cursor``
+            sort: Column to sort by, prefixed with ``-`` for descending
+            where: Optional filter condition applied before paging
+
+        Returns:
+            Page of column mappings with the cursor for the next page
+
+        Raises:
+            InvalidSortError: If the sort key is not a sortable column
+            InvalidCursorError: If the cursor is invalid for this sort
+            InvalidFilterError: If the filter names an unknown column
+        """
+        sort_key: SortKey = SortKey.parse(sort)
+        statement: Select[Any]
+        params: Dict[str, Any]
+        statement, params = self._page_statement(
+            "get_rows_page",
+            lambda: select(*self._table().columns),
+            sort_key,
+            cursor,
+            where,
+            limit,
+        )
+
+        result: Result[Any] = await self.session.execute(statement, params)
+        items: List[Dict[str, Any]] = [dict(row) for row in result.mappings()]
+
+        next_cursor: Optional[str] = None
+        if len(items) > limit:
+            items = items[:limit]
+            next_cursor = self.cursor_codec.encode(
+                sort_key, items[-1][sort_key.column], items[-1]["id"]
+            )
+        # Rows come straight from the database; skip re-validating them
+        return Page[Dict[str, Any]].model_construct(
+            items=items, next_cursor=next_cursor, limit=limit, sort=str(sort_key)
+        )
+
+    async def stream(
+        self,
+        sort: str = "id",
+        where: Optional[Condition] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[ModelType]:
+        """
+        Iterate over matching records through a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time, so memory stays flat however
+        many rows match. The session's connection is held until iteration
+        finishes or the generator is closed.
+
+        Args:
+            sort: Column to sort by, prefixed with ``-`` for descending
+            where: Optional filter condition
+            batch_size: Number of rows fetched per round trip
+
+        Yields:
+            Model instances in sort order
+
+        Raises:
+            InvalidSortError: If the sort key is not a sortable column
+            InvalidFilterError: If the filter names an unknown column
+        """
+        statement: SelectOfScalar[ModelType] = self._order_by(
+            select(self.model_class), SortKey.parse(sort)
+        )
+        if where is not None:
+            statement = statement.where(where.compile(self.model_class))
+
+        result: AsyncScalarResult[ModelType] = await self.session.stream_scalars(
+            statement.execution_options(yield_per=batch_size)
+        )
+        try:
+            async for item in result:
+                yield item
+        finally:
+            await result.close()
+
+    def _page_statement(
+        self,
+        operation: str,
+        base: Callable[[], SelectType],
+        sort_key: SortKey,
+        cursor: Optional[str],
+        where: Optional[Condition],
+        limit: int,
+    ) -> Tuple[SelectType, Dict[str, Any]]:
+        """
+        Filter, seek past a cursor, order and limit a select for one keyset page.
+
+        The statement is reused for every page with the same sort, cursor
+        kind and filter shape; the cursor position, filter values and limit
+        are returned as bind parameters.
+
+        Args:
+            operation: Reader method, part of the cache key
+            base: Builds the select over the model or its table columns
+            sort_key: Parsed sort key
+            cursor: Token from a previous page's ``next_cursor``
+            where: Optional filter condition
+            limit: Maximum number of records on the page
+
+        Returns:
+            Statement and the parameters to execute it with
+
+        Raises:
+            InvalidSortError: If the sort key is not a sortable column
+            InvalidCursorError: If the cursor is invalid for this sort
+            InvalidFilterError: If the filter names an unknown column
+        """
+        # Fetch one extra row to learn whether another page exists
+        params: Dict[str, Any] = {"limit": limit + 1}
+        position: Optional[Tuple[CursorValue, int]] = None
+        if cursor is not None:
+            position = self.cursor_codec.decode(cursor, sort_key)
+            params["cursor_value"], params["cursor_id"] = position
+
+        def build(binder: Optional[Binder]) -> SelectType:
+            statement: SelectType = base()
+            column: Column[Any] = self._sort_column(sort_key.column)
+            primary_key: Column[Any] = self._sort_column("id")
+            if where is not None:
+                statement = statement.where(where.compile(self.model_class, binder))
+            if position is not None:
+                statement = statement.where(
+                    seek_condition(
+                        column,
+                        primary_key,
+                        position[0],
+                        position[1],
+                        sort_key.descending,
+                        bool(column.nullable),
+                    )
+                )
+            return self._order_by(statement, sort_key).limit(bindparam("limit"))
+
+        # A NULL cursor value seeks with a different predicate
+        seek: Optional[bool] = None if position is None else position[0] is None
+        return self._filtered((operation, str(sort_key), seek), where, build, params)
+
+    def _order_by(self, statement: SelectType, sort_key: SortKey) -> SelectType:
+        """
+        Order a statement by ``(sort column, id)``, matching its index.
+
+        NOT NULL columns get plain ``ASC``/``DESC``, which a forward or
+        backward scan of the ``(column, id)`` index returns in order; a
+        nullable column keeps its NULLs last either way.
+
+        Args:
+            statement: Select statement over the model
+            sort_key: Parsed sort key
+
+        Returns:
+            Ordered statement
+
+        Raises:
+            InvalidSortError: If the sort key is not a sortable column
+        """
+        column: Column[Any] = self._sort_column(sort_key.column)
+        primary_key: Column[Any] = self._sort_column("id")
+        if sort_key.descending:
+            statement = statement.order_by(
+                column.desc().nulls_last() if column.nullable else column.desc()
+            )
+            if column is not primary_key:
+                statement = statement.order_by(primary_key.desc())
+        else:
+            # ASC already sorts NULLs last
+            statement = statement.order_by(column.asc())
+            if column is not primary_key:
+                statement = statement.order_by(primary_key.asc())
+        return statement
+
+    def _sort_column(self, name: str) -> Column[Any]:
+        """
+        Resolve a column name to a sortable table column.
+
+        Sortable columns are the primary key and columns that lead a
+        ``(column, id)`` index on the model, so every page is an index seek.
+
+        Args:
+            name: Column name
+
+        Returns:
+            Mapped table column
+
+        Raises:
+            InvalidSortError: If the name is not an indexed sort column
+        """
+        mapper: Mapper[ModelType] = inspect(self.model_class)
+        column: Optional[Column[Any]] = mapper.columns.get(name)
+        if column is None or not (
+            column.primary_key
+            or any(
+                [c.name for c in index.columns][:2] == [name, "id"]
+                for index in self._table().indexes
+            )
+        ):
+            raise InvalidSortError(
+                f"Cannot sort {self.model_class.__name__} by '{name}'"
+            )
+        return column
+
+    def _id_in(self) -> ColumnElement[bool]:
+        """
+        Match primary keys against the ``ids`` array parameter.
+
+        ``id = ANY(:ids)`` keeps a single statement shape however many IDs
+        are passed, unlike an ``IN`` list that expands per value.
+        """
+        return self._sort_column("id") == any_(
+            bindparam("ids", type_=ARRAY(BigInteger))
+        )
+
+    @staticmethod
+    def _ids_param(record_ids: Sequence[int]) -> Dict[str, Any]:
+        """Bind distinct IDs, in first-seen order, for ``_id_in``."""
+        return {"ids": list(dict.fromkeys(record_ids))}
+
+    def _cached(
+        self, shape: Tuple[Hashable, ...], build: Callable[[], StatementType]
+    ) -> StatementType:
+        """
+        Reuse the statement built for this model and shape.
+
+        Args:
+            shape: Operation name and whatever else changes the SQL text
+            build: Builds the statement with named bind parameters
+
+        Returns:
+            Statement to execute with this call's parameters
+        """
+        return self.statements.get((self.model_class, *shape), build)
+
+    def _filtered(
+        self,
+        shape: Tuple[Hashable, ...],
+        where: Optional[Condition],
+        build: Callable[[Optional[Binder]], StatementType],
+        params: Dict[str, Any],
+    ) -> Tuple[StatementType, Dict[str, Any]]:
+        """
+        Reuse the statement for a filter's shape and bind the filter's values.
+
+        Conditions without a shape are compiled inline with literal values
+        and never cached.
+
+        Args:
+            shape: Operation name and whatever else changes the SQL text
+            where: Optional filter condition
+            build: Builds the statement, binding filter values via the binder
+            params: Parameters other than the filter's; updated in place
+
+        Returns:
+            Statement and the parameters to execute it with
         """
-        statement: SelectOfScalar[ModelType] = select(self.model_class)
+        where_shape: Optional[Hashable] = None if where is None else where.shape()
+        if where is not None and where_shape is None:
+            return build(None), params
+        statement: StatementType = self._cached(
+            (*shape, where_shape), lambda: build(Binder())
+        )
+        if where is not None:
+            params.update(where.bind_params())
+        return statement, params
+
+    def _table(self) -> Table:
+        """Return the table the model maps to."""
+        mapper: Mapper[ModelType] = inspect(self.model_class)
+        table: Any = mapper.local_table
+        assert isinstance(table, Table)
+        return table
+
+    @timed
+    async def get_by_filter(
+        self, *conditions: Condition, limit: Optional[int] = None, **filters: Any
+    ) -> Sequence[ModelType]:
+        """
+        Fetch records matching filter conditions.
 
-        for field, value in filters.items():
-            if hasattr(self.model_class, field):
-                statement = statement.where(getattr(self.model_class, field) == value)
+        Args:
+            *conditions: Composable conditions (Contains, Range, In, ...)
+            limit: Optional maximum number of records to return
+            **filters: Keyword arguments for equality filtering (field=value)
+
+        Returns:
+            Sequence of matching model instances
 
-        result: Result[Tuple[ModelType]] = await self.session.execute(statement)
+        Raises:
+            InvalidFilterError: If a filter names an unknown column
+        """
+        where: Optional[Condition] = combine(conditions, **filters)
+
+        def build(binder: Optional[Binder]) -> SelectOfScalar[ModelType]:
+            statement: SelectOfScalar[ModelType] = select(self.model_class)
+            if where is not None:
+                statement = statement.where(where.compile(self.model_class, binder))
+            if limit is not None:
+                statement = statement.limit(bindparam("limit"))
+            return statement
+
+        statement: SelectOfScalar[ModelType]
+        params: Dict[str, Any]
+        statement, params = self._filtered(
+            ("get_by_filter", limit is not None), where, build, {"limit": limit}
+        )
+        result: Result[Tuple[ModelType]] = await self.session.execute(statement, params)
         return result.scalars().all()
 
+    @timed
     async def search_by_text(
-        self, field_name: str, search_term: str
+        self, field_name: str, search_term: str, limit: int = 100
     ) -> Sequence[ModelType]:
         """
-        Full-text search on a specific field.
+        Case-insensitive substring match on a specific text field.
+
+        This cannot use an index and scans the table; use
+        ``search.TextSearch`` (``game_search``) for ranked, indexed search.
 
         Args:
             field_name: Name of the text field to search
-            search_term: Search query string
+            search_term: Search query string, matched literally
+            limit: Maximum number of records to return
 
         Returns:
             Sequence of matching model instances
+
+        Raises:
+            InvalidFilterError: If the field is not a text column
         """
-        statement = select(self.model_class).where(
-            getattr(self.model_class, field_name).ilike(f"%{search_term}%")
+        column: Column[Any] = resolve_column(self.model_class, field_name, scalar=True)
+        column_type: TypeEngine[Any] = column.type
+        if isinstance(column_type, TypeDecorator):
+            column_type = column_type.impl_instance
+        if not isinstance(column_type, String):
+            raise InvalidFilterError(f"'{field_name}' is not a text column")
+        statement = (
+            select(self.model_class)
+            .where(column.icontains(search_term, autoescape=True))
+            .limit(limit)
         )
         result = await self.session.execute(statement)
         return result.scalars().all()
 
+    @timed
     async def get_with_relations(
         self, record_id: int, *relations: str
     ) -> Optional[ModelType]:
@@ -102,37 +633,57 @@ class PostgresReader(Generic[ModelType]):
         Returns:
             Model instance with loaded relationships or None
         """
-        statement = select(self.model_class).where(self.model_class.id == record_id)  # type: ignore
 
-        for relation in relations:
-            statement = statement.options(
-                selectinload(getattr(self.model_class, relation))
+        def build() -> SelectOfScalar[ModelType]:
+            statement: SelectOfScalar[ModelType] = select(self.model_class).where(
+                self._sort_column("id") == bindparam("id")
             )
-
-        result = await self.session.execute(statement)
+            for relation in relations:
+                statement = statement.options(
+                    selectinload(getattr(self.model_class, relation))
+                )
+            return statement
+
+        statement: SelectOfScalar[ModelType] = self._cached(
+            ("get_with_relations", relations), build
+        )
+        result: Result[Tuple[ModelType]] = await self.session.execute(
+            statement, {"id": record_id}
+        )
         return result.scalar_one_or_none()
 
-    async def count(self, **filters: dict[str, Any]) -> int:
+    @timed
+    async def count(self, *conditions: Condition, **filters: Any) -> int:
         """
         Count records with optional filters.
 
         Args:
-            **filters: Optional keyword arguments for filtering
+            *conditions: Optional composable conditions
+            **filters: Optional keyword arguments for equality filtering
 
         Returns:
             Count of matching records
-        """
-        statement: SelectOfScalar[int] = select(func.count()).select_from(
-            self.model_class
-        )
 
-        for field, value in filters.items():
-            if hasattr(self.model_class, field):
-                statement = statement.where(getattr(self.model_class, field) == value)
+        Raises:
+            InvalidFilterError: If a filter names an unknown column
+        """
+        where: Optional[Condition] = combine(conditions, **filters)
 
-        result: Result[Tuple[int]] = await self.session.execute(statement)
+        def build(binder: Optional[Binder]) -> SelectOfScalar[int]:
+            statement: SelectOfScalar[int] = select(func.count()).select_from(
+                self.model_class
+            )
+            if where is not None:
+                statement = statement.where(where.compile(self.model_class, binder))
+            return statement
+
+        statement: SelectOfScalar[int]
+        params: Dict[str, Any]
+        statement, params = self._filtered(("count",), where, build, {})
+        result: Result[Tuple[int]] = await self.session.execute(statement, params)
         return result.scalar() or 0
 
+    @timed
     async def exists(self, record_id: int) -> bool:
         """
         Check if a record exists.
@@ -143,13 +694,132 @@ class PostgresReader(Generic[ModelType]):
         Returns:
             True if record exists, False otherwise
         """
-        item = await self.session.get(self.model_class, record_id)
-        return item is not None
+        # Only the key is selected; the row itself is never loaded
+        primary_key: Column[Any] = self._sort_column("id")
+        statement: Select[Tuple[int]] = self._cached(
+            ("exists",),
+            lambda: select(primary_key).where(primary_key == bindparam("id")),
+        )
+        result: Result[Tuple[int]] = await self.session.execute(
+            statement, {"id": record_id}
+        )
+        return result.first() is not None
+
+    @timed
+    async def exists_many(self, record_ids: Sequence[int]) -> List[bool]:
+        """
+        Check which of several records exist, in one key-only query.
+
+        Args:
+            record_ids: Primary keys to check
+
+        Returns:
+            One flag per requested ID, in input order
+        """
+        if not record_ids:
+            return []
+        statement: Select[Tuple[int]] = self._cached(
+            ("exists_many",),
+            lambda: select(self._sort_column("id")).where(self._id_in()),
+        )
+        result: Result[Tuple[int]] = await self.session.execute(
+            statement, self._ids_param(record_ids)
+        )
+        present: set[int] = set(result.scalars())
+        return [record_id in present for record_id in record_ids]
+
+    @timed
+    async def get_version(
+        self, record_id: int, *relations: str
+    ) -> Optional[Tuple[Any, ...]]:
+        """
+        Fetch what changes whenever a record (and its children) change.
+
+        Selects only the record's version column (see ``VERSION_COLUMNS``)
+        and, per one-to-many relationship, the number of children, their
+        highest ID and their latest version column; the rows themselves are
+        never loaded. ``version_of`` computes the same tuple from a record
+        that is already loaded, e.g. from the cache.
+
+        Args:
+            record_id: Primary key of the record
+            relations: Names of one-to-many relationships to include
+
+        Returns:
+            Version tuple, or None if the record doesn't exist
+        """
+
+        def build() -> Select[Any]:
+            columns: List[ColumnElement[Any]] = [version_column(self._table())]
+            for relation in relations:
+                child: Table = self._child_table(relation)
+                columns += [
+                    func.count(distinct(child.c.id)),
+                    func.max(child.c.id),
+                    func.max(version_column(child)),
+                ]
+            primary_key: Column[Any] = self._sort_column("id")
+            statement: Select[Any] = (
+                select(*columns)
+                .select_from(self.model_class)
+                .where(primary_key == bindparam("id"))
+            )
+            for relation in relations:
+                statement = statement.outerjoin(getattr(self.model_class, relation))
+            return statement.group_by(primary_key) if relations else statement
+
+        statement: Select[Any] = self._cached(("get_version", relations), build)
+        result: Result[Any] = await self.session.execute(statement, {"id": record_id})
+        row: Optional[Any] = result.first()
+        return None if row is None else tuple(row)
+
+    def version_of(self, record: Any, *relations: str) -> Tuple[Any, ...]:
+        """
+        Compute ``get_version``'s tuple from a loaded record.
+
+        Args:
+            record: Instance with the relations loaded, or a row mapping
+                from ``get_row`` when there are no relations
+            relations: Names of the relationships ``get_version`` was given
+
+        Returns:
+            Version tuple; timestamps keep the form they were loaded in
+        """
+
+        def field(item: Any, name: str) -> Any:
+            return item[name] if isinstance(item, dict) else getattr(item, name)
 
+        version: List[Any] = [field(record, version_column(self._table()).key)]
+        for relation in relations:
+            children: List[Any] = list(field(record, relation))
+            stamp: str = version_column(self._child_table(relation)).key
+            stamps: List[Any] = [
+                field(child, stamp)
+                for child in children
+                if field(child, stamp) is not None
+            ]
+            version += [
+                len(children),
+                max((field(child, "id") for child in children), default=None),
+                max(stamps, default=None),
+            ]
+        return tuple(version)
+
+    def _child_table(self, relation: str) -> Table:
+        """Return the table of a one-to-many relationship's children."""
+        mapper: Mapper[ModelType] = inspect(self.model_class)
+        table: Any = mapper.relationships[relation].mapper.local_table
+        assert isinstance(table, Table)
+        return table
+
+    @timed
     async def create(self, instance: ModelType) -> ModelType:
         """
         Create a new record.
 
+        Commits at once, or with the rest of the request when the session
+        belongs to a ``UnitOfWork``.
+
         Args:
             instance: Model instance to create
 
@@ -157,38 +827,58 @@ class PostgresReader(Generic[ModelType]):
             Created model instance with ID
         """
         self.session.add(instance)
-        await self.session.commit()
-        await self.session.refresh(instance)
+        await self._save(instance)
         return instance
 
+    @timed
     async def update(self, instance: ModelType) -> ModelType:
         """
         Update an existing record.
 
+        Commits at once, or with the rest of the request when the session
+        belongs to a ``UnitOfWork``.
+
         Args:
             instance: Model instance to update
 
         Returns:
             Updated model instance
         """
+        use_primary(self.session)
         self.session.add(instance)
-        await self.session.commit()
-        await self.session.refresh(instance)
+        await self._save(instance)
         return instance
 
+    @timed
     async def delete(self, record_id: int) -> bool:
         """
         Delete a record by ID.
 
+        Commits at once, or with the rest of the request when the session
+        belongs to a ``UnitOfWork``.
+
         Args:
             record_id: Primary key of the record to delete
 
         Returns:
             True if deleted, False if not found
         """
+        # The lookup precedes any flush; a lagging replica could miss the row
+        use_primary(self.session)
         instance = await self.session.get(self.model_class, record_id)
         if instance:
             await self.session.delete(instance)
-            await self.session.commit()
+            await self._save()
             return True
         return False
+
+    async def _save(self, instance: Optional[ModelType] = None) -> None:
+        # Inside a unit of work the flush is enough; it commits once at the end
+        await self.session.flush()
+        if unit_of_work(self.session) is not None:
+            return
+        await self.session.commit()
+        # Server defaults came back through RETURNING (eager_defaults), so a
+        # refresh is only needed when the commit expired them
+        if instance is not None and self.session.sync_session.expire_on_commit:
+            await self.session.refresh(instance)
@@ -0,0 +1,40 @@
+from typing import Any, Dict
+
+from pydantic import TypeAdapter
+
+from games_rule_core.postgres.reader.pagination import Page
+
+# Column values keyed by field name, as returned by PostgresReader.get_row
+Row = Dict[str, Any]
+
+# Built once: schema compilation is far more expensive than a single dump.
+# Values are serialized by their runtime type (datetime, list, ...) without
+# running model validators, which is safe for rows read from our own tables.
+ROW_ADAPTER: TypeAdapter[Row] = TypeAdapter(Row)
+ROW_PAGE_ADAPTER: TypeAdapter[Page[Row]] = TypeAdapter(Page[Row])
+
+
+def dump_row(row: Row) -> bytes:
+    """
+    Serialize one row to JSON.
+
+    Args:
+        row: Column mapping, e.g. from ``PostgresReader.get_row``
+
+    Returns:
+        UTF-8 JSON object
+    """
+    return ROW_ADAPTER.dump_json(row)
+
+
+def dump_page(page: Page[Row]) -> bytes:
+    """
+    Serialize a page of rows to JSON.
+
+    Args:
+        page: Page from ``PostgresReader.get_rows_page``
+
+    Returns:
+        UTF-8 JSON object in the same shape as ``Page[Model]``
+    """
+    return ROW_PAGE_ADAPTER.dump_json(page)
@@ -0,0 +1,280 @@
+import re
+from typing import Any, Dict, Generic, List, Optional, Sequence, Tuple, Type
+
+from pydantic import BaseModel, Field
+from sqlalchemy import (
+    Column,
+    ColumnElement,
+    Float,
+    Result,
+    Row,
+    Table,
+    Text,
+    cast,
+    func,
+    inspect,
+    literal,
+    literal_column,
+    or_,
+    select,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSQUERY, TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapper
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.selectable import Subquery
+
+from games_rule_core.postgres.metrics import timed
+from games_rule_core.postgres.models.models import Game, RuleChunk
+from games_rule_core.postgres.reader.filters import Condition
+from games_rule_core.postgres.reader.pagination import (
+    CursorCodec,
+    ItemType,
+    Page,
+    SortKey,
+    get_cursor_codec,
+    seek_condition,
+)
+from games_rule_core.postgres.reader.reader import ModelType
+
+# Rank order is fixed, so every search cursor is issued for this sort key
+RANK_SORT: SortKey = SortKey(column="rank", descending=True)
+
+HEADLINE_OPTIONS: str = (
+    "StartSel=<mark>, StopSel=</mark>, MaxWords=35, MinWords=15, MaxFragments=2"
+)
+
+# Terms of web search syntax: a word or "quoted phrase", negated by a leading -
+WEBSEARCH_TERM: re.Pattern[str] = re.compile(r'(-?)("[^"]*"?|[^\s"]+)')
+
+
+class SearchHit(BaseModel, Generic[ItemType]):
+    """A search result with its relevance score and highlighted snippets."""
+
+    item: ItemType
+    rank: Optional[float] = None
+    highlights: Dict[str, str] = Field(default_factory=dict)
+
+
+class TextSearch(Generic[ModelType]):
+    """
+    Ranked full-text search over a maintained ``tsvector`` column.
+
+    Matches use the GIN-indexed ``@@`` operator and are ranked with
+    ``ts_rank_cd``. With ``fuzzy`` enabled, a pg_trgm ``<%`` match on a short
+    text column adds typo tolerance, also served by a GIN index. Snippets are
+    produced with ``ts_headline`` for the returned page only.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        model_class: Type[ModelType],
+        vector_column: str,
+        highlight_fields: Sequence[str],
+        fuzzy_field: Optional[str] = None,
+        config: str = "english",
+        cursor_codec: Optional[CursorCodec] = None,
+    ) -> None:
+        """
+        Initialize search over one model.
+
+        Args:
+            session: SQLAlchemy async session
+            model_class: The SQLModel class to search
+            vector_column: Name of the generated ``tsvector`` column
+            highlight_fields: Text columns to build snippets for
+            fuzzy_field: Column with a trigram index for typo-tolerant matches
+            config: Text search configuration used to build the vector
+            cursor_codec: Codec for pagination cursors
+        """
+        self.session: AsyncSession = session
+        self.model_class: Type[ModelType] = model_class
+        self.config: str = config
+        self.cursor_codec: CursorCodec = cursor_codec or get_cursor_codec()
+
+        table: Table = self._table()
+        self._vector: ColumnElement[Any] = literal_column(
+            f"{table.name}.{vector_column}", type_=TSVECTOR
+        )
+        self._highlight_columns: List[Column[Any]] = [
+            table.c[name] for name in highlight_fields
+        ]
+        self._fuzzy_column: Optional[Column[Any]] = (
+            table.c[fuzzy_field] if fuzzy_field is not None else None
+        )
+        self._primary_key: Column[Any] = table.c["id"]
+
+    @timed
+    async def search(
+        self,
+        query: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        where: Optional[Condition] = None,
+        fuzzy: bool = True,
+        match_all: bool = True,
+    ) -> Page[SearchHit[ModelType]]:
+        """
+        Run a ranked search and return one page of hits.
+
+        Args:
+            query: User query in web search syntax (quotes, ``or``, ``-``)
+            limit: Maximum number of hits to return
+            cursor: Token from a previous page's ``next_cursor``
+            where: Optional filter condition applied alongside the match
+            fuzzy: Whether to also match near-miss spellings via trigrams
+            match_all: Require every term; when False any term matches and
+                rows covering more terms rank higher, which suits questions
+
+        Returns:
+            Page of hits ordered by descending rank
+
+        Raises:
+            InvalidCursorError: If the cursor is invalid
+            InvalidFilterError: If the filter names an unknown column
+        """
+        regconfig: ColumnElement[Any] = cast(literal(self.config), REGCONFIG)
+        tsquery: ColumnElement[Any] = func.websearch_to_tsquery(regconfig, query)
+        if not match_all:
+            wanted, excluded = _split_negated(query)
+            # Stop words are already gone; phrases (<->) keep their adjacency
+            tsquery = cast(
+                func.replace(
+                    cast(func.websearch_to_tsquery(regconfig, wanted), Text), "&", "|"
+                ),
+                TSQUERY,
+            )
+            if excluded:
+                # "a b -c" is (a | b) & !c, not a | b | !c, which matches nearly all
+                tsquery = func.tsquery_and(
+                    tsquery,
+                    func.tsquery_not(
+                        func.websearch_to_tsquery(regconfig, " or ".join(excluded))
+                    ),
+                )
+
+        match: ColumnElement[bool] = self._vector.bool_op("@@")(tsquery)
+        score: ColumnElement[float] = func.ts_rank_cd(self._vector, tsquery)
+        if fuzzy and self._fuzzy_column is not None:
+            match = or_(match, literal(query).bool_op("<%")(self._fuzzy_column))
+            score = score + func.word_similarity(query, self._fuzzy_column)
+
+        ranked_statement: Select[Tuple[int, float]] = select(
+            self._primary_key.label("id"), cast(score, Float).label("rank")
+        ).where(match)
+        if where is not None:
+            ranked_statement = ranked_statement.where(where.compile(self.model_class))
+        ranked: Subquery = ranked_statement.subquery("ranked")
+
+        page_statement: Select[Tuple[int, float]] = select(ranked.c.id, ranked.c.rank)
+        if cursor is not None:
+            last_rank, last_id = self.cursor_codec.decode(cursor, RANK_SORT)
+            page_statement = page_statement.where(
+                seek_condition(
+                    ranked.c.rank, ranked.c.id, last_rank, last_id, True, False
+                )
+            )
+        page: Subquery = (
+            page_statement.order_by(ranked.c.rank.desc(), ranked.c.id.desc())
+            .limit(limit + 1)
+            .subquery("page")
+        )
+
+        # Snippets are computed for the page rows only, after ranking and limit
+        headlines: List[ColumnElement[Any]] = [
+            func.ts_headline(
+                regconfig, func.coalesce(column, ""), tsquery, HEADLINE_OPTIONS
+            ).label(f"headline_{column.name}")
+            for column in self._highlight_columns
+        ]
+        statement = (
+            select(self.model_class, page.c.rank, *headlines)
+            .join(page, self._primary_key == page.c.id)
+            .order_by(page.c.rank.desc(), page.c.id.desc())
+        )
+        result: Result[Any] = await self.session.execute(statement)
+        rows: Sequence[Row[Any]] = result.all()
+
+        hits: List[SearchHit[ModelType]] = [
+            SearchHit[ModelType](
+                item=row[0],
+                rank=row[1],
+                highlights=self._highlights(row),
+            )
+            for row in rows[:limit]
+        ]
+        next_cursor: Optional[str] = None
+        if len(rows) > limit:
+            last: SearchHit[ModelType] = hits[-1]
+            next_cursor = self.cursor_codec.encode(
+                RANK_SORT, last.rank, getattr(last.item, "id")
+            )
+        return Page[SearchHit[ModelType]](
+            items=hits, next_cursor=next_cursor, limit=limit, sort=str(RANK_SORT)
+        )
+
+    def _highlights(self, row: Row[Any]) -> Dict[str, str]:
+        # Keep only snippets that actually contain a highlighted term
+        snippets: Dict[str, str] = {}
+        for offset, column in enumerate(self._highlight_columns, start=2):
+            snippet: Optional[str] = row[offset]
+            if snippet and "<mark>" in snippet:
+                snippets[column.name] = snippet
+        return snippets
+
+    def _table(self) -> Table:
+        mapper: Mapper[ModelType] = inspect(self.model_class)
+        table: Any = mapper.local_table
+        assert isinstance(table, Table)
+        return table
+
+
+def _split_negated(query: str) -> Tuple[str, List[str]]:
+    # Returns the query without its negated terms, and those terms unprefixed
+    wanted: List[str] = []
+    excluded: List[str] = []
+    for sign, term in WEBSEARCH_TERM.findall(query):
+        (excluded if sign else wanted).append(term)
+    return " ".join(wanted), excluded
+
+
+def game_search(
+    session: AsyncSession, cursor_codec: Optional[CursorCodec] = None
+) -> TextSearch[Game]:
+    """
+    Build the catalogue search over game name, description, designer and publisher.
+
+    Args:
+        session: SQLAlchemy async session
+        cursor_codec: Codec for pagination cursors
+
+    Returns:
+        Search engine bound to the ``games.search_vector`` column
+    """
+    return TextSearch[Game](
+        session,
+        Game,
+        vector_column="search_vector",
+        highlight_fields=("name", "description", "designer", "publisher"),
+        fuzzy_field="name",
+        cursor_codec=cursor_codec,
+    )
+
+
+def rule_chunk_search(session: AsyncSession) -> TextSearch[RuleChunk]:
+    """
+    Build keyword search over rulebook chunks, section titles weighted highest.
+
+    Args:
+        session: SQLAlchemy async session
+
+    Returns:
+        Search engine bound to the ``rule_chunks.search_vector`` column
+    """
+    return TextSearch[RuleChunk](
+        session,
+        RuleChunk,
+        vector_column="search_vector",
+        highlight_fields=("text",),
+    )
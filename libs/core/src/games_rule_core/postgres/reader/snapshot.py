@@ -0,0 +1,689 @@
+"""
+Column-oriented in-memory snapshot of the game catalogue.
+
+The filterable ``GameBase`` columns are held as NumPy arrays in id order:
+numbers as ``int32``/``float64`` with a null mask, publisher and designer as
+``int32`` codes, and the tag arrays as one bitset per game (``uint64`` words,
+one bit per distinct tag). Filter conditions evaluate to boolean masks with
+SQL's three-valued logic, so a snapshot query returns the same games as
+``PostgresReader.get_by_filter`` as of the last refresh, without a round
+trip or model validation. Only ids or slim rows come back.
+
+``refresh`` re-reads games whose ``updated_at`` is at or after the newest one
+seen, less ``REFRESH_OVERLAP`` for transactions that commit late, and drops
+deleted games when the table's row count no longer matches.
+
+Requires the optional ``snapshot`` dependency (``games_rule_core[snapshot]``).
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+try:
+    import numpy as np
+    from numpy.typing import NDArray
+except ImportError as e:
+    raise ImportError(
+        "CatalogueSnapshot requires the 'snapshot' extra: "
+        "pip install 'games_rule_core[snapshot]'"
+    ) from e
+from sqlalchemy import Result, Select, Table, func, inspect, select
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.ext.asyncio import AsyncResult, AsyncSession
+from sqlalchemy.orm import Mapper
+
+from games_rule_core.postgres.metrics import timed
+from games_rule_core.postgres.models.models import Game
+from games_rule_core.postgres.reader.filters import (
+    And,
+    Condition,
+    Contains,
+    Eq,
+    In,
+    Not,
+    Or,
+    Overlaps,
+    Range,
+    Spans,
+    combine,
+    resolve_column,
+)
+from games_rule_core.postgres.reader.rows import Row
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# Columns held by the snapshot, by how they are stored
+INT_COLUMNS: Tuple[str, ...] = (
+    "min_players",
+    "max_players",
+    "min_playtime_minutes",
+    "max_playtime_minutes",
+    "min_age",
+    "year_published",
+)
+FLOAT_COLUMNS: Tuple[str, ...] = ("complexity_rating",)
+CODED_COLUMNS: Tuple[str, ...] = ("publisher", "designer")
+TAG_COLUMNS: Tuple[str, ...] = ("game_types", "game_mechanics")
+COLUMNS: Tuple[str, ...] = INT_COLUMNS + FLOAT_COLUMNS + CODED_COLUMNS + TAG_COLUMNS
+
+WORD_BITS: int = 64
+
+# How far before the newest updated_at a refresh re-reads; updated_at is
+# the writing transaction's start time, so a long transaction can commit
+# rows older than ones already seen
+REFRESH_OVERLAP: timedelta = timedelta(minutes=1)
+
+# Limited queries evaluate this many rows first and the rest only when
+# they match too few, the way an index scan stops at LIMIT
+FIRST_BLOCK_ROWS: int = 65_536
+
+# In-lists up to this long are matched with equality passes, longer ones
+# with np.isin
+MEMBER_COMPARISONS: int = 8
+
+Mask = NDArray[np.bool_]
+# Ids, column arrays and null masks of a batch of games
+Encoded = Tuple[NDArray[np.int64], Dict[str, NDArray[Any]], Dict[str, Mask]]
+
+
+class UnsupportedFilterError(ValueError):
+    """Raised when a filter needs a column or operator the snapshot lacks."""
+
+
+class Vocabulary:
+    """Codes of the distinct values of a text or tag column, in first-seen order."""
+
+    def __init__(self) -> None:
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def encode(self, value: str) -> int:
+        """Return the code of value, assigning the next one if it is new."""
+        code: Optional[int] = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    @property
+    def words(self) -> int:
+        """Number of ``uint64`` words a bitset over every value needs."""
+        return max(1, -(-len(self.values) // WORD_BITS))
+
+
+class CatalogueSnapshot:
+    """
+    In-memory snapshot of the filterable game columns.
+
+    Build one with ``load`` and keep it current with ``refresh``. Each
+    worker process holds its own copy (about 80 bytes per game).
+    """
+
+    model_class: Type[Game] = Game
+
+    def __init__(self) -> None:
+        """Initialize an empty snapshot; ``load`` fills one from the database."""
+        self.vocabularies: Dict[str, Vocabulary] = {
+            name: Vocabulary() for name in CODED_COLUMNS + TAG_COLUMNS
+        }
+        self.ids: NDArray[np.int64]
+        self.columns: Dict[str, NDArray[Any]]
+        self.nulls: Dict[str, Mask]
+        self.ids, self.columns, self.nulls = self._encode([])
+        self.has_nulls: Dict[str, bool] = {}
+        self.watermark: Optional[datetime] = None
+
+    @classmethod
+    async def load(
+        cls, session: AsyncSession, batch_size: int = 10_000
+    ) -> "CatalogueSnapshot":
+        """
+        Read the whole catalogue into a new snapshot.
+
+        Args:
+            session: SQLAlchemy async session
+            batch_size: Rows fetched and encoded per round trip
+
+        Returns:
+            Snapshot of every game
+        """
+        snapshot: CatalogueSnapshot = cls()
+        await snapshot.refresh(session, batch_size=batch_size)
+        return snapshot
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the snapshot's arrays."""
+        arrays: List[NDArray[Any]] = [
+            self.ids,
+            *self.columns.values(),
+            *self.nulls.values(),
+        ]
+        return sum(array.nbytes for array in arrays)
+
+    @timed
+    async def refresh(
+        self,
+        session: AsyncSession,
+        overlap: timedelta = REFRESH_OVERLAP,
+        batch_size: int = 10_000,
+    ) -> int:
+        """
+        Apply games written since the last refresh and drop deleted ones.
+
+        Everything is read before the arrays change, and they change without
+        awaiting, so queries on the event loop never see a partial refresh.
+
+        Args:
+            session: SQLAlchemy async session
+            overlap: How far before the newest ``updated_at`` seen to re-read
+            batch_size: Rows fetched and encoded per round trip
+
+        Returns:
+            Number of games re-read or removed
+        """
+        table: Table = self._table()
+        statement: Select[Any] = select(
+            table.c.id, table.c.updated_at, *(table.c[name] for name in COLUMNS)
+        )
+        full: bool = self.watermark is None
+        if self.watermark is not None:
+            statement = statement.where(table.c.updated_at >= self.watermark - overlap)
+
+        chunks: List[Encoded] = []
+        watermark: Optional[datetime] = self.watermark
+        result: AsyncResult[Any] = await session.stream(
+            statement.execution_options(yield_per=batch_size)
+        )
+        async for partition in result.mappings().partitions():
+            chunks.append(self._encode(partition))
+            stamps: List[datetime] = [
+                row["updated_at"] for row in partition if row["updated_at"] is not None
+            ]
+            if stamps:
+                latest: datetime = max(stamps)
+                watermark = latest if watermark is None else max(watermark, latest)
+        ids: NDArray[np.int64]
+        columns: Dict[str, NDArray[Any]]
+        nulls: Dict[str, Mask]
+        ids, columns, nulls = self._concatenate(chunks)
+
+        live: Optional[NDArray[np.int64]] = None
+        if not full:
+            # Deletes leave no updated_at behind; a row count that disagrees
+            # with ours is the cue to compare ids (a key-only scan)
+            added: int = int(np.count_nonzero(~np.isin(ids, self.ids)))
+            total: int = (
+                await session.execute(select(func.count()).select_from(table))
+            ).scalar_one()
+            if total != len(self.ids) + added:
+                id_result: Result[Tuple[int]] = await session.execute(
+                    select(table.c.id).order_by(table.c.id)
+                )
+                live = np.fromiter(id_result.scalars(), dtype=np.int64)
+
+        before: int = len(self.ids)
+        self._apply(ids, columns, nulls)
+        removed: int = 0
+        if live is not None:
+            keep: Mask = np.isin(self.ids, live)
+            removed = int(np.count_nonzero(~keep))
+            if removed:
+                self.ids = self.ids[keep]
+                self.columns = {k: v[keep] for k, v in self.columns.items()}
+                self.nulls = {k: v[keep] for k, v in self.nulls.items()}
+        self.has_nulls = {name: bool(null.any()) for name, null in self.nulls.items()}
+        self.watermark = watermark
+        logger.info(
+            "Catalogue snapshot refreshed: %d games read, %d new, %d removed, "
+            "%d held (%.1f MiB)",
+            len(ids),
+            len(self.ids) + removed - before,
+            removed,
+            len(self.ids),
+            self.nbytes / 2**20,
+        )
+        return len(ids) + removed
+
+    def mask(self, where: Optional[Condition] = None) -> Mask:
+        """
+        Evaluate a filter over every game in the snapshot.
+
+        Args:
+            where: Optional filter condition, e.g. ``GameFilter.to_condition()``
+
+        Returns:
+            Boolean mask aligned with ``ids``; True where the filter holds
+
+        Raises:
+            InvalidFilterError: If the filter names an unknown column
+            UnsupportedFilterError: If the filter needs a column the snapshot
+                does not hold (name, description, ...)
+        """
+        return self._matches(where, slice(None))
+
+    def count(self, *conditions: Condition, **filters: Any) -> int:
+        """
+        Count games matching filter conditions, like ``PostgresReader.count``.
+
+        Args:
+            *conditions: Composable conditions (Contains, Range, In, ...)
+            **filters: Keyword arguments for equality filtering (field=value)
+
+        Returns:
+            Number of matching games
+        """
+        return int(np.count_nonzero(self.mask(combine(conditions, **filters))))
+
+    def get_ids_by_filter(
+        self,
+        *conditions: Condition,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        **filters: Any,
+    ) -> List[int]:
+        """
+        Fetch the ids of games matching filter conditions, in id order.
+
+        Args:
+            *conditions: Composable conditions (Contains, Range, In, ...)
+            limit: Optional maximum number of ids to return
+            offset: Number of matching games to skip
+            **filters: Keyword arguments for equality filtering (field=value)
+
+        Returns:
+            Matching game ids
+        """
+        positions: NDArray[np.intp] = self._positions(
+            combine(conditions, **filters), limit, offset
+        )
+        ids: List[int] = self.ids[positions].tolist()
+        return ids
+
+    def get_rows_by_filter(
+        self,
+        *conditions: Condition,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        **filters: Any,
+    ) -> List[Row]:
+        """
+        Fetch the held columns of games matching filter conditions, in id order.
+
+        Args:
+            *conditions: Composable conditions (Contains, Range, In, ...)
+            limit: Optional maximum number of rows to return
+            offset: Number of matching games to skip
+            **filters: Keyword arguments for equality filtering (field=value)
+
+        Returns:
+            Rows with ``id`` and the ``COLUMNS`` fields, None for NULL
+        """
+        positions: NDArray[np.intp] = self._positions(
+            combine(conditions, **filters), limit, offset
+        )
+        fields: Dict[str, List[Any]] = {"id": self.ids[positions].tolist()}
+        for name in INT_COLUMNS + FLOAT_COLUMNS:
+            values: List[Any] = self.columns[name][positions].tolist()
+            null: List[bool] = self.nulls[name][positions].tolist()
+            fields[name] = [None if n else v for v, n in zip(values, null)]
+        for name in CODED_COLUMNS:
+            names: List[str] = self.vocabularies[name].values
+            fields[name] = [
+                None if code < 0 else names[code]
+                for code in self.columns[name][positions].tolist()
+            ]
+        for name in TAG_COLUMNS:
+            fields[name] = self._decode_tags(name, positions)
+        return [dict(zip(fields, values)) for values in zip(*fields.values())]
+
+    def _positions(
+        self, where: Optional[Condition], limit: Optional[int], offset: int
+    ) -> NDArray[np.intp]:
+        end: Optional[int] = None if limit is None else offset + limit
+        if end is None or len(self.ids) <= FIRST_BLOCK_ROWS:
+            return np.flatnonzero(self.mask(where))[offset:end]
+        first: NDArray[np.intp] = np.flatnonzero(
+            self._matches(where, slice(0, FIRST_BLOCK_ROWS))
+        )
+        if len(first) >= end:
+            return first[offset:end]
+        rest: NDArray[np.intp] = np.flatnonzero(
+            self._matches(where, slice(FIRST_BLOCK_ROWS, None))
+        )
+        return np.concatenate([first, rest + FIRST_BLOCK_ROWS])[offset:end]
+
+    def _matches(self, where: Optional[Condition], rows: slice) -> Mask:
+        if where is None:
+            return np.ones(self._size(rows), dtype=np.bool_)
+        return self._evaluate(where, rows)[0]
+
+    def _decode_tags(
+        self, name: str, positions: NDArray[np.intp]
+    ) -> List[Optional[List[str]]]:
+        values: List[str] = self.vocabularies[name].values
+        codes: NDArray[np.int64] = np.arange(len(values), dtype=np.int64)
+        bits: NDArray[np.uint64] = self.columns[name][positions]
+        # (rows, tags) matrix of set bits, read word by word
+        present: Mask = (
+            (bits[:, codes // WORD_BITS] >> (codes % WORD_BITS).astype(np.uint64))
+            & np.uint64(1)
+        ).astype(np.bool_)
+        null: List[bool] = self.nulls[name][positions].tolist()
+        return [
+            None if is_null else [values[code] for code in np.flatnonzero(row)]
+            for row, is_null in zip(present, null)
+        ]
+
+    def _evaluate(
+        self, condition: Condition, rows: slice
+    ) -> Tuple[Mask, Optional[Mask]]:
+        # Returns (true, unknown) over a slice of rows: where the condition
+        # is TRUE, and where it is NULL, or None when nowhere; NOT and OR
+        # need the difference between FALSE and NULL to match SQL
+        if isinstance(condition, And):
+            parts = [self._evaluate(c, rows) for c in condition.conditions]
+            true: Mask = np.ones(self._size(rows), dtype=np.bool_)
+            for part_true, _ in parts:
+                true &= part_true
+            unknowns: List[Mask] = [u for _, u in parts if u is not None]
+            if not unknowns:
+                return true, None
+            unknown: Mask = _union(unknowns)
+            for part_true, part_unknown in parts:
+                unknown &= (
+                    part_true if part_unknown is None else (part_true | part_unknown)
+                )
+            return true, unknown
+        if isinstance(condition, Or):
+            parts = [self._evaluate(c, rows) for c in condition.conditions]
+            true = _union([t for t, _ in parts])
+            unknowns = [u for _, u in parts if u is not None]
+            if not unknowns:
+                return true, None
+            return true, _union(unknowns) & ~true
+        if isinstance(condition, Not):
+            inner_true: Mask
+            inner_unknown: Optional[Mask]
+            inner_true, inner_unknown = self._evaluate(condition.condition, rows)
+            if inner_unknown is None:
+                return ~inner_true, None
+            return ~(inner_true | inner_unknown), inner_unknown
+        leaf_true: Mask
+        leaf_unknown: Optional[Mask]
+        leaf_true, leaf_unknown = self._compare(condition, rows)
+        # NULLs are stored as 0, -1 or no bits; comparing one gives NULL
+        if leaf_unknown is not None:
+            leaf_true &= ~leaf_unknown
+        return leaf_true, leaf_unknown
+
+    def _compare(
+        self, condition: Condition, rows: slice
+    ) -> Tuple[Mask, Optional[Mask]]:
+        if isinstance(condition, Eq):
+            return self._equals(condition.field, condition.value, rows)
+        if isinstance(condition, In):
+            return self._member(condition.field, condition.values, rows)
+        if isinstance(condition, Range):
+            return self._range(condition, rows)
+        if isinstance(condition, Spans):
+            lower: NDArray[Any] = self._numbers(condition.lower)[rows]
+            upper: NDArray[Any] = self._numbers(condition.upper)[rows]
+            return (
+                (lower <= condition.value) & (upper >= condition.value),
+                self._unknown(rows, condition.lower, condition.upper),
+            )
+        if isinstance(condition, (Contains, Overlaps)):
+            return self._tags(condition, rows)
+        raise UnsupportedFilterError(
+            f"The catalogue snapshot cannot evaluate {type(condition).__name__}"
+        )
+
+    def _equals(
+        self, field: str, value: Any, rows: slice
+    ) -> Tuple[Mask, Optional[Mask]]:
+        resolve_column(self.model_class, field)
+        self._held(field)
+        if value is None:
+            return self.nulls[field][rows].copy(), None
+        if field in TAG_COLUMNS:
+            raise UnsupportedFilterError(
+                f"The catalogue snapshot compares '{field}' with Contains/Overlaps only"
+            )
+        if field in CODED_COLUMNS:
+            value = self.vocabularies[field].codes.get(value, -1)
+            if value < 0:
+                return np.zeros(self._size(rows), dtype=np.bool_), self._unknown(
+                    rows, field
+                )
+        return self.columns[field][rows] == value, self._unknown(rows, field)
+
+    def _member(
+        self, field: str, values: List[Any], rows: slice
+    ) -> Tuple[Mask, Optional[Mask]]:
+        resolve_column(self.model_class, field, scalar=True)
+        self._held(field)
+        column: NDArray[Any] = self.columns[field][rows]
+        if field in CODED_COLUMNS:
+            codes: Dict[str, int] = self.vocabularies[field].codes
+            values = [codes[value] for value in values if value in codes]
+        if len(values) > MEMBER_COMPARISONS:
+            return np.isin(column, values), self._unknown(rows, field)
+        # A few equality passes beat isin's sort
+        true: Mask = np.zeros(len(column), dtype=np.bool_)
+        for value in values:
+            true |= column == value
+        return true, self._unknown(rows, field)
+
+    def _range(self, condition: Range, rows: slice) -> Tuple[Mask, Optional[Mask]]:
+        resolve_column(self.model_class, condition.field, scalar=True)
+        column: NDArray[Any] = self._numbers(condition.field)[rows]
+        true: Mask = np.ones(len(column), dtype=np.bool_)
+        if condition.gte is not None:
+            true &= column >= condition.gte
+        if condition.gt is not None:
+            true &= column > condition.gt
+        if condition.lte is not None:
+            true &= column <= condition.lte
+        if condition.lt is not None:
+            true &= column < condition.lt
+        return true, self._unknown(rows, condition.field)
+
+    def _tags(
+        self, condition: Union[Contains, Overlaps], rows: slice
+    ) -> Tuple[Mask, Optional[Mask]]:
+        resolve_column(self.model_class, condition.field, array=True)
+        bits: NDArray[np.uint64] = self.columns[condition.field][rows]
+        codes: Dict[str, int] = self.vocabularies[condition.field].codes
+        wanted: NDArray[np.uint64] = np.zeros(bits.shape[1], dtype=np.uint64)
+        missing: bool = False
+        for value in condition.values:
+            code: Optional[int] = codes.get(value)
+            # Tags first seen by a refresh still in flight are in no row yet
+            if code is None or code // WORD_BITS >= len(wanted):
+                missing = True
+                continue
+            wanted[code // WORD_BITS] |= np.uint64(1) << np.uint64(code % WORD_BITS)
+        unknown: Optional[Mask] = self._unknown(rows, condition.field)
+        contains: bool = isinstance(condition, Contains)
+        # Test only the words holding a wanted tag, one column at a time
+        true: Mask = np.full(len(bits), contains and not missing, dtype=np.bool_)
+        if contains and missing:
+            return true, unknown
+        for word in np.flatnonzero(wanted):
+            column: NDArray[np.uint64] = bits[:, word] & wanted[word]
+            if contains:
+                true &= column == wanted[word]
+            else:
+                true |= column != 0
+        return true, unknown
+
+    def _numbers(self, field: str) -> NDArray[Any]:
+        self._held(field)
+        if field not in INT_COLUMNS + FLOAT_COLUMNS:
+            raise UnsupportedFilterError(
+                f"The catalogue snapshot holds '{field}' as codes; use Eq/In"
+            )
+        return self.columns[field]
+
+    def _unknown(self, rows: slice, *fields: str) -> Optional[Mask]:
+        nullable: List[Mask] = [
+            self.nulls[field][rows] for field in fields if self.has_nulls.get(field)
+        ]
+        if not nullable:
+            return None
+        return _union(nullable)
+
+    def _size(self, rows: slice) -> int:
+        return len(range(*rows.indices(len(self.ids))))
+
+    def _held(self, field: str) -> None:
+        if field not in COLUMNS:
+            raise UnsupportedFilterError(
+                f"The catalogue snapshot does not hold '{field}'"
+            )
+
+    def _encode(self, rows: Sequence[RowMapping]) -> Encoded:
+        count: int = len(rows)
+        ids: NDArray[np.int64] = np.fromiter(
+            (row["id"] for row in rows), dtype=np.int64, count=count
+        )
+        columns: Dict[str, NDArray[Any]] = {}
+        nulls: Dict[str, Mask] = {}
+        for name in COLUMNS:
+            values: List[Any] = [row[name] for row in rows]
+            nulls[name] = np.fromiter(
+                (value is None for value in values), dtype=np.bool_, count=count
+            )
+            if name in INT_COLUMNS:
+                columns[name] = np.fromiter(
+                    (0 if value is None else value for value in values),
+                    dtype=np.int32,
+                    count=count,
+                )
+            elif name in FLOAT_COLUMNS:
+                # NaN never compares true, like NULL
+                columns[name] = np.fromiter(
+                    (np.nan if value is None else float(value) for value in values),
+                    dtype=np.float64,
+                    count=count,
+                )
+            elif name in CODED_COLUMNS:
+                vocabulary: Vocabulary = self.vocabularies[name]
+                columns[name] = np.fromiter(
+                    (
+                        -1 if value is None else vocabulary.encode(value)
+                        for value in values
+                    ),
+                    dtype=np.int32,
+                    count=count,
+                )
+            else:
+                columns[name] = self._encode_tags(name, values)
+        return ids, columns, nulls
+
+    def _encode_tags(
+        self, name: str, values: List[Optional[List[str]]]
+    ) -> NDArray[np.uint64]:
+        vocabulary: Vocabulary = self.vocabularies[name]
+        rows: List[int] = []
+        codes: List[int] = []
+        for index, tags in enumerate(values):
+            for tag in tags or ():
+                rows.append(index)
+                codes.append(vocabulary.encode(tag))
+        bits: NDArray[np.uint64] = np.zeros(
+            (len(values), vocabulary.words), dtype=np.uint64
+        )
+        code_array: NDArray[np.int64] = np.array(codes, dtype=np.int64)
+        np.bitwise_or.at(
+            bits,
+            (np.array(rows, dtype=np.intp), code_array // WORD_BITS),
+            np.uint64(1) << (code_array % WORD_BITS).astype(np.uint64),
+        )
+        return bits
+
+    def _concatenate(
+        self,
+        chunks: List[Encoded],
+    ) -> Encoded:
+        if not chunks:
+            return self._encode([])
+        if len(chunks) == 1:
+            return chunks[0]
+        # Earlier chunks were encoded before later ones grew a vocabulary
+        for _, columns, _ in chunks:
+            self._widen(columns)
+        return (
+            np.concatenate([ids for ids, _, _ in chunks]),
+            {
+                name: np.concatenate([columns[name] for _, columns, _ in chunks])
+                for name in COLUMNS
+            },
+            {
+                name: np.concatenate([nulls[name] for _, _, nulls in chunks])
+                for name in COLUMNS
+            },
+        )
+
+    def _widen(self, columns: Dict[str, NDArray[Any]]) -> None:
+        for name in TAG_COLUMNS:
+            extra: int = self.vocabularies[name].words - columns[name].shape[1]
+            if extra > 0:
+                columns[name] = np.pad(columns[name], ((0, 0), (0, extra)))
+
+    def _apply(
+        self,
+        ids: NDArray[np.int64],
+        columns: Dict[str, NDArray[Any]],
+        nulls: Dict[str, Mask],
+    ) -> None:
+        self._widen(self.columns)
+        self._widen(columns)
+        positions: NDArray[np.intp] = np.searchsorted(self.ids, ids)
+        found: Mask = positions < len(self.ids)
+        found[found] = self.ids[positions[found]] == ids[found]
+        for name in COLUMNS:
+            self.columns[name][positions[found]] = columns[name][found]
+            self.nulls[name][positions[found]] = nulls[name][found]
+        fresh: Mask = ~found
+        if not fresh.any():
+            return
+
+        added: NDArray[np.int64] = ids[fresh]
+        merged_ids: NDArray[np.int64] = np.concatenate([self.ids, added])
+        merged: Dict[str, NDArray[Any]] = {
+            name: np.concatenate([self.columns[name], columns[name][fresh]])
+            for name in COLUMNS
+        }
+        merged_nulls: Dict[str, Mask] = {
+            name: np.concatenate([self.nulls[name], nulls[name][fresh]])
+            for name in COLUMNS
+        }
+        # New games usually have the highest ids; re-sort only when not
+        in_order: bool = bool(np.all(np.diff(added) > 0)) and (
+            not len(self.ids) or bool(added[0] > self.ids[-1])
+        )
+        if not in_order:
+            order: NDArray[np.intp] = np.argsort(merged_ids, kind="stable")
+            merged_ids = merged_ids[order]
+            merged = {name: array[order] for name, array in merged.items()}
+            merged_nulls = {name: array[order] for name, array in merged_nulls.items()}
+        self.ids, self.columns, self.nulls = merged_ids, merged, merged_nulls
+
+    def _table(self) -> Table:
+        mapper: Mapper[Game] = inspect(self.model_class)
+        table: Any = mapper.local_table
+        assert isinstance(table, Table)
+        return table
+
+
+def _union(masks: List[Mask]) -> Mask:
+    union: Mask = masks[0].copy()
+    for mask in masks[1:]:
+        union |= mask
+    return union
@@ -0,0 +1,78 @@
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Hashable, TypeVar
+
+from prometheus_client import Counter
+from sqlalchemy import Executable
+
+from games_rule_core.postgres.config import Settings, get_settings
+
+StatementType = TypeVar("StatementType", bound=Executable)
+
+STATEMENT_CACHE_LOOKUPS: Counter = Counter(
+    "games_rule_statement_cache_lookups_total",
+    "PostgresReader statement cache lookups, by result (hit, miss)",
+    ["result"],
+)
+
+
+class StatementCache:
+    """
+    Built SQL statements keyed by their shape, least recently used evicted.
+
+    A shape is everything that changes the SQL text: the model, the reader
+    operation, the sort key, whether a cursor is given and the structure of
+    the filter. Values travel as named bind parameters, so one statement
+    serves every call of the same shape. A hit skips building the
+    ``select()`` and its cache key; SQLAlchemy then finds the compiled form
+    in its own cache and asyncpg reuses the prepared statement on the
+    connection.
+    """
+
+    def __init__(self, max_size: int = 500) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            max_size: Statements kept; 0 disables caching
+        """
+        self.max_size: int = max_size
+        self._statements: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get(self, key: Hashable, build: Callable[[], StatementType]) -> StatementType:
+        """
+        Return the statement for a shape, building it on first use.
+
+        Args:
+            key: Shape of the statement
+            build: Builds the statement with named bind parameters
+
+        Returns:
+            Cached or newly built statement
+        """
+        statement: Any = self._statements.get(key)
+        if statement is not None:
+            self._statements.move_to_end(key)
+            STATEMENT_CACHE_LOOKUPS.labels("hit").inc()
+            return statement  # type: ignore[no-any-return]
+        STATEMENT_CACHE_LOOKUPS.labels("miss").inc()
+        built: StatementType = build()
+        if self.max_size > 0:
+            self._statements[key] = built
+            if len(self._statements) > self.max_size:
+                self._statements.popitem(last=False)
+        return built
+
+    def clear(self) -> None:
+        """Drop every cached statement."""
+        self._statements.clear()
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+
+@lru_cache
+def get_statement_cache() -> StatementCache:
+    """Return the process-wide statement cache sized from settings."""
+    settings: Settings = get_settings()
+    return StatementCache(settings.postgres_statement_cache_size)
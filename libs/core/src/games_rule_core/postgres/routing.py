@@ -0,0 +1,205 @@
+import asyncio
+import logging
+import time
+from itertools import cycle
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from sqlalchemy import Connection, Engine, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+# session.info flag: once set, every statement in the session uses the primary
+USE_PRIMARY: str = "use_primary"
+# session.info slot holding the replica a session is bound to for its lifetime
+REPLICA: str = "replica"
+
+# Seconds the replica is behind the primary; 0 when fully replayed or not a standby
+LAG_QUERY: str = """
+SELECT CASE
+  WHEN NOT pg_is_in_recovery() THEN 0
+  WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+  ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+END
+"""
+
+
+class ReplicaPool:
+    """
+    Read replicas with round-robin selection and lag-aware health.
+
+    Every session that picks a replica starts a background probe if the
+    last one is older than ``check_interval`` seconds; one that is
+    unreachable or further behind than ``max_lag`` is skipped until a later
+    probe finds it healthy again. With no healthy replica, including before
+    the first probe completes, reads fall back to the primary.
+    """
+
+    def __init__(
+        self,
+        engines: List[AsyncEngine],
+        max_lag: float = 10.0,
+        check_interval: float = 5.0,
+    ) -> None:
+        """
+        Initialize pool over replica engines.
+
+        Args:
+            engines: One engine per replica host
+            max_lag: Seconds of replication lag above which a replica is skipped
+            check_interval: Minimum seconds between lag probes
+        """
+        self.engines: List[AsyncEngine] = engines
+        self.max_lag: float = max_lag
+        self.check_interval: float = check_interval
+        self.lag: Dict[int, Optional[float]] = {}
+        # Replicas serve no reads until a probe has seen them caught up
+        self._unhealthy: Set[int] = set(range(len(engines)))
+        self._next: Iterator[int] = cycle(range(len(engines)))
+        self._checked_at: float = float("-inf")
+        self._probe: Optional[asyncio.Task[None]] = None
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """
+        Pick the next healthy replica.
+
+        Returns:
+            Replica engine, or None when no replica is healthy
+        """
+        for _ in range(len(self.engines)):
+            index: int = next(self._next)
+            if index not in self._unhealthy:
+                return self.engines[index]
+        return None
+
+    def maybe_refresh(self) -> None:
+        """Start a background lag probe if the last one is older than the interval."""
+        if not self.engines or (self._probe and not self._probe.done()):
+            return
+        if time.monotonic() - self._checked_at < self.check_interval:
+            return
+        try:
+            loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Outside an event loop there is nothing to run the probe on
+            return
+        self._checked_at = time.monotonic()
+        self._probe = loop.create_task(self.refresh())
+
+    async def refresh(self) -> None:
+        """Probe every replica and update which ones may serve reads."""
+        lags: List[Optional[float]] = await asyncio.gather(
+            *(self._measure(engine) for engine in self.engines)
+        )
+        for index, lag in enumerate(lags):
+            self.lag[index] = lag
+            if lag is None or lag > self.max_lag:
+                if index not in self._unhealthy:
+                    logger.warning(
+                        "Replica %s removed from reads (lag: %s)",
+                        self.engines[index].url.host,
+                        "unreachable" if lag is None else f"{lag:.1f}s",
+                    )
+                self._unhealthy.add(index)
+            else:
+                self._unhealthy.discard(index)
+
+    async def dispose(self) -> None:
+        """Dispose every replica engine."""
+        for engine in self.engines:
+            await engine.dispose()
+
+    async def _measure(self, engine: AsyncEngine) -> Optional[float]:
+        try:
+            async with asyncio.timeout(self.check_interval):
+                connection: AsyncConnection
+                async with engine.connect() as connection:
+                    lag: Any = await connection.scalar(text(LAG_QUERY))
+                    return float(lag or 0)
+        except Exception:
+            logger.debug("Replica probe failed", exc_info=True)
+            return None
+
+
+class RoutingSession(Session):
+    """
+    Session that sends reads to a replica and everything else to the primary.
+
+    Writes, flushes, ``SELECT ... FOR UPDATE`` and raw SQL go to the primary
+    and pin the session there, so it reads its own writes for the rest of
+    its life. A session that only reads sticks to one replica, keeping a
+    single connection and a consistent snapshot.
+    """
+
+    def __init__(self, replicas: Optional[ReplicaPool] = None, **kwargs: Any) -> None:
+        """
+        Initialize session.
+
+        Args:
+            replicas: Pool to read from; without one every statement uses the bind
+            **kwargs: Passed through to ``Session``
+        """
+        super().__init__(**kwargs)
+        self.replicas: Optional[ReplicaPool] = replicas
+
+    def get_bind(
+        self,
+        mapper: Optional[Any] = None,
+        *,
+        clause: Optional[ClauseElement] = None,
+        bind: Optional[Engine | Connection] = None,
+        **kw: Any,
+    ) -> Engine | Connection:
+        primary: Engine | Connection = super().get_bind(
+            mapper, clause=clause, bind=bind, **kw
+        )
+        if self.replicas is None or self.info.get(USE_PRIMARY):
+            return primary
+        if self._flushing or is_write(clause):
+            self.info[USE_PRIMARY] = True
+            return primary
+
+        replica: Optional[AsyncEngine] = self.info.get(REPLICA)
+        if replica is None:
+            # Any session may trigger the probe, so every caller of the
+            # session factory keeps replica health current, not just the API
+            self.replicas.maybe_refresh()
+            replica = self.replicas.choose()
+            if replica is None:
+                return primary
+            self.info[REPLICA] = replica
+        return replica.sync_engine
+
+
+def use_primary(session: AsyncSession) -> None:
+    """
+    Pin a session to the primary before it runs any statement.
+
+    Use for reads that must see writes committed elsewhere moments ago.
+
+    Args:
+        session: Session to pin
+    """
+    session.info[USE_PRIMARY] = True
+
+
+def is_write(clause: Optional[ClauseElement]) -> bool:
+    """
+    Tell whether a statement must run on the primary.
+
+    Args:
+        clause: Statement about to run, or None for a bare connection request
+
+    Returns:
+        True for DML, ``FOR UPDATE``, raw SQL and bare connection requests
+    """
+    if clause is None:
+        # Connection requested without a statement, e.g. session.connection()
+        return True
+    if isinstance(clause, (UpdateBase, TextClause)):
+        return True
+    return getattr(clause, "_for_update_arg", None) is not None
@@ -1,30 +1,147 @@
 # libs/storage/src/games_rule_storage/session.py
-from typing import AsyncGenerator
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Callable, Dict, List
+from uuid import uuid4
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
-from .config import settings  # Import the settings instance
+from .breaker import CircuitBreaker
+from .config import Settings, get_settings
+from .metrics import instrument_engine
+from .pool import GuardedQueuePool, guard_engine
+from .routing import ReplicaPool, RoutingSession
+from .unit_of_work import UnitOfWork
 
-# Use settings.database_url to create the engine
-async_engine = create_async_engine(
-    settings.database_url,  # This reads from your Settings Pydantic model
-    echo=True,
-    future=True,
-    pool_pre_ping=True,
-    pool_size=20,
-    max_overflow=10,
-)
+# Connection circuit breakers keyed by engine name ("primary", "replica-0", ...)
+breakers: Dict[str, CircuitBreaker] = {}
+
+
+def _connect_args(settings: Settings) -> Dict[str, Any]:
+    connect_args: Dict[str, Any] = {
+        "timeout": settings.postgres_connect_timeout_seconds,
+        "prepared_statement_cache_size": (
+            settings.postgres_prepared_statement_cache_size
+        ),
+    }
+    if settings.postgres_pgbouncer:
+        # asyncpg numbers statements per connection, so two clients sharing a
+        # server connection through PgBouncer would collide on "__asyncpg_stmt_1__"
+        connect_args["prepared_statement_name_func"] = lambda: (
+            f"__asyncpg_{uuid4().hex}__"
+        )
+        # asyncpg's own cache (used for its type introspection) cannot follow
+        # PgBouncer's connection switching either
+        connect_args["statement_cache_size"] = 0
+    return connect_args
+
+
+def _create_engine(url: str, name: str) -> AsyncEngine:
+    settings: Settings = get_settings()
+    pool_size, max_overflow = settings.pool_sizes
+    engine: AsyncEngine = create_async_engine(
+        url,  # This reads from your Settings Pydantic model
+        echo=settings.postgres_echo,
+        future=True,
+        poolclass=GuardedQueuePool,
+        pool_pre_ping=True,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        connect_args=_connect_args(settings),
+    )
+    instrument_engine(engine, name, settings.postgres_slow_query_ms)
+    breakers[name] = CircuitBreaker(
+        name,
+        failure_threshold=settings.postgres_breaker_failure_threshold,
+        reset_timeout=settings.postgres_breaker_reset_seconds,
+    )
+    guard_engine(engine, name, breakers[name])
+    return engine
+
+
+# Engines are built on first use, so importing this module neither reads
+# settings nor loads the asyncpg driver
+@lru_cache
+def get_engine() -> AsyncEngine:
+    """Return the primary engine, created on first use."""
+    return _create_engine(get_settings().database_url, "primary")
+
+
+@lru_cache
+def get_replica_engines() -> List[AsyncEngine]:
+    """Return one engine per read replica; empty when POSTGRES_REPLICA_HOSTS is unset."""
+    return [
+        _create_engine(url, f"replica-{index}")
+        for index, url in enumerate(get_settings().replica_urls)
+    ]
 
-async_session_maker = async_sessionmaker(
-    bind=async_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autoflush=False,
-    autocommit=False,
-)
+
+@lru_cache
+def get_replicas() -> ReplicaPool:
+    """Return the pool that picks a healthy replica for reads."""
+    settings: Settings = get_settings()
+    return ReplicaPool(
+        get_replica_engines(),
+        max_lag=settings.postgres_replica_max_lag_seconds,
+        check_interval=settings.postgres_replica_check_interval_seconds,
+    )
+
+
+@lru_cache
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Return the session factory; reads go to replicas when there are any."""
+    replicas: ReplicaPool = get_replicas()
+    return async_sessionmaker(
+        bind=get_engine(),
+        class_=AsyncSession,
+        sync_session_class=RoutingSession,
+        replicas=replicas if replicas.engines else None,
+        expire_on_commit=False,
+        autoflush=False,
+        autocommit=False,
+    )
+
+
+async def dispose_engines() -> None:
+    """Close the pooled connections of every engine created so far."""
+    if get_engine.cache_info().currsize:
+        await get_engine().dispose()
+    if get_replica_engines.cache_info().currsize:
+        for engine in get_replica_engines():
+            await engine.dispose()
+
+
+def __getattr__(name: str) -> Any:
+    # Module-level names of earlier releases, now created on first access
+    getters: Dict[str, Callable[[], Any]] = {
+        "async_engine": get_engine,
+        "async_session_maker": get_session_maker,
+        "replica_engines": get_replica_engines,
+        "replicas": get_replicas,
+    }
+    if name in getters:
+        return getters[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     """Yield database sessions for FastAPI dependency injection."""
-    async with async_session_maker() as session:
+    async with get_session_maker()() as session:
         yield session
+
+
+async def get_unit_of_work() -> AsyncGenerator[UnitOfWork, None]:
+    """
+    Yield a request's unit of work for FastAPI dependency injection.
+
+    Commits once when the handler returns and rolls back if it raises.
+    Declare it with ``Depends(get_unit_of_work, scope="function")`` so the
+    commit happens before the response is sent; a streamed response must
+    keep the default request scope to read while it streams.
+    """
+    async with UnitOfWork(get_session_maker()) as uow:
+        yield uow
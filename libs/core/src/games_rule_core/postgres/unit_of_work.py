@@ -0,0 +1,172 @@
+from types import TracebackType
+from typing import Any, Awaitable, Callable, List, Optional, Type
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from games_rule_core.postgres.routing import is_write
+
+# session.info slot holding the UnitOfWork that owns a session
+UNIT_OF_WORK: str = "unit_of_work"
+
+
+class UnitOfWorkSession(AsyncSession):
+    """
+    Session that gives its connection back to the pool after every read.
+
+    A statement that leaves nothing to commit ends its transaction as soon
+    as its rows are buffered, so the connection is checked in again while
+    the caller works with the result; the next statement checks one out
+    anew. With ``expire_on_commit=False`` loaded objects stay usable in
+    between. Once the session writes (a flush, or an INSERT, UPDATE,
+    DELETE, ``FOR UPDATE`` or raw SQL statement) it keeps its connection
+    until the transaction is committed or rolled back. Streamed results and
+    savepoints hold the connection as well.
+
+    Consecutive reads may therefore see different snapshots; use a plain
+    ``AsyncSession`` where several reads must agree with each other.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.wrote: bool = False
+
+    async def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        if is_write(statement):
+            self.wrote = True
+        result: Any = await super().execute(statement, *args, **kwargs)
+        await self.release()
+        return result
+
+    async def scalar(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        if is_write(statement):
+            self.wrote = True
+        result: Any = await super().scalar(statement, *args, **kwargs)
+        await self.release()
+        return result
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        result: Any = await super().get(*args, **kwargs)
+        await self.release()
+        return result
+
+    async def flush(self, objects: Optional[Any] = None) -> None:
+        self.wrote = True
+        await super().flush(objects)
+
+    async def commit(self) -> None:
+        await super().commit()
+        self.wrote = False
+
+    async def rollback(self) -> None:
+        await super().rollback()
+        self.wrote = False
+
+    async def release(self) -> None:
+        """End a read-only transaction so its connection returns to the pool."""
+        if (
+            self.wrote
+            or not self.in_transaction()
+            or self.in_nested_transaction()
+            or self.new
+            or self.deleted
+            or self.dirty
+        ):
+            return
+        await super().commit()
+
+
+class UnitOfWork:
+    """
+    Database work of one request, committed once at the end.
+
+    The session is opened on first use, so requests answered without the
+    database (cache hits, validation errors) never touch the pool, and it
+    is a ``UnitOfWorkSession``, so reads hold a connection only while their
+    statement runs. Writes made through the session (e.g. ``PostgresReader``
+    ``create``/``update``/``delete``) are flushed rather than committed and
+    land in a single commit when the unit of work ends without an error;
+    an error rolls them back. Callbacks registered with ``after_commit``
+    run once that commit succeeded, which is where cache invalidation
+    belongs.
+    """
+
+    def __init__(self, session_maker: async_sessionmaker[AsyncSession]) -> None:
+        """
+        Initialize unit of work.
+
+        Args:
+            session_maker: Factory whose settings the session is opened with
+        """
+        self.session_maker: async_sessionmaker[AsyncSession] = session_maker
+        self._session: Optional[AsyncSession] = None
+        self._after_commit: List[Callable[[], Awaitable[Any]]] = []
+
+    @property
+    def session(self) -> AsyncSession:
+        """Session of this unit of work, opened on first access."""
+        if self._session is None:
+            # The factory's settings (bind, routing, expire_on_commit) with this class
+            self._session = UnitOfWorkSession(**self.session_maker.kw)
+            self._session.info[UNIT_OF_WORK] = self
+        return self._session
+
+    def after_commit(self, callback: Callable[[], Awaitable[Any]]) -> None:
+        """
+        Run a callback once the unit of work has committed.
+
+        Args:
+            callback: Coroutine function called without arguments
+        """
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        """Commit pending writes, then run the after-commit callbacks."""
+        if self._session is not None and self._session.in_transaction():
+            await self._session.commit()
+        callbacks: List[Callable[[], Awaitable[Any]]] = self._after_commit
+        self._after_commit = []
+        for callback in callbacks:
+            await callback()
+
+    async def rollback(self) -> None:
+        """Discard pending writes and the after-commit callbacks."""
+        self._after_commit = []
+        if self._session is not None and self._session.in_transaction():
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        """Close the session, returning any connection it still holds."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "UnitOfWork":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        try:
+            if exc_type is None:
+                await self.commit()
+            else:
+                await self.rollback()
+        finally:
+            await self.close()
+
+
+def unit_of_work(session: AsyncSession) -> Optional[UnitOfWork]:
+    """
+    Return the unit of work that owns a session, if any.
+
+    Args:
+        session: Session to look up
+
+    Returns:
+        Owning unit of work, or None for a standalone session
+    """
+    owner: Optional[UnitOfWork] = session.info.get(UNIT_OF_WORK)
+    return owner
@@ -0,0 +1,306 @@
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
+
+from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy import Column, ColumnDefault, Result, Table, inspect
+from sqlalchemy.dialects.postgresql import Insert, insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapper
+from sqlalchemy.sql.dml import ReturningInsert
+from sqlmodel import SQLModel
+
+from games_rule_core.cache.cache import ReadThroughCache
+from games_rule_core.cache.reader import invalidation_keys
+from games_rule_core.postgres.models.models import (
+    Game,
+    GameBase,
+    Rulebook,
+    RulebookBase,
+)
+from games_rule_core.postgres.reader.reader import ModelType
+from games_rule_core.postgres.unit_of_work import UnitOfWork, unit_of_work
+
+# Unique key of game_documents; re-uploading a file updates its row in place
+RULEBOOK_CONFLICT_KEY: Tuple[str, ...] = (
+    "game_id",
+    "minio_bucket",
+    "minio_object_path",
+)
+
+
+class RowError(BaseModel):
+    """A single input row that could not be written."""
+
+    index: int
+    error: str
+
+
+class BulkResult(BaseModel):
+    """Outcome of a bulk write."""
+
+    written: int = 0
+    ids: List[int] = Field(default_factory=list)
+    errors: List[RowError] = Field(default_factory=list)
+
+
+class BulkWriter(Generic[ModelType]):
+    """
+    Batched writer for loading many rows of one model.
+
+    Items are validated against the base schema in chunks and written with a
+    single multi-row ``INSERT ... RETURNING`` per chunk, committing once per
+    chunk instead of once per row. A chunk that the database rejects is
+    retried row by row inside savepoints, so one bad row is reported in
+    ``BulkResult.errors`` without failing its neighbours.
+
+    Inside a ``UnitOfWork`` chunks are only flushed: the whole write lands
+    in the unit of work's single commit, holding one connection until then,
+    and cache entries are dropped after that commit.
+
+    Writes bypass ``CachedReader``; given the cache, each committed chunk
+    drops the entries of its rows and their parents (e.g. an upserted
+    rulebook's ``games:{id}|rulebooks``). Without it, cached records stay
+    stale until they expire.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        model_class: Type[ModelType],
+        schema: Type[SQLModel],
+        conflict_columns: Sequence[str] = (),
+        chunk_size: int = 1000,
+        cache: Optional[ReadThroughCache] = None,
+    ) -> None:
+        """
+        Initialize writer for one table.
+
+        Args:
+            session: SQLAlchemy async session
+            model_class: The SQLModel table class to insert into
+            schema: Non-table model used to validate incoming items
+            conflict_columns: Unique key to upsert on; plain insert if empty
+            chunk_size: Number of rows validated and inserted per statement
+            cache: Read-through cache to invalidate after each chunk
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.session: AsyncSession = session
+        self.model_class: Type[ModelType] = model_class
+        self.schema: Type[SQLModel] = schema
+        self.chunk_size: int = chunk_size
+        self.cache: Optional[ReadThroughCache] = cache
+
+        mapper: Mapper[ModelType] = inspect(model_class)
+        table: Any = mapper.local_table
+        assert isinstance(table, Table)
+        self._table: Table = table
+        # Only schema fields are written; ids and timestamps come from the DB
+        self._fields: Set[str] = {
+            name for name in schema.model_fields if name in table.c
+        }
+        self._statement: ReturningInsert[Tuple[int]] = self._build_statement(
+            conflict_columns
+        )
+
+    async def write(self, items: Iterable[Any] | AsyncIterable[Any]) -> BulkResult:
+        """
+        Validate and write items, committing after each chunk.
+
+        Inside a unit of work nothing is committed here; the unit of work
+        commits every chunk at once.
+
+        Args:
+            items: Dicts, model instances, or JSON documents as str/bytes,
+                from a regular or async iterable
+
+        Returns:
+            Count and ids of written rows plus per-row errors by input index
+        """
+        result: BulkResult = BulkResult()
+        async for start, chunk in _chunks(items, self.chunk_size):
+            rows: List[Dict[str, Any]] = []
+            indexes: List[int] = []
+            for offset, item in enumerate(chunk):
+                try:
+                    rows.append(self._validate(item))
+                    indexes.append(start + offset)
+                except ValidationError as e:
+                    result.errors.append(
+                        RowError(index=start + offset, error=_describe(e))
+                    )
+            if rows:
+                await self._write_chunk(rows, indexes, result)
+        result.errors.sort(key=lambda error: error.index)
+        return result
+
+    async def _write_chunk(
+        self, rows: List[Dict[str, Any]], indexes: List[int], result: BulkResult
+    ) -> None:
+        written: List[Tuple[Dict[str, Any], int]]
+        try:
+            async with self.session.begin_nested():
+                # RETURNING is in parameter order, so ids pair up with rows
+                written = list(zip(rows, await self._execute(rows)))
+        except DBAPIError:
+            # Isolate the offending rows; the rest of the chunk still lands
+            written = []
+            for index, row in zip(indexes, rows):
+                try:
+                    async with self.session.begin_nested():
+                        written.extend((row, id_) for id_ in await self._execute([row]))
+                except DBAPIError as e:
+                    result.errors.append(RowError(index=index, error=_describe(e)))
+        owner: Optional[UnitOfWork] = unit_of_work(self.session)
+        if owner is None:
+            await self.session.commit()
+        else:
+            await self.session.flush()
+        if self.cache is not None and written:
+            cache: ReadThroughCache = self.cache
+            keys: Set[str] = set()
+            for row, id_ in written:
+                keys |= invalidation_keys(self.model_class(**row, id=id_))
+            # Dropped before the commit, entries could be refilled with old rows
+            if owner is None:
+                await cache.invalidate(keys)
+            else:
+                owner.after_commit(lambda: cache.invalidate(keys))
+        result.written += len(written)
+        result.ids.extend(id_ for _, id_ in written)
+
+    async def _execute(self, rows: List[Dict[str, Any]]) -> List[int]:
+        # executemany with RETURNING is batched into multi-row VALUES statements
+        executed: Result[Tuple[int]] = await self.session.execute(self._statement, rows)
+        return list(executed.scalars().all())
+
+    def _validate(self, item: Any) -> Dict[str, Any]:
+        validated: SQLModel
+        if isinstance(item, (str, bytes)):
+            validated = self.schema.model_validate_json(item)
+        else:
+            validated = self.schema.model_validate(
+                item.model_dump() if isinstance(item, BaseModel) else item
+            )
+        return validated.model_dump(include=self._fields)
+
+    def _build_statement(
+        self, conflict_columns: Sequence[str]
+    ) -> ReturningInsert[Tuple[int]]:
+        primary_key: Column[Any] = self._table.c["id"]
+        statement: Insert = insert(self._table)
+        if conflict_columns:
+            updates: Dict[str, Any] = {
+                name: statement.excluded[name]
+                for name in sorted(self._fields)
+                if name not in conflict_columns
+            }
+            # ON CONFLICT DO UPDATE skips the ORM's onupdate defaults (e.g.
+            # game_documents.uploaded_at, which versions a game's rulebooks)
+            for column in self._table.c:
+                if (
+                    isinstance(column.onupdate, ColumnDefault)
+                    and column.name not in updates
+                ):
+                    updates[column.name] = column.onupdate.arg
+            statement = statement.on_conflict_do_update(
+                index_elements=list(conflict_columns), set_=updates
+            )
+        return statement.returning(primary_key, sort_by_parameter_order=True)
+
+
+async def _chunks(
+    items: Iterable[Any] | AsyncIterable[Any], size: int
+) -> AsyncIterator[Tuple[int, List[Any]]]:
+    # Yields (index of first item, items) without materialising the whole input
+    chunk: List[Any] = []
+    start: int = 0
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            chunk.append(item)
+            if len(chunk) == size:
+                yield start, chunk
+                start, chunk = start + size, []
+    else:
+        for item in items:
+            chunk.append(item)
+            if len(chunk) == size:
+                yield start, chunk
+                start, chunk = start + size, []
+    if chunk:
+        yield start, chunk
+
+
+def _describe(error: Exception) -> str:
+    if isinstance(error, ValidationError):
+        return "; ".join(
+            f"{'.'.join(str(part) for part in detail['loc']) or 'item'}: "
+            f"{detail['msg']}"
+            for detail in error.errors(include_url=False)
+        )
+    if isinstance(error, DBAPIError) and error.orig is not None:
+        # Prefer the driver's own message over the DB-API wrapper's repr
+        cause: BaseException = error.orig.__cause__ or error.orig
+        return str(cause).split("\n", 1)[0]
+    return str(error)
+
+
+def game_writer(
+    session: AsyncSession,
+    chunk_size: int = 1000,
+    cache: Optional[ReadThroughCache] = None,
+) -> BulkWriter[Game]:
+    """
+    Build a bulk writer inserting ``GameBase`` items into ``games``.
+
+    Args:
+        session: SQLAlchemy async session
+        chunk_size: Number of rows per statement
+        cache: Read-through cache to invalidate after each chunk
+
+    Returns:
+        Writer for the games table
+    """
+    return BulkWriter[Game](session, Game, GameBase, chunk_size=chunk_size, cache=cache)
+
+
+def rulebook_writer(
+    session: AsyncSession,
+    chunk_size: int = 1000,
+    cache: Optional[ReadThroughCache] = None,
+) -> BulkWriter[Rulebook]:
+    """
+    Build a bulk writer upserting ``RulebookBase`` items into ``game_documents``.
+
+    Rows that match an existing ``(game_id, minio_bucket, minio_object_path)``
+    update that document instead of failing on the unique constraint.
+
+    Args:
+        session: SQLAlchemy async session
+        chunk_size: Number of rows per statement
+        cache: Read-through cache to invalidate after each chunk
+
+    Returns:
+        Writer for the game_documents table
+    """
+    return BulkWriter[Rulebook](
+        session,
+        Rulebook,
+        RulebookBase,
+        conflict_columns=RULEBOOK_CONFLICT_KEY,
+        chunk_size=chunk_size,
+        cache=cache,
+    )
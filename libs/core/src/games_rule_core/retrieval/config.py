@@ -0,0 +1,25 @@
+from functools import lru_cache
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class RetrievalSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="RETRIEVAL_")
+
+    # Wall-clock budget for a whole retrieval, backends and hydration included
+    budget_seconds: float = Field(default=1.0)
+    # Per-backend limits; a backend that overruns is dropped from the fusion
+    metadata_timeout_seconds: float = Field(default=0.3)
+    keyword_timeout_seconds: float = Field(default=0.6)
+    vector_timeout_seconds: float = Field(default=0.6)
+    # Hits requested from each ranked backend before fusion
+    candidates: int = Field(default=40)
+    # Reciprocal rank fusion constant; larger flattens the weight of top ranks
+    rrf_k: int = Field(default=60)
+
+
+@lru_cache
+def get_retrieval_settings() -> RetrievalSettings:
+    """Return the retrieval budgets, read from RETRIEVAL_* on first use."""
+    return RetrievalSettings()
@@ -0,0 +1,337 @@
+import asyncio
+import logging
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+from prometheus_client import Histogram
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Result, Row, select, true
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlmodel import col
+
+from games_rule_core.postgres.models.models import Game, RuleChunk
+from games_rule_core.postgres.reader.filters import Condition, Eq
+from games_rule_core.postgres.reader.pagination import Page
+from games_rule_core.postgres.reader.search import SearchHit, rule_chunk_search
+from games_rule_core.retrieval.config import RetrievalSettings, get_retrieval_settings
+
+logger: logging.Logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+BackendStatus = Literal["ok", "timeout", "error", "skipped"]
+
+BACKEND_LATENCY: Histogram = Histogram(
+    "games_rule_retrieval_backend_seconds",
+    "Latency of each retrieval backend, by outcome",
+    ["backend", "status"],
+)
+
+
+class GameNotFoundError(LookupError):
+    """Raised when retrieval targets a game that does not exist."""
+
+
+class VectorSearcher(Protocol):
+    """Semantic search over rule chunks, such as a ``games_rule_vector`` index."""
+
+    async def search(
+        self, question: str, game_id: int, limit: int
+    ) -> List[Tuple[int, float]]:
+        """Return ``(chunk_id, score)`` pairs of one game by descending score."""
+        ...
+
+
+class BackendReport(BaseModel):
+    """How one retrieval backend fared for a request."""
+
+    name: str
+    status: BackendStatus
+    elapsed_ms: float
+    hits: int = 0
+    # Exception type only; details go to the log, not the client
+    error: Optional[str] = None
+
+
+class CitedChunk(BaseModel):
+    """A rulebook chunk returned as evidence, with where to find it."""
+
+    chunk_id: int
+    document_id: int
+    section: Optional[str] = None
+    page_start: int
+    page_end: int
+    text: str
+    # ts_headline snippet when the keyword backend matched the chunk
+    highlight: Optional[str] = None
+    # Reciprocal rank fusion score
+    score: float
+    # 1-based rank in each backend that returned the chunk
+    ranks: Dict[str, int]
+
+
+class RetrievalResult(BaseModel):
+    """Fused evidence for a question about one game."""
+
+    game_id: int
+    # Unset when the metadata backend did not finish in time
+    game: Optional[Game] = None
+    matches_filters: Optional[bool] = None
+    chunks: List[CitedChunk]
+    backends: List[BackendReport]
+    # True when any backend timed out or failed
+    partial: bool
+    elapsed_ms: float
+
+
+def reciprocal_rank_fusion(
+    rankings: Dict[str, Sequence[int]], k: int = 60
+) -> List[Tuple[int, float, Dict[str, int]]]:
+    """
+    Fuse ranked id lists with reciprocal rank fusion.
+
+    Each list contributes ``1 / (k + rank)`` per id, so agreement between
+    backends outweighs a high rank in any single one, and raw scores on
+    incomparable scales (``ts_rank_cd``, cosine) never have to be mixed.
+
+    Args:
+        rankings: Ranked ids per backend, best first
+        k: Fusion constant
+
+    Returns:
+        ``(id, score, ranks)`` by descending score, ties broken by id
+    """
+    scores: Dict[int, float] = {}
+    ranks: Dict[int, Dict[str, int]] = {}
+    for name, ids in rankings.items():
+        for rank, item_id in enumerate(ids, start=1):
+            if name in ranks.setdefault(item_id, {}):
+                continue
+            ranks[item_id][name] = rank
+            scores[item_id] = scores.get(item_id, 0.0) + 1.0 / (k + rank)
+    ordered: List[int] = sorted(scores, key=lambda item_id: (-scores[item_id], item_id))
+    return [(item_id, scores[item_id], ranks[item_id]) for item_id in ordered]
+
+
+class HybridRetriever:
+    """
+    Retrieve rulebook evidence for a question by fusing several backends.
+
+    The game's metadata (checked against optional catalogue filters), keyword
+    search over ``rule_chunks`` and vector search run concurrently, each on
+    its own session and under its own timeout, all capped by one overall
+    budget. Keyword and vector rankings are fused with reciprocal rank
+    fusion. A backend that times out or fails is reported and left out, so
+    the caller still gets whatever the others found.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        vector: Optional[VectorSearcher] = None,
+        settings: Optional[RetrievalSettings] = None,
+    ) -> None:
+        """
+        Initialize retriever.
+
+        Args:
+            session_maker: Factory for sessions; reads may go to replicas
+            vector: Semantic search backend, or None to skip it
+            settings: Retrieval settings; read from the environment when omitted
+        """
+        self.session_maker: async_sessionmaker[AsyncSession] = session_maker
+        self.vector: Optional[VectorSearcher] = vector
+        self.settings: RetrievalSettings = settings or get_retrieval_settings()
+
+    async def retrieve(
+        self,
+        game_id: int,
+        question: str,
+        limit: int = 8,
+        filters: Optional[Condition] = None,
+    ) -> RetrievalResult:
+        """
+        Gather cited chunks for a question about one game.
+
+        Args:
+            game_id: Game whose rulebooks to search
+            question: Question in natural language
+            limit: Maximum chunks to return
+            filters: Catalogue constraints the game is checked against
+
+        Returns:
+            Fused chunks with per-backend reports
+
+        Raises:
+            GameNotFoundError: If the metadata backend finds no such game
+        """
+        started: float = time.perf_counter()
+        budget: float = self.settings.budget_seconds
+        candidates: int = self.settings.candidates
+
+        async def vector_search() -> List[Tuple[int, float]]:
+            assert self.vector is not None
+            return await self.vector.search(question, game_id, candidates)
+
+        metadata: Tuple[BackendReport, Optional[Tuple[Game, bool]]]
+        keyword: Tuple[BackendReport, Optional[List[SearchHit[RuleChunk]]]]
+        semantic: Tuple[BackendReport, Optional[List[Tuple[int, float]]]]
+        metadata, keyword, semantic = await asyncio.gather(
+            self._run(
+                "metadata",
+                lambda: self._metadata(game_id, filters),
+                min(self.settings.metadata_timeout_seconds, budget),
+            ),
+            self._run(
+                "keyword",
+                lambda: self._keyword(game_id, question),
+                min(self.settings.keyword_timeout_seconds, budget),
+            ),
+            self._run(
+                "vector",
+                vector_search if self.vector is not None else None,
+                min(self.settings.vector_timeout_seconds, budget),
+            ),
+        )
+        game_row: Optional[Tuple[Game, bool]] = metadata[1]
+        if metadata[0].status == "ok" and game_row is None:
+            raise GameNotFoundError(f"Game {game_id} not found")
+
+        keyword_hits: List[SearchHit[RuleChunk]] = keyword[1] or []
+        chunks: Dict[int, RuleChunk] = {
+            hit.item.id: hit.item for hit in keyword_hits if hit.item.id is not None
+        }
+        highlights: Dict[int, str] = {
+            hit.item.id: hit.highlights["text"]
+            for hit in keyword_hits
+            if hit.item.id is not None and "text" in hit.highlights
+        }
+        fused: List[Tuple[int, float, Dict[str, int]]] = reciprocal_rank_fusion(
+            {
+                "keyword": list(chunks),
+                "vector": [chunk_id for chunk_id, _ in semantic[1] or []],
+            },
+            k=self.settings.rrf_k,
+        )[:limit]
+
+        reports: List[BackendReport] = [metadata[0], keyword[0], semantic[0]]
+        # Vector hits carry ids only; load their text with what is left of the budget
+        missing: List[int] = [
+            chunk_id for chunk_id, _, _ in fused if chunk_id not in chunks
+        ]
+        if missing:
+            remaining: float = budget - (time.perf_counter() - started)
+            hydrate: Tuple[
+                BackendReport, Optional[Dict[int, RuleChunk]]
+            ] = await self._run(
+                "hydrate", lambda: self._hydrate(game_id, missing), remaining
+            )
+            reports.append(hydrate[0])
+            chunks.update(hydrate[1] or {})
+
+        cited: List[CitedChunk] = [
+            CitedChunk(
+                chunk_id=chunk_id,
+                document_id=chunks[chunk_id].document_id,
+                section=chunks[chunk_id].section,
+                page_start=chunks[chunk_id].page_start,
+                page_end=chunks[chunk_id].page_end,
+                text=chunks[chunk_id].text,
+                highlight=highlights.get(chunk_id),
+                score=score,
+                ranks=ranks,
+            )
+            for chunk_id, score, ranks in fused
+            if chunk_id in chunks
+        ]
+        return RetrievalResult(
+            game_id=game_id,
+            game=game_row[0] if game_row is not None else None,
+            matches_filters=game_row[1] if game_row is not None else None,
+            chunks=cited,
+            backends=reports,
+            partial=any(r.status in ("timeout", "error") for r in reports),
+            elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+        )
+
+    async def _run(
+        self,
+        name: str,
+        call: Optional[Callable[[], Awaitable[T]]],
+        timeout: float,
+    ) -> Tuple[BackendReport, Optional[T]]:
+        """Run one backend under a timeout, turning failure into a report."""
+        if call is None:
+            return BackendReport(name=name, status="skipped", elapsed_ms=0.0), None
+        started: float = time.perf_counter()
+        status: BackendStatus = "ok"
+        value: Optional[T] = None
+        error: Optional[str] = None
+        try:
+            # Cancelling an asyncpg query also cancels it on the server
+            value = await asyncio.wait_for(call(), max(timeout, 0.0))
+        except TimeoutError:
+            status = "timeout"
+        except Exception as e:
+            logger.warning("Retrieval backend %s failed", name, exc_info=True)
+            status, error = "error", type(e).__name__
+        elapsed: float = time.perf_counter() - started
+        BACKEND_LATENCY.labels(name, status).observe(elapsed)
+        hits: int = len(value) if isinstance(value, (list, dict)) else 0
+        return (
+            BackendReport(
+                name=name,
+                status=status,
+                elapsed_ms=round(elapsed * 1000, 2),
+                hits=hits,
+                error=error,
+            ),
+            value,
+        )
+
+    async def _metadata(
+        self, game_id: int, filters: Optional[Condition]
+    ) -> Optional[Tuple[Game, bool]]:
+        matches: ColumnElement[bool] = (
+            filters.compile(Game) if filters is not None else true()
+        )
+        async with self.session_maker() as session:
+            result: Result[Any] = await session.execute(
+                select(Game, matches.label("matches")).where(col(Game.id) == game_id)
+            )
+            row: Optional[Row[Any]] = result.first()
+        return None if row is None else (row[0], bool(row[1]))
+
+    async def _keyword(self, game_id: int, question: str) -> List[SearchHit[RuleChunk]]:
+        async with self.session_maker() as session:
+            page: Page[SearchHit[RuleChunk]] = await rule_chunk_search(session).search(
+                question,
+                limit=self.settings.candidates,
+                where=Eq(field="game_id", value=game_id),
+                match_all=False,
+            )
+        return page.items
+
+    async def _hydrate(
+        self, game_id: int, chunk_ids: List[int]
+    ) -> Dict[int, RuleChunk]:
+        # The game check drops ids from a vector index that is out of date
+        async with self.session_maker() as session:
+            result: Result[Any] = await session.execute(
+                select(RuleChunk).where(
+                    col(RuleChunk.id).in_(chunk_ids), col(RuleChunk.game_id) == game_id
+                )
+            )
+            return {chunk.id: chunk for chunk in result.scalars()}
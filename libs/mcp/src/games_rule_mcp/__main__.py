@@ -0,0 +1,5 @@
+import sys
+
+from games_rule_mcp.server import main
+
+sys.exit(main())
@@ -0,0 +1,32 @@
+from functools import lru_cache
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class McpSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="MCP_")
+
+    # stdio for a server spawned per agent session; streamable-http when shared
+    transport: Literal["stdio", "streamable-http"] = Field(default="stdio")
+    host: str = Field(default="127.0.0.1")
+    port: int = Field(default=8100)
+    path: str = Field(default="/mcp")
+    # The SDK logs to stderr; INFO is noisy for a server spawned per session
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
+        default="WARNING"
+    )
+    # Upper bound on rows any one tool call returns
+    max_results: int = Field(default=50)
+    # Extra wait for more ids before a batch is sent; 0 batches within one loop tick
+    batch_window_ms: float = Field(default=0.0)
+    max_batch_size: int = Field(default=500)
+    # Vector search in retrieve_rules; off skips loading the index and embedder
+    vector_enabled: bool = Field(default=True)
+
+
+@lru_cache
+def get_mcp_settings() -> McpSettings:
+    """Return the MCP server settings, read from MCP_* on first use."""
+    return McpSettings()
@@ -0,0 +1,123 @@
+import argparse
+import sys
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List, Optional
+
+from games_rule_core.postgres.models.models import Game, Rulebook
+from games_rule_core.postgres.reader.filters import GameFilter
+from games_rule_core.postgres.reader.pagination import Page
+from games_rule_core.postgres.reader.search import SearchHit
+from games_rule_core.postgres.session import (
+    dispose_engines,
+    get_engine,
+    get_session_maker,
+)
+from games_rule_core.retrieval.hybrid import RetrievalResult
+from mcp.server.mcpserver import MCPServer
+
+from games_rule_mcp.config import McpSettings, get_mcp_settings
+from games_rule_mcp.tools import GameRuleTools
+
+
+def create_server(
+    tools: Optional[GameRuleTools] = None, settings: Optional[McpSettings] = None
+) -> MCPServer[None]:
+    """
+    Build the MCP server and register its tools.
+
+    Args:
+        tools: Tool implementations; defaults to ones on the shared engine
+        settings: MCP server settings; read from the environment when omitted
+
+    Returns:
+        Server ready to run on any transport
+    """
+    settings = settings or get_mcp_settings()
+    impl: GameRuleTools = tools or GameRuleTools(get_session_maker(), settings)
+
+    @asynccontextmanager
+    async def lifespan(server: MCPServer[None]) -> AsyncIterator[None]:
+        # Nothing connects up front; the pool fills on the first tool call
+        try:
+            yield
+        finally:
+            await dispose_engines()
+
+    server: MCPServer[None] = MCPServer(
+        "games-rule",
+        instructions=(
+            "Board game catalogue and rulebook lookups. Find a game with "
+            "search_games, then answer rules questions with retrieve_rules "
+            "and cite the returned chunks."
+        ),
+        lifespan=lifespan,
+        log_level=settings.log_level,
+    )
+
+    @server.tool()
+    async def get_game(game_id: int) -> Game:
+        """Get one game's catalogue entry by id."""
+        return await impl.get_game(game_id)
+
+    @server.tool()
+    async def get_games(game_ids: List[int]) -> List[Game]:
+        """Get several games by id, in the order given; unknown ids are skipped."""
+        return await impl.get_games(game_ids)
+
+    @server.tool()
+    async def search_games(
+        query: Optional[str] = None,
+        filters: Optional[GameFilter] = None,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+    ) -> Page[SearchHit[Game]]:
+        """Find games by name/description text and catalogue filters (players, playtime, mechanics, ...); pass next_cursor to page."""
+        return await impl.search_games(query, filters, limit, cursor)
+
+    @server.tool()
+    async def list_rulebooks(game_id: int) -> List[Rulebook]:
+        """List the rulebook documents uploaded for a game."""
+        return await impl.list_rulebooks(game_id)
+
+    @server.tool()
+    async def retrieve_rules(
+        game_id: int, question: str, limit: int = 8
+    ) -> RetrievalResult:
+        """Find the rulebook passages that answer a question about a game, with page numbers to cite."""
+        return await impl.retrieve_rules(game_id, question, limit)
+
+    return server
+
+
+def main() -> int:
+    settings: McpSettings = get_mcp_settings()
+    parser = argparse.ArgumentParser(
+        description="Serve game and rulebook lookups over MCP."
+    )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "streamable-http"],
+        default=settings.transport,
+        help="stdio for one client per process, streamable-http to share one server",
+    )
+    parser.add_argument("--host", default=settings.host)
+    parser.add_argument("--port", type=int, default=settings.port)
+    args = parser.parse_args()
+
+    # stdout carries the protocol on stdio; SQL echo would corrupt it
+    get_engine().echo = False
+    server: MCPServer[None] = create_server(settings=settings)
+    if args.transport == "stdio":
+        server.run("stdio")
+    else:
+        server.run(
+            "streamable-http",
+            host=args.host,
+            port=args.port,
+            streamable_http_path=settings.path,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
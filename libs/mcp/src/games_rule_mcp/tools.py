@@ -0,0 +1,181 @@
+from typing import Any, Dict, List, Optional
+
+from games_rule_core.postgres.models.models import Game, Rulebook
+from games_rule_core.postgres.reader.filters import (
+    Condition,
+    GameFilter,
+    InvalidFilterError,
+)
+from games_rule_core.postgres.reader.loader import BatchLoader
+from games_rule_core.postgres.reader.pagination import (
+    InvalidCursorError,
+    InvalidSortError,
+    Page,
+)
+from games_rule_core.postgres.reader.reader import PostgresReader
+from games_rule_core.postgres.reader.search import SearchHit, game_search
+from games_rule_core.retrieval.config import get_retrieval_settings
+from games_rule_core.retrieval.hybrid import (
+    GameNotFoundError,
+    HybridRetriever,
+    RetrievalResult,
+    VectorSearcher,
+)
+from mcp.server.mcpserver.exceptions import ToolError
+from sqlalchemy import ARRAY, Integer, Result, any_, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlmodel import col
+
+from games_rule_mcp.config import McpSettings, get_mcp_settings
+
+
+class GameRuleTools:
+    """
+    The MCP tools, backed by one shared session factory.
+
+    Every call borrows a pooled connection for its own query and returns it
+    straight away, so concurrent calls share the process's pool instead of
+    holding or opening connections. Game and rulebook lookups go through
+    ``BatchLoader``: ids requested by calls running at the same time are
+    fetched with a single ``= ANY(...)`` query. Vector search is loaded on
+    the first retrieval, which keeps server start-up cheap.
+    """
+
+    def __init__(
+        self,
+        session_maker: async_sessionmaker[AsyncSession],
+        settings: Optional[McpSettings] = None,
+    ) -> None:
+        """
+        Initialize tools.
+
+        Args:
+            session_maker: Factory for sessions on the shared engine
+            settings: MCP server settings; read from the environment when omitted
+        """
+        self.session_maker: async_sessionmaker[AsyncSession] = session_maker
+        self.settings: McpSettings = settings or get_mcp_settings()
+        window: float = self.settings.batch_window_ms / 1000
+        batch_size: int = self.settings.max_batch_size
+        self.games: BatchLoader[int, Game] = BatchLoader(
+            self._fetch_games, batch_size, window, name="games"
+        )
+        self.rulebooks: BatchLoader[int, List[Rulebook]] = BatchLoader(
+            self._fetch_rulebooks, batch_size, window, name="rulebooks"
+        )
+        self._retriever: Optional[HybridRetriever] = None
+
+    async def get_game(self, game_id: int) -> Game:
+        """
+        Look up one game by id.
+
+        Raises:
+            ToolError: If there is no such game
+        """
+        game: Optional[Game] = await self.games.load(game_id)
+        if game is None:
+            raise ToolError(f"Game {game_id} not found")
+        return game
+
+    async def get_games(self, game_ids: List[int]) -> List[Game]:
+        """Look up several games by id, in the order given; unknown ids are skipped."""
+        games: List[Optional[Game]] = await self.games.load_many(
+            game_ids[: self.settings.max_results]
+        )
+        return [game for game in games if game is not None]
+
+    async def search_games(
+        self,
+        query: Optional[str] = None,
+        filters: Optional[GameFilter] = None,
+        limit: int = 10,
+        cursor: Optional[str] = None,
+    ) -> Page[SearchHit[Game]]:
+        """
+        Find games by text and catalogue filters.
+
+        With a query, hits are ranked by relevance and carry highlights;
+        without one, filtered games come back in id order.
+
+        Raises:
+            ToolError: If the cursor or a filter is invalid
+        """
+        limit = max(1, min(limit, self.settings.max_results))
+        where: Optional[Condition] = filters.to_condition() if filters else None
+        try:
+            async with self.session_maker() as session:
+                if query:
+                    return await game_search(session).search(
+                        query, limit=limit, cursor=cursor, where=where
+                    )
+                page: Page[Game] = await PostgresReader[Game](session, Game).get_page(
+                    limit=limit, cursor=cursor, where=where
+                )
+        except (InvalidCursorError, InvalidSortError, InvalidFilterError) as e:
+            raise ToolError(str(e))
+        return Page[SearchHit[Game]](
+            items=[SearchHit[Game](item=game) for game in page.items],
+            next_cursor=page.next_cursor,
+            limit=page.limit,
+            sort=page.sort,
+        )
+
+    async def list_rulebooks(self, game_id: int) -> List[Rulebook]:
+        """List a game's rulebook documents, oldest first."""
+        return await self.rulebooks.load(game_id) or []
+
+    async def retrieve_rules(
+        self, game_id: int, question: str, limit: int = 8
+    ) -> RetrievalResult:
+        """
+        Gather the rulebook chunks that best answer a question about a game.
+
+        Raises:
+            ToolError: If there is no such game
+        """
+        try:
+            return await self.retriever().retrieve(
+                game_id, question, limit=max(1, min(limit, self.settings.max_results))
+            )
+        except GameNotFoundError as e:
+            raise ToolError(str(e))
+
+    def retriever(self) -> HybridRetriever:
+        """Return the hybrid retriever, building it on first use."""
+        if self._retriever is None:
+            vector: Optional[VectorSearcher] = None
+            if self.settings.vector_enabled:
+                # Imported here: the index and embedder are only needed for retrieval
+                from games_rule_vector.config import get_vector_settings
+                from games_rule_vector.embed import create_embedder
+                from games_rule_vector.searcher import IndexSearcher
+
+                vector_settings = get_vector_settings()
+                vector = IndexSearcher(
+                    vector_settings, create_embedder(vector_settings)
+                )
+            self._retriever = HybridRetriever(
+                self.session_maker, vector, get_retrieval_settings()
+            )
+        return self._retriever
+
+    async def _fetch_games(self, game_ids: List[int]) -> Dict[int, Game]:
+        async with self.session_maker() as session:
+            games: List[Optional[Game]] = await PostgresReader[Game](
+                session, Game
+            ).get_many(game_ids)
+        return {
+            game_id: game for game_id, game in zip(game_ids, games) if game is not None
+        }
+
+    async def _fetch_rulebooks(self, game_ids: List[int]) -> Dict[int, List[Rulebook]]:
+        rulebooks: Dict[int, List[Rulebook]] = {}
+        async with self.session_maker() as session:
+            result: Result[Any] = await session.execute(
+                select(Rulebook)
+                .where(col(Rulebook.game_id) == any_(literal(game_ids, ARRAY(Integer))))
+                .order_by(col(Rulebook.id))
+            )
+            for rulebook in result.scalars():
+                rulebooks.setdefault(rulebook.game_id, []).append(rulebook)
+        return rulebooks
@@ -0,0 +1,31 @@
+from functools import lru_cache
+from typing import Literal
+
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class VectorSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", env_prefix="VECTOR_")
+
+    # Directory holding the memory-mapped index files
+    path: str = Field(default="./vector-index")
+    dim: int = Field(default=384)
+    # float16 halves memory and disk, but scans about twice as slowly on CPU
+    dtype: Literal["float16", "float32"] = Field(default="float32")
+    # Inverted lists; roughly sqrt(vectors) is a good start (1024 for 1M)
+    nlist: int = Field(default=1024)
+    # Lists scanned per query; higher trades latency for recall
+    nprobe: int = Field(default=16)
+    # Searches over fewer candidate rows than this are exact brute force
+    exact_threshold: int = Field(default=20_000)
+    # "hashing" needs no model; "sentence-transformers" loads embed_model
+    embedder: Literal["hashing", "sentence-transformers"] = Field(default="hashing")
+    embed_model: str = Field(default="all-MiniLM-L6-v2")
+    embed_batch_size: int = Field(default=256)
+
+
+@lru_cache
+def get_vector_settings() -> VectorSettings:
+    """Return the index and embedder settings, read from VECTOR_* on first use."""
+    return VectorSettings()
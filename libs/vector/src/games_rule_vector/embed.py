@@ -0,0 +1,187 @@
+import re
+import zlib
+from typing import Any, Dict, Iterable, Iterator, List, Protocol, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
+
+from games_rule_vector.config import VectorSettings
+
+_TOKEN: re.Pattern[str] = re.compile(r"[a-z0-9]+")
+
+
+class Embedder(Protocol):
+    """Turns texts into L2-normalised float32 vectors of a fixed dimension."""
+
+    dim: int
+
+    def embed(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        """Return one row per text, shape ``(len(texts), dim)``."""
+        ...
+
+
+class HashingEmbedder:
+    """
+    Dependency-free embedder using signed feature hashing.
+
+    Words, word bigrams and character trigrams are hashed into ``dim``
+    buckets with a stable CRC32, weighted by log term frequency and
+    normalised. It captures lexical overlap rather than meaning, which is
+    enough for rulebook passages that reuse the question's terms, and runs
+    anywhere without model weights. The per-batch matrix is assembled with
+    a single ``bincount``; only tokenisation runs per text.
+    """
+
+    def __init__(self, dim: int = 384, cache_size: int = 500_000) -> None:
+        """
+        Initialize embedder.
+
+        Args:
+            dim: Output dimension
+            cache_size: Features whose hashed bucket is memoised
+        """
+        self.dim: int = dim
+        self.cache_size: int = cache_size
+        # feature -> signed bucket, (bucket + 1) * sign so bucket 0 keeps its sign
+        self._buckets: Dict[str, int] = {}
+
+    def embed(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        rows: List[int] = []
+        features: List[int] = []
+        for row, text in enumerate(texts):
+            signed: List[int] = [self._bucket(f) for f in self._features(text)]
+            features.extend(signed)
+            rows.extend([row] * len(signed))
+        if len(self._buckets) > self.cache_size:
+            self._buckets.clear()
+
+        signed_buckets: NDArray[np.int64] = np.asarray(features, dtype=np.int64)
+        flat: NDArray[np.int64] = (
+            np.asarray(rows, dtype=np.int64) * self.dim + np.abs(signed_buckets) - 1
+        )
+        # Weighted counts are float64 already; the stubs type bincount as int
+        counts: NDArray[np.float64] = np.bincount(
+            flat, weights=np.sign(signed_buckets), minlength=len(texts) * self.dim
+        ).astype(np.float64, copy=False)
+        matrix: NDArray[np.float32] = counts.reshape(len(texts), self.dim).astype(
+            np.float32
+        )
+        # Sublinear term frequency so repeated words do not dominate
+        np.copysign(np.log1p(np.abs(matrix)), matrix, out=matrix)
+        return normalize(matrix)
+
+    def _features(self, text: str) -> Iterator[str]:
+        words: List[str] = _TOKEN.findall(text.lower())
+        yield from words
+        for first, second in zip(words, words[1:]):
+            yield f"{first} {second}"
+        for word in words:
+            padded: str = f"<{word}>"
+            for start in range(len(padded) - 2):
+                yield "#" + padded[start : start + 3]
+
+    def _bucket(self, feature: str) -> int:
+        bucket: int | None = self._buckets.get(feature)
+        if bucket is None:
+            digest: int = zlib.crc32(feature.encode())
+            bucket = (digest % self.dim + 1) * (1 if digest & 0x80000000 else -1)
+            self._buckets[feature] = bucket
+        return bucket
+
+
+class SentenceTransformerEmbedder:
+    """
+    Embedder backed by a local sentence-transformers model.
+
+    Requires the optional ``sentence-transformers`` dependency
+    (``games_rule_vector[sentence-transformers]``).
+    """
+
+    def __init__(
+        self, model_name: str = "all-MiniLM-L6-v2", device: str = "cpu"
+    ) -> None:
+        """
+        Load a model.
+
+        Args:
+            model_name: Model name or local path
+            device: Torch device to run on
+        """
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError as e:
+            raise ImportError(
+                "SentenceTransformerEmbedder requires the 'sentence-transformers' "
+                "extra: pip install 'games_rule_vector[sentence-transformers]'"
+            ) from e
+        self._model: Any = SentenceTransformer(model_name, device=device)
+        self.dim: int = int(self._model.get_sentence_embedding_dimension())
+
+    def embed(self, texts: Sequence[str]) -> NDArray[np.float32]:
+        vectors: Any = self._model.encode(
+            list(texts), convert_to_numpy=True, normalize_embeddings=True
+        )
+        return np.asarray(vectors, dtype=np.float32)
+
+
+def embed_batches(
+    embedder: Embedder, texts: Iterable[str], batch_size: int = 256
+) -> Iterator[NDArray[np.float32]]:
+    """
+    Embed a stream of texts a batch at a time.
+
+    Args:
+        embedder: Embedder to use
+        texts: Texts in order
+        batch_size: Texts per ``embed`` call
+
+    Yields:
+        One ``(batch, dim)`` matrix per batch, in input order
+    """
+    batch: List[str] = []
+    for text in texts:
+        batch.append(text)
+        if len(batch) == batch_size:
+            yield embedder.embed(batch)
+            batch = []
+    if batch:
+        yield embedder.embed(batch)
+
+
+def normalize(vectors: NDArray[np.float32]) -> NDArray[np.float32]:
+    """
+    L2-normalise rows in place; all-zero rows are left as zeros.
+
+    Args:
+        vectors: Matrix of shape ``(n, dim)``
+
+    Returns:
+        The same matrix
+    """
+    norms: NDArray[np.float32] = np.linalg.norm(vectors, axis=1, keepdims=True)
+    np.divide(vectors, norms, out=vectors, where=norms > 0)
+    return vectors
+
+
+def create_embedder(settings: VectorSettings) -> Embedder:
+    """
+    Build the embedder selected by settings.
+
+    Args:
+        settings: Vector settings
+
+    Returns:
+        Hashing or sentence-transformers embedder
+
+    Raises:
+        ValueError: If the model's dimension does not match ``settings.dim``
+    """
+    if settings.embedder == "sentence-transformers":
+        embedder: Embedder = SentenceTransformerEmbedder(settings.embed_model)
+        if embedder.dim != settings.dim:
+            raise ValueError(
+                f"{settings.embed_model} produces {embedder.dim}-dim vectors; "
+                f"set VECTOR_DIM={embedder.dim}"
+            )
+        return embedder
+    return HashingEmbedder(settings.dim)
@@ -0,0 +1,357 @@
+import shutil
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+from pydantic import BaseModel
+
+from games_rule_vector.config import VectorSettings, get_vector_settings
+from games_rule_vector.embed import normalize
+from games_rule_vector.ivf import assign, train_centroids
+from games_rule_vector.store import VectorStore
+
+# Rows scored at once during brute-force search and compaction
+SCORE_BLOCK_ROWS: int = 65_536
+
+# Training rows sampled per inverted list
+TRAIN_ROWS_PER_LIST: int = 64
+
+
+class SearchHit(BaseModel):
+    """A chunk matched by a vector search."""
+
+    chunk_id: int
+    rulebook_id: int
+    game_id: int
+    # Cosine similarity to the query
+    score: float
+
+
+class _Postings:
+    """Rows grouped by a key column, as sorted keys plus CSR offsets."""
+
+    def __init__(self, keys: NDArray[Any]) -> None:
+        self.rows: NDArray[np.intp] = np.argsort(keys, kind="stable")
+        self.keys: NDArray[Any]
+        starts: NDArray[np.intp]
+        self.keys, starts = np.unique(keys[self.rows], return_index=True)
+        self.offsets: NDArray[np.intp] = np.append(starts, len(keys))
+
+    def lookup(self, keys: Sequence[int] | NDArray[Any]) -> NDArray[np.intp]:
+        """Rows whose key is in ``keys``, ascending within each key."""
+        wanted: NDArray[Any] = np.asarray(keys)
+        positions: NDArray[np.intp] = np.searchsorted(self.keys, wanted)
+        found: NDArray[np.bool_] = positions < len(self.keys)
+        found[found] = self.keys[positions[found]] == wanted[found]
+        parts: List[NDArray[np.intp]] = [
+            self.rows[self.offsets[p] : self.offsets[p + 1]] for p in positions[found]
+        ]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+
+
+class VectorIndex:
+    """
+    Inverted-file (IVF) index over rule chunk embeddings.
+
+    Vectors are stored in a memory-mapped ``VectorStore`` and grouped into
+    ``nlist`` inverted lists by their nearest k-means centroid. A search
+    scores the query against the centroids, then only against rows in the
+    ``nprobe`` closest lists. Until ``train`` has run, and whenever a game
+    filter narrows the candidates to ``exact_threshold`` rows or fewer,
+    search is exact brute force instead.
+
+    Rows are keyed by chunk id and tagged with their rulebook
+    (``game_documents.id``) and game, so a re-ingested rulebook is replaced
+    with ``delete_rulebook`` followed by ``add``. Deletes are tombstones;
+    ``compact`` reclaims their space.
+
+    Not thread-safe: serialise writers, and do not search while writing.
+    """
+
+    def __init__(self, settings: Optional[VectorSettings] = None) -> None:
+        """
+        Open the index at ``settings.path``, creating it if needed.
+
+        Args:
+            settings: Vector settings; read from the environment when omitted
+        """
+        self.settings: VectorSettings = settings or get_vector_settings()
+        self.store: VectorStore = VectorStore(
+            self.settings.path, dim=self.settings.dim, dtype=self.settings.dtype
+        )
+        centroid_file: Path = self.store.path / "centroids.npy"
+        self.centroids: Optional[NDArray[np.float32]] = (
+            np.load(centroid_file) if centroid_file.exists() else None
+        )
+        # Rebuilt on the next search after rows are added or reassigned
+        self._lists: Optional[_Postings] = None
+        self._games: Optional[_Postings] = None
+
+    @property
+    def trained(self) -> bool:
+        """Whether centroids exist, so search can use the inverted lists."""
+        return self.centroids is not None
+
+    def __len__(self) -> int:
+        """Number of live rows."""
+        return int(np.count_nonzero(self.store.column("alive")))
+
+    def add(
+        self,
+        vectors: NDArray[np.float32],
+        chunk_ids: Sequence[int] | NDArray[np.integer[Any]],
+        rulebook_ids: Sequence[int] | NDArray[np.integer[Any]],
+        game_ids: Sequence[int] | NDArray[np.integer[Any]],
+    ) -> int:
+        """
+        Add embedded chunks.
+
+        Rows are normalised and, once trained, assigned to their list on the
+        way in, so an index stays searchable as it grows. Retrain after the
+        data has shifted substantially.
+
+        Args:
+            vectors: Embeddings of shape ``(n, dim)``
+            chunk_ids: Chunk id per row
+            rulebook_ids: Rulebook per row
+            game_ids: Game per row
+
+        Returns:
+            Number of rows added
+        """
+        matrix: NDArray[np.float32] = normalize(np.array(vectors, dtype=np.float32))
+        lists: NDArray[np.int32] = (
+            assign(matrix, self.centroids)
+            if self.centroids is not None
+            else np.full(len(matrix), -1, dtype=np.int32)
+        )
+        self.store.append(
+            matrix,
+            np.asarray(chunk_ids, dtype=np.int64),
+            np.asarray(rulebook_ids, dtype=np.int32),
+            np.asarray(game_ids, dtype=np.int32),
+            lists,
+        )
+        self._lists = self._games = None
+        return len(matrix)
+
+    def delete(self, chunk_ids: Sequence[int] | NDArray[np.integer[Any]]) -> int:
+        """
+        Delete rows by chunk id.
+
+        Args:
+            chunk_ids: Chunks to remove
+
+        Returns:
+            Number of rows deleted
+        """
+        return self._tombstone(np.isin(self.store.column("chunk_ids"), chunk_ids))
+
+    def delete_rulebook(self, rulebook_id: int) -> int:
+        """
+        Delete every row of a rulebook.
+
+        Args:
+            rulebook_id: ``game_documents.id`` whose chunks to remove
+
+        Returns:
+            Number of rows deleted
+        """
+        return self._tombstone(self.store.column("rulebook_ids") == rulebook_id)
+
+    def rulebook_chunks(self) -> Dict[int, FrozenSet[int]]:
+        """
+        Live chunk ids per rulebook, to diff the index against the database.
+
+        Returns:
+            Mapping of rulebook id to its indexed chunk ids
+        """
+        alive: NDArray[np.bool_] = self.store.column("alive")
+        rulebooks: NDArray[np.int32] = self.store.column("rulebook_ids")[alive]
+        chunks: NDArray[np.int64] = self.store.column("chunk_ids")[alive]
+        postings: _Postings = _Postings(rulebooks)
+        return {
+            int(rulebook): frozenset(
+                chunks[
+                    postings.rows[postings.offsets[p] : postings.offsets[p + 1]]
+                ].tolist()
+            )
+            for p, rulebook in enumerate(postings.keys)
+        }
+
+    def train(self, nlist: Optional[int] = None, iterations: int = 10) -> None:
+        """
+        Learn centroids from live rows and reassign every row to a list.
+
+        Args:
+            nlist: Number of lists, defaulting to ``settings.nlist``
+            iterations: k-means iterations
+        """
+        nlist = nlist or self.settings.nlist
+        live: NDArray[np.intp] = np.flatnonzero(self.store.column("alive"))
+        if not len(live):
+            raise ValueError("Cannot train an empty index")
+        rng: np.random.Generator = np.random.default_rng(0)
+        size: int = min(len(live), nlist * TRAIN_ROWS_PER_LIST)
+        # Sorted so the sample is read from the memory map front to back
+        picked: NDArray[np.intp] = np.sort(rng.choice(live, size, replace=False))
+        self.centroids = train_centroids(
+            self.store.vectors[picked], nlist, iterations=iterations
+        )
+        self.store.column("lists")[:] = assign(self.store.vectors, self.centroids)
+        self._lists = None
+
+    def search(
+        self,
+        query: NDArray[np.float32],
+        k: int = 10,
+        game_ids: Optional[Sequence[int]] = None,
+        nprobe: Optional[int] = None,
+    ) -> List[SearchHit]:
+        """
+        Find the chunks most similar to a query vector.
+
+        Args:
+            query: Query embedding of shape ``(dim,)``
+            k: Maximum hits to return
+            game_ids: Only return chunks of these games
+            nprobe: Lists to scan, defaulting to ``settings.nprobe``
+
+        Returns:
+            Hits by descending score
+        """
+        vector: NDArray[np.float32] = normalize(
+            np.array(query, dtype=np.float32).reshape(1, -1)
+        )[0]
+        rows: NDArray[np.intp]
+        if game_ids is not None:
+            rows = np.sort(self._game_postings().lookup(game_ids))
+            if self.centroids is not None and len(rows) > self.settings.exact_threshold:
+                probed: NDArray[np.intp] = self._probe(vector, nprobe)
+                filtered: NDArray[np.intp] = probed[
+                    np.isin(self.store.column("game_ids")[probed], game_ids)
+                ]
+                hits: List[SearchHit] = self._top_k(vector, filtered, k)
+                if len(hits) == k:
+                    return hits
+                # Too few matches near the query; fall back to the whole filter
+        elif (
+            self.centroids is not None
+            and self.store.count > self.settings.exact_threshold
+        ):
+            rows = self._probe(vector, nprobe)
+        else:
+            rows = np.arange(self.store.count)
+        return self._top_k(vector, rows, k)
+
+    def compact(self) -> int:
+        """
+        Rewrite the index files without deleted rows.
+
+        Returns:
+            Number of rows reclaimed
+        """
+        alive: NDArray[np.bool_] = self.store.column("alive")
+        dead: int = int(len(alive) - np.count_nonzero(alive))
+        if not dead:
+            return 0
+        target: Path = self.store.path.with_name(self.store.path.name + ".compact")
+        shutil.rmtree(target, ignore_errors=True)
+        compacted: VectorStore = VectorStore(
+            target, dim=self.store.dim, dtype=self.store.dtype
+        )
+        for start in range(0, self.store.count, SCORE_BLOCK_ROWS):
+            block: slice = slice(start, start + SCORE_BLOCK_ROWS)
+            keep: NDArray[np.bool_] = alive[block]
+            compacted.append(
+                self.store.vectors[block][keep],
+                self.store.column("chunk_ids")[block][keep],
+                self.store.column("rulebook_ids")[block][keep],
+                self.store.column("game_ids")[block][keep],
+                self.store.column("lists")[block][keep],
+            )
+        if self.centroids is not None:
+            np.save(target / "centroids.npy", self.centroids)
+        compacted.close()
+        self.store.close()
+
+        previous: Path = self.store.path.with_name(self.store.path.name + ".old")
+        shutil.rmtree(previous, ignore_errors=True)
+        self.store.path.rename(previous)
+        target.rename(self.store.path)
+        shutil.rmtree(previous)
+        self.store = VectorStore(self.store.path)
+        self._lists = self._games = None
+        return dead
+
+    def flush(self) -> None:
+        """Persist vectors, metadata and centroids."""
+        self.store.flush()
+        if self.centroids is not None:
+            np.save(self.store.path / "centroids.npy", self.centroids)
+
+    def close(self) -> None:
+        """Flush and release the memory map."""
+        self.flush()
+        self.store.close()
+
+    def _tombstone(self, mask: NDArray[np.bool_]) -> int:
+        alive: NDArray[np.bool_] = self.store.column("alive")
+        mask &= alive
+        alive[mask] = False
+        return int(np.count_nonzero(mask))
+
+    def _game_postings(self) -> _Postings:
+        if self._games is None:
+            self._games = _Postings(self.store.column("game_ids"))
+        return self._games
+
+    def _probe(
+        self, vector: NDArray[np.float32], nprobe: Optional[int]
+    ) -> NDArray[np.intp]:
+        """Rows in the lists whose centroids are closest to the query."""
+        assert self.centroids is not None
+        if self._lists is None:
+            self._lists = _Postings(self.store.column("lists"))
+        nearest: NDArray[np.float32] = self.centroids @ vector
+        probes: int = min(nprobe or self.settings.nprobe, len(nearest))
+        lists: NDArray[np.intp] = np.argpartition(-nearest, probes - 1)[:probes]
+        # Ascending rows read the memory map in file order
+        return np.sort(self._lists.lookup(lists))
+
+    def _top_k(
+        self, vector: NDArray[np.float32], rows: NDArray[np.intp], k: int
+    ) -> List[SearchHit]:
+        rows = rows[self.store.column("alive")[rows]]
+        if not len(rows) or k <= 0:
+            return []
+        scores: NDArray[np.float32] = np.empty(len(rows), dtype=np.float32)
+        for start in range(0, len(rows), SCORE_BLOCK_ROWS):
+            block: NDArray[np.intp] = rows[start : start + SCORE_BLOCK_ROWS]
+            scores[start : start + len(block)] = (
+                self._gather(block).astype(np.float32) @ vector
+            )
+        if len(rows) > k:
+            top: NDArray[np.intp] = np.argpartition(-scores, k - 1)[:k]
+            rows, scores = rows[top], scores[top]
+        order: NDArray[np.intp] = np.argsort(-scores, kind="stable")
+        chunk_ids: NDArray[np.int64] = self.store.column("chunk_ids")
+        rulebook_ids: NDArray[np.int32] = self.store.column("rulebook_ids")
+        game_ids: NDArray[np.int32] = self.store.column("game_ids")
+        return [
+            SearchHit(
+                chunk_id=int(chunk_ids[row]),
+                rulebook_id=int(rulebook_ids[row]),
+                game_id=int(game_ids[row]),
+                score=float(score),
+            )
+            for row, score in zip(rows[order], scores[order])
+        ]
+
+    def _gather(self, rows: NDArray[np.intp]) -> NDArray[Any]:
+        """Read rows from the memory map, slicing when they are contiguous."""
+        span: Tuple[int, int] = (int(rows[0]), int(rows[-1]) + 1)
+        if span[1] - span[0] == len(rows) and bool(np.all(np.diff(rows) == 1)):
+            return self.store.vectors[span[0] : span[1]]
+        return self.store.vectors[rows]
@@ -0,0 +1,72 @@
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+from games_rule_vector.embed import normalize
+
+# Rows scored against the centroids at once; bounds the (block, nlist) matrix
+ASSIGN_BLOCK_ROWS: int = 65_536
+
+
+def assign(vectors: NDArray[Any], centroids: NDArray[np.float32]) -> NDArray[np.int32]:
+    """
+    Assign each vector to its most similar centroid.
+
+    Args:
+        vectors: Matrix of shape ``(n, dim)``, float16 or float32
+        centroids: Normalised centroids of shape ``(nlist, dim)``
+
+    Returns:
+        Centroid index per row
+    """
+    lists: NDArray[np.int32] = np.empty(len(vectors), dtype=np.int32)
+    for start in range(0, len(vectors), ASSIGN_BLOCK_ROWS):
+        block: NDArray[np.float32] = np.asarray(
+            vectors[start : start + ASSIGN_BLOCK_ROWS], dtype=np.float32
+        )
+        lists[start : start + len(block)] = np.argmax(block @ centroids.T, axis=1)
+    return lists
+
+
+def train_centroids(
+    sample: NDArray[Any], nlist: int, iterations: int = 10, seed: int = 0
+) -> NDArray[np.float32]:
+    """
+    Learn inverted-list centroids with spherical k-means.
+
+    Callers pass a random sample (around 64 rows per list) rather than every
+    row, since centroid quality stops improving long before the whole index
+    has been seen. Clusters that empty out are reseeded from random rows.
+
+    Args:
+        sample: Normalised training rows, shape ``(n, dim)``
+        nlist: Number of centroids; capped at the sample size
+        iterations: k-means iterations
+        seed: Random seed, for reproducible indexes
+
+    Returns:
+        Normalised centroids of shape ``(min(nlist, n), dim)``
+    """
+    rng: np.random.Generator = np.random.default_rng(seed)
+    rows: NDArray[np.float32] = np.asarray(sample, dtype=np.float32)
+    nlist = min(nlist, len(rows))
+    centroids: NDArray[np.float32] = rows[rng.choice(len(rows), nlist, replace=False)]
+
+    for _ in range(iterations):
+        labels: NDArray[np.int32] = assign(rows, centroids)
+        order: NDArray[np.intp] = np.argsort(labels, kind="stable")
+        present: NDArray[np.int32]
+        starts: NDArray[np.intp]
+        present, starts = np.unique(labels[order], return_index=True)
+        # Sum each cluster's members in one pass over the sorted rows
+        sums: NDArray[np.float32] = np.add.reduceat(rows[order], starts, axis=0)
+        centroids = np.zeros_like(centroids)
+        centroids[present] = sums
+        empty: NDArray[np.intp] = np.setdiff1d(
+            np.arange(nlist), present, assume_unique=True
+        )
+        if len(empty):
+            centroids[empty] = rows[rng.choice(len(rows), len(empty), replace=False)]
+        normalize(centroids)
+    return centroids
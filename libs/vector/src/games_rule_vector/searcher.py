@@ -0,0 +1,76 @@
+import asyncio
+import threading
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from games_rule_vector.config import VectorSettings, get_vector_settings
+from games_rule_vector.embed import Embedder, create_embedder
+from games_rule_vector.index import SearchHit, VectorIndex
+
+
+class IndexSearcher:
+    """
+    Async, per-game search over the on-disk index, for request handlers.
+
+    Embedding and scoring are CPU work, so they run on a worker thread and
+    keep the event loop free. The index is reopened whenever its
+    ``meta.json`` changes, so a writer such as ``bin/index_rule_chunks.py``
+    can update it without restarting the service.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[VectorSettings] = None,
+        embedder: Optional[Embedder] = None,
+    ) -> None:
+        """
+        Initialize searcher; the index itself is opened on first use.
+
+        Args:
+            settings: Vector settings; read from the environment when omitted
+            embedder: Query embedder, defaulting to the one settings select
+        """
+        self.settings: VectorSettings = settings or get_vector_settings()
+        self.embedder: Embedder = embedder or create_embedder(self.settings)
+        self._index: Optional[VectorIndex] = None
+        self._version: Optional[int] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    async def search(
+        self, question: str, game_id: int, limit: int
+    ) -> List[Tuple[int, float]]:
+        """
+        Find one game's chunks most similar to a question.
+
+        Args:
+            question: Question text
+            game_id: Game to search within
+            limit: Maximum hits
+
+        Returns:
+            ``(chunk_id, score)`` pairs by descending score; empty if no index
+        """
+        return await asyncio.to_thread(self._search, question, game_id, limit)
+
+    def _search(
+        self, question: str, game_id: int, limit: int
+    ) -> List[Tuple[int, float]]:
+        index: Optional[VectorIndex] = self._current()
+        if index is None:
+            return []
+        hits: List[SearchHit] = index.search(
+            self.embedder.embed([question])[0], limit, game_ids=[game_id]
+        )
+        return [(hit.chunk_id, hit.score) for hit in hits]
+
+    def _current(self) -> Optional[VectorIndex]:
+        try:
+            version: int = (Path(self.settings.path) / "meta.json").stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        if version != self._version:
+            with self._lock:
+                if version != self._version:
+                    self._index = VectorIndex(self.settings)
+                    self._version = version
+        return self._index
@@ -0,0 +1,182 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Literal, Optional
+
+import numpy as np
+from numpy.typing import NDArray
+
+VectorDType = Literal["float16", "float32"]
+
+# Per-row metadata kept in memory and saved as .npy next to the vectors
+COLUMNS: Dict[str, type[np.generic]] = {
+    "chunk_ids": np.int64,
+    "rulebook_ids": np.int32,
+    "game_ids": np.int32,
+    "alive": np.bool_,
+    # Inverted list of each row; -1 until the index is trained
+    "lists": np.int32,
+}
+
+# Rows reserved up front and added on each growth, at minimum
+MIN_CAPACITY: int = 1024
+
+
+class VectorStore:
+    """
+    Append-only vector matrix in a memory-mapped file plus per-row metadata.
+
+    Vectors live in ``vectors.bin`` and are paged in by the OS on demand, so
+    the index can exceed RAM. Row metadata (chunk, rulebook and game ids,
+    liveness and list assignment) is small enough to keep in memory and is
+    written out on ``flush``. Deleting a row only clears ``alive``;
+    ``VectorIndex.compact`` rewrites the files without dead rows.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        dim: Optional[int] = None,
+        dtype: VectorDType = "float32",
+    ) -> None:
+        """
+        Open the store at ``path``, creating it if it does not exist.
+
+        Args:
+            path: Directory for the store's files
+            dim: Vector dimension; required when creating, checked when opening
+            dtype: Storage precision when creating
+
+        Raises:
+            ValueError: If ``dim`` is missing for a new store or does not match
+        """
+        self.path: Path = Path(path)
+        meta_path: Path = self.path / "meta.json"
+        if meta_path.exists():
+            meta: Dict[str, Any] = json.loads(meta_path.read_text())
+            if dim is not None and dim != meta["dim"]:
+                raise ValueError(
+                    f"Store at {self.path} has dim {meta['dim']}, not {dim}"
+                )
+            self.dim: int = meta["dim"]
+            self.dtype: VectorDType = meta["dtype"]
+            self.count: int = meta["count"]
+            self.columns: Dict[str, NDArray[Any]] = {
+                name: np.load(self.path / f"{name}.npy") for name in COLUMNS
+            }
+        else:
+            if dim is None:
+                raise ValueError("dim is required to create a vector store")
+            self.path.mkdir(parents=True, exist_ok=True)
+            self.dim = dim
+            self.dtype = dtype
+            self.count = 0
+            self.columns = {
+                name: np.empty(0, dtype=column) for name, column in COLUMNS.items()
+            }
+        self._vectors: Optional[np.memmap[Any, np.dtype[Any]]] = None
+        self._map(max(self._file_rows(), self.count))
+
+    @property
+    def capacity(self) -> int:
+        """Rows the vector file can hold before it grows."""
+        return 0 if self._vectors is None else self._vectors.shape[0]
+
+    @property
+    def vectors(self) -> NDArray[Any]:
+        """Stored vectors, shape ``(count, dim)``, backed by the memory map."""
+        assert self._vectors is not None
+        return self._vectors[: self.count]
+
+    def column(self, name: str) -> NDArray[Any]:
+        """Metadata column trimmed to ``count`` rows."""
+        return self.columns[name][: self.count]
+
+    def append(
+        self,
+        vectors: NDArray[np.float32],
+        chunk_ids: NDArray[np.int64],
+        rulebook_ids: NDArray[np.int32],
+        game_ids: NDArray[np.int32],
+        lists: NDArray[np.int32],
+    ) -> slice:
+        """
+        Append rows.
+
+        Args:
+            vectors: Matrix of shape ``(n, dim)``
+            chunk_ids: Chunk id per row
+            rulebook_ids: Rulebook (``game_documents.id``) per row
+            game_ids: Game per row
+            lists: Inverted list per row, or -1
+
+        Returns:
+            Slice of the new rows
+        """
+        added: int = len(vectors)
+        if vectors.shape[1:] != (self.dim,):
+            raise ValueError(f"Expected vectors of dim {self.dim}")
+        rows: slice = slice(self.count, self.count + added)
+        if rows.stop > self.capacity:
+            self._map(max(rows.stop, 2 * self.capacity, MIN_CAPACITY))
+        assert self._vectors is not None
+        self._vectors[rows] = vectors
+        values: Dict[str, NDArray[Any]] = {
+            "chunk_ids": chunk_ids,
+            "rulebook_ids": rulebook_ids,
+            "game_ids": game_ids,
+            "alive": np.ones(added, dtype=np.bool_),
+            "lists": lists,
+        }
+        for name, column in COLUMNS.items():
+            current: NDArray[Any] = self.columns[name]
+            if len(current) < rows.stop:
+                grown: NDArray[Any] = np.empty(self.capacity, dtype=column)
+                grown[: self.count] = current[: self.count]
+                self.columns[name] = current = grown
+            current[rows] = values[name]
+        self.count = rows.stop
+        return rows
+
+    def flush(self) -> None:
+        """Write vectors and metadata to disk."""
+        if self._vectors is not None:
+            self._vectors.flush()
+        for name in COLUMNS:
+            np.save(self.path / f"{name}.npy", self.column(name))
+        meta: Dict[str, Any] = {
+            "dim": self.dim,
+            "dtype": self.dtype,
+            "count": self.count,
+        }
+        # Write-then-rename so a crash never leaves a half-written meta.json
+        temporary: Path = self.path / "meta.json.tmp"
+        temporary.write_text(json.dumps(meta))
+        os.replace(temporary, self.path / "meta.json")
+
+    def close(self) -> None:
+        """Flush and release the memory map."""
+        self.flush()
+        self._vectors = None
+
+    def _file_rows(self) -> int:
+        vector_file: Path = self.path / "vectors.bin"
+        if not vector_file.exists():
+            return 0
+        return vector_file.stat().st_size // (self.dim * np.dtype(self.dtype).itemsize)
+
+    def _map(self, rows: int) -> None:
+        """Map the vector file, growing it to hold ``rows`` rows."""
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+        rows = max(rows, MIN_CAPACITY)
+        vector_file: Path = self.path / "vectors.bin"
+        size: int = rows * self.dim * np.dtype(self.dtype).itemsize
+        with open(vector_file, "ab") as handle:
+            if handle.tell() < size:
+                # Sparse extension; pages are only allocated when written
+                handle.truncate(size)
+        self._vectors = np.memmap(
+            vector_file, dtype=self.dtype, mode="r+", shape=(rows, self.dim)
+        )